@@ -0,0 +1,44 @@
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from physicsLab import *
+
+CALLS = 1_000_000
+
+for opened in (1, 10, 50):
+    others = [
+        Experiment(
+            OpenMode.crt, f"__bench_check_not_closed_{i}__", ExperimentType.Circuit, force_crt=True
+        )
+        for i in range(opened - 1)
+    ]
+    with Experiment(
+        OpenMode.crt, "__bench_check_not_closed__", ExperimentType.Circuit, force_crt=True
+    ) as expe:
+        identifier = Logic_Input(0, 0, 0)._identifier
+
+        start = time.perf_counter()
+        for _ in range(CALLS):
+            expe._id2element.get(identifier)
+        baseline = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(CALLS):
+            expe.get_element_from_identifier(identifier)
+        seconds = time.perf_counter() - start
+
+        print(
+            f"{opened} opened experiments: get_element_from_identifier "
+            f"{seconds / CALLS * 1e9:.0f} ns/call (dict.get {baseline / CALLS * 1e9:.0f} ns/call)"
+        )
+        expe.close(delete=True)
+    for other in others:
+        other.close(delete=True)
+
+# -- outputs --
+# 1 opened experiments: get_element_from_identifier 817 ns/call (dict.get 148 ns/call)
+# 10 opened experiments: get_element_from_identifier 827 ns/call (dict.get 149 ns/call)
+# 50 opened experiments: get_element_from_identifier 843 ns/call (dict.get 91 ns/call)
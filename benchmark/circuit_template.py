@@ -0,0 +1,42 @@
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from physicsLab import *
+from physicsLab.lib import Register, CircuitTemplate
+
+count = 2_000
+bitnum = 8
+print(f"{count} x Register(bitnum={bitnum})")
+for use_template in (False, True):
+    with Experiment(
+        OpenMode.crt, "__bench_circuit_template__", ExperimentType.Circuit, force_crt=True
+    ) as expe:
+        start = time.perf_counter()
+        if use_template:
+            with CircuitTemplate() as template:
+                Register(0, 0, 0, bitnum=bitnum, elementXYZ=True)
+            template.place_many(
+                [(i % 100, i // 100 * 2 * bitnum, 0) for i in range(1, count)],
+                elementXYZ=True,
+            )
+        else:
+            for i in range(count):
+                Register(i % 100, i // 100 * 2 * bitnum, 0, bitnum=bitnum, elementXYZ=True)
+        build_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        expe.save(target_path=os.devnull, no_print_info=True)
+        save_seconds = time.perf_counter() - start
+        print(
+            f"template={use_template}: build {build_seconds:.3f}s, first save {save_seconds:.3f}s, "
+            f"{expe.get_elements_count()} elements, {expe.get_wires_count()} wires"
+        )
+        expe.close(delete=True)
+
+# -- outputs --
+# 2000 x Register(bitnum=8)
+# template=False: build 1.439s, first save 0.340s, 16000 elements, 14000 wires
+# template=True: build 0.898s, first save 0.147s, 16000 elements, 14000 wires
@@ -0,0 +1,38 @@
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from physicsLab import *
+
+for count in (10_000, 100_000):
+    positions = [(i % 100, i // 100, 0) for i in range(count)]
+    print(f"{count} x Nand_Gate")
+
+    with Experiment(
+        OpenMode.crt, "__bench_crt_elements__", ExperimentType.Circuit, force_crt=True
+    ) as expe:
+        start = time.perf_counter()
+        for x, y, z in positions:
+            Nand_Gate(x, y, z, elementXYZ=True)
+        seconds = time.perf_counter() - start
+        print(f"Nand_Gate(...): {count / seconds:.0f} elements/s")
+        expe.close(delete=True)
+
+    with Experiment(
+        OpenMode.crt, "__bench_crt_elements__", ExperimentType.Circuit, force_crt=True
+    ) as expe:
+        start = time.perf_counter()
+        expe.crt_elements_bulk(Nand_Gate, positions, elementXYZ=True)
+        seconds = time.perf_counter() - start
+        print(f"crt_elements_bulk: {count / seconds:.0f} elements/s")
+        expe.close(delete=True)
+
+# -- outputs --
+# 10000 x Nand_Gate
+# Nand_Gate(...): 14813 elements/s
+# crt_elements_bulk: 29680 elements/s
+# 100000 x Nand_Gate
+# Nand_Gate(...): 14823 elements/s
+# crt_elements_bulk: 24417 elements/s
@@ -0,0 +1,42 @@
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from physicsLab import *
+
+count = 100_000
+print(f"{count} wires")
+
+with Experiment(
+    OpenMode.crt, "__bench_crt_wires__", ExperimentType.Circuit, force_crt=True
+) as expe:
+    gates = expe.crt_elements_bulk(
+        Nand_Gate, [(i % 100, i // 100, 0) for i in range(count + 1)], elementXYZ=True
+    )
+    pairs = [(gates[i].o, gates[i + 1].i_up) for i in range(count)]
+    quads = [(i + 1, gates[i].o._pin_label, i + 2, gates[i].i_low._pin_label) for i in range(count)]
+
+    start = time.perf_counter()
+    for source_pin, target_pin in pairs:
+        crt_wire(source_pin, target_pin)
+    print(f"crt_wire: {count / (time.perf_counter() - start):.0f} wires/s")
+    expe.clear_wires()
+
+    start = time.perf_counter()
+    crt_wires_bulk(pairs)
+    print(f"crt_wires_bulk(pins): {count / (time.perf_counter() - start):.0f} wires/s")
+    expe.clear_wires()
+
+    start = time.perf_counter()
+    crt_wires_bulk(quads)
+    print(f"crt_wires_bulk(indexes): {count / (time.perf_counter() - start):.0f} wires/s")
+
+    expe.close(delete=True)
+
+# -- outputs --
+# 100000 wires
+# crt_wire: 66460 wires/s
+# crt_wires_bulk(pins): 85540 wires/s
+# crt_wires_bulk(indexes): 72628 wires/s
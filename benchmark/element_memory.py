@@ -0,0 +1,38 @@
+import os
+import sys
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from physicsLab import *
+
+for cls in (Logic_Input, Nand_Gate, Resistor):
+    for count in (10_000, 50_000):
+        with Experiment(
+            OpenMode.crt, "__bench_element_memory__", ExperimentType.Circuit, force_crt=True
+        ) as expe:
+            tracemalloc.start()
+            for i in range(count):
+                cls(i % 100, i // 100, 0, elementXYZ=True)
+            compact = tracemalloc.get_traced_memory()[0]
+
+            # 读取data后元件会保存完整的dict (即紧凑存储之前的情况)
+            for a_element in expe.Elements:
+                a_element.data
+            materialized = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+
+            print(
+                f"{cls.__name__} x {count}: "
+                f"compact {compact / count:.0f} bytes/element, "
+                f"materialized {materialized / count:.0f} bytes/element"
+            )
+            expe.close(delete=True)
+
+# -- outputs --
+# Logic_Input x 10000: compact 1013 bytes/element, materialized 1845 bytes/element
+# Logic_Input x 50000: compact 1117 bytes/element, materialized 1949 bytes/element
+# Nand_Gate x 10000: compact 1342 bytes/element, materialized 2054 bytes/element
+# Nand_Gate x 50000: compact 1445 bytes/element, materialized 2157 bytes/element
+# Resistor x 10000: compact 1101 bytes/element, materialized 2021 bytes/element
+# Resistor x 50000: compact 1205 bytes/element, materialized 2125 bytes/element
@@ -0,0 +1,33 @@
+import os
+import sys
+import time
+import tempfile
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from physicsLab import *
+
+count = 50_000
+output_path = os.path.join(tempfile.gettempdir(), "__bench_export__.pl.py")
+with Experiment(
+    OpenMode.crt, "__bench_export__", ExperimentType.Circuit, force_crt=True
+) as expe:
+    inputs = expe.crt_elements_bulk(Logic_Input, [(i % 200, i // 200, 0) for i in range(count)])
+    outputs = expe.crt_elements_bulk(Logic_Output, [(i % 200, i // 200, 1) for i in range(count)])
+    crt_wires_bulk([(a.o, b.i) for a, b in zip(inputs, outputs)])
+
+    start = time.perf_counter()
+    expe.export(output_path, "__bench_export__")
+    seconds = time.perf_counter() - start
+    print(
+        f"export {expe.get_elements_count()} elements, {expe.get_wires_count()} wires: "
+        f"{seconds:.3f}s, {os.path.getsize(output_path) / 2**20:.1f} MiB"
+    )
+    expe.close(delete=True)
+os.remove(output_path)
+
+# -- outputs --
+# before (res += ..., str(a_wire) looks up pin names through all_pins() per wire):
+# export 100000 elements, 50000 wires: 0.746s, 8.3 MiB
+# after:
+# export 100000 elements, 50000 wires: 0.306s, 8.3 MiB
@@ -0,0 +1,39 @@
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from physicsLab import *
+from physicsLab import _tools
+
+COUNT = 100_000
+
+start = time.perf_counter()
+for _ in range(COUNT):
+    _tools.randString(33)
+print(f"randString: {COUNT / (time.perf_counter() - start):.0f} identifiers/s")
+
+start = time.perf_counter()
+for _ in range(COUNT):
+    _tools.randStrings(1, 33)
+print(f"randStrings(1, 33): {COUNT / (time.perf_counter() - start):.0f} identifiers/s")
+
+start = time.perf_counter()
+_tools.randStrings(COUNT, 33)
+print(f"randStrings({COUNT}, 33): {COUNT / (time.perf_counter() - start):.0f} identifiers/s")
+
+with Experiment(
+    OpenMode.crt, "__bench_identifiers__", ExperimentType.Circuit, force_crt=True
+) as expe:
+    start = time.perf_counter()
+    for i in range(COUNT):
+        Logic_Input(i % 100, i // 100, 0)
+    print(f"Logic_Input: {COUNT / (time.perf_counter() - start):.0f} elements/s")
+    expe.close(delete=True)
+
+# -- outputs --
+# randString: 42910 identifiers/s
+# randStrings(1, 33): 318384 identifiers/s
+# randStrings(100000, 33): 1764859 identifiers/s
+# Logic_Input: 18669 elements/s (12549 elements/s with randString)
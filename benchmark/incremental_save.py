@@ -0,0 +1,48 @@
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from physicsLab import *
+
+SAV_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "incremental_save.sav")
+
+with Experiment(
+    OpenMode.crt, "__bench_incremental_save__", ExperimentType.Circuit, force_crt=True
+) as expe:
+    expe.crt_elements_bulk(Simple_Switch, [(i, 0, 0) for i in range(10)])
+    inputs = expe.crt_elements_bulk(Logic_Input, [(i % 200, i // 200, 1) for i in range(25_000)])
+    outputs = expe.crt_elements_bulk(Logic_Output, [(i % 200, i // 200, 2) for i in range(25_000)])
+    crt_wires_bulk([(a.o, b.i) for a, b in zip(inputs, outputs)])
+    expe.save(target_path=SAV_PATH, no_print_info=True)
+    expe.close(delete=True)
+
+expe = Experiment(OpenMode.load_by_filepath, SAV_PATH)
+for compact in (False, True):
+    start = time.perf_counter()
+    expe.save(target_path=SAV_PATH, no_print_info=True, compact=compact)
+    first_seconds = time.perf_counter() - start
+
+    for a_element in expe.Elements[:10]:
+        a_element.turn_on_switch()
+    start = time.perf_counter()
+    expe.save(target_path=SAV_PATH, no_print_info=True, compact=compact)
+    second_seconds = time.perf_counter() - start
+
+    for a_element in expe.Elements[:10]:
+        a_element.turn_off_switch()
+    print(
+        f"compact={compact}: first save {first_seconds:.3f}s, "
+        f"save after flipping 10 switches {second_seconds:.3f}s"
+    )
+expe.close()
+os.remove(SAV_PATH)
+
+# -- outputs --
+# before (every save encodes all elements):
+# compact=False: first save 0.663s, save after flipping 10 switches 0.978s
+# compact=True: first save 0.435s, save after flipping 10 switches 0.559s
+# after:
+# compact=False: first save 0.779s, save after flipping 10 switches 0.273s
+# compact=True: first save 0.612s, save after flipping 10 switches 0.284s
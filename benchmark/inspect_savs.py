@@ -0,0 +1,48 @@
+import os
+import sys
+import time
+import shutil
+import tempfile
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from physicsLab import *
+
+savs_count = 200
+directory = tempfile.mkdtemp(prefix="__bench_inspect_savs__")
+for i in range(savs_count):
+    with Experiment(
+        OpenMode.crt, "__bench_inspect_savs__", ExperimentType.Circuit, force_crt=True
+    ) as expe:
+        inputs = expe.crt_elements_bulk(Logic_Input, [(j, 0, 0) for j in range(250)])
+        outputs = expe.crt_elements_bulk(Logic_Output, [(j, 1, 0) for j in range(250)])
+        crt_wires_bulk([(a.o, b.i) for a, b in zip(inputs, outputs)])
+        expe.save(target_path=os.path.join(directory, f"{i}.sav"), no_print_info=True)
+        expe.close(delete=True)
+
+print(f"{savs_count} savs, 500 elements and 250 wires each")
+
+start = time.perf_counter()
+counts = {}
+for filename in sorted(os.listdir(directory)):
+    expe = Experiment(OpenMode.load_by_filepath, os.path.join(directory, filename))
+    for a_element in expe.Elements:
+        counts[type(a_element).__name__] = counts.get(type(a_element).__name__, 0) + 1
+    expe.get_wires_count()
+    expe.close()
+seconds = time.perf_counter() - start
+print(f"Experiment: {savs_count / seconds:.1f} savs/s")
+
+start = time.perf_counter()
+savs = list(inspector.iter_savs(directory))
+counts = inspector.count_model_ids(savs)
+wires_count = sum(a_sav.wires_count for a_sav in savs)
+seconds = time.perf_counter() - start
+print(f"inspector: {savs_count / seconds:.1f} savs/s")
+
+shutil.rmtree(directory)
+
+# -- outputs --
+# 200 savs, 500 elements and 250 wires each
+# Experiment: 27.7 savs/s
+# inspector: 224.4 savs/s
@@ -0,0 +1,49 @@
+import os
+import sys
+import time
+import tempfile
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from physicsLab import *
+from physicsLab import _json_codec
+
+count = 100_000
+sav_path = os.path.join(tempfile.gettempdir(), "__bench_json_backend__.sav")
+
+with Experiment(
+    OpenMode.crt, "__bench_json_backend__", ExperimentType.Circuit, force_crt=True
+) as expe:
+    for i in range(count):
+        crt_wire(
+            Logic_Input(i % 100, i // 100, 0, elementXYZ=True).o,
+            Logic_Output(i % 100, i // 100, 1, elementXYZ=True).i,
+        )
+    expe.save(target_path=sav_path, no_print_info=True, compact=True)
+    expe.close(delete=True)
+
+print(f"{count} x 2 elements, {count} wires")
+for backend in (*_json_codec.BACKENDS, None):
+    try:
+        _json_codec.set_backend(backend)
+    except ImportError:
+        print(f"{backend}: not installed")
+        continue
+
+    start = time.perf_counter()
+    expe = Experiment(OpenMode.load_by_filepath, sav_path)
+    load_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    expe.save(no_print_info=True, compact=True)
+    save_seconds = time.perf_counter() - start
+    expe.close()
+    print(f"{backend or 'auto'}: load {load_seconds:.3f}s, save(compact=True) {save_seconds:.3f}s")
+
+os.remove(sav_path)
+
+# -- outputs --
+# 100000 x 2 elements, 100000 wires
+# orjson: load 14.106s, save(compact=True) 3.544s
+# ujson: load 16.867s, save(compact=True) 2.627s
+# json: load 18.908s, save(compact=True) 3.823s
+# auto: load 15.427s, save(compact=True) 2.259s
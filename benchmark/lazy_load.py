@@ -0,0 +1,48 @@
+import os
+import sys
+import time
+import tempfile
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from physicsLab import *
+
+count = 25_000
+sav_path = os.path.join(tempfile.gettempdir(), "__bench_lazy_load__.sav")
+with Experiment(
+    OpenMode.crt, "__bench_lazy_load__", ExperimentType.Circuit, force_crt=True
+) as expe:
+    inputs = expe.crt_elements_bulk(Logic_Input, [(i % 200, i // 200, 0) for i in range(count)])
+    outputs = expe.crt_elements_bulk(Logic_Output, [(i % 200, i // 200, 1) for i in range(count)])
+    crt_wires_bulk([(a.o, b.i) for a, b in zip(inputs, outputs)])
+    identifiers = [a_element._identifier for a_element in expe.Elements[::5000]]
+    expe.save(target_path=sav_path, no_print_info=True)
+    expe.close(delete=True)
+
+print(f"{count} x 2 elements, {count} wires")
+for lazy in (False, True):
+    start = time.perf_counter()
+    expe = Experiment(OpenMode.load_by_filepath, sav_path, lazy=lazy)
+    elements_count = expe.get_elements_count()
+    for identifier in identifiers:
+        expe.get_element_from_identifier(identifier)
+    lookup_seconds = time.perf_counter() - start
+
+    classes = {}
+    for a_element in expe.Elements:
+        classes[type(a_element)] = classes.get(type(a_element), 0) + 1
+    iterate_seconds = time.perf_counter() - start
+
+    expe.get_wires_count()
+    wires_seconds = time.perf_counter() - start
+    expe.close()
+    print(
+        f"lazy={lazy}: count + {len(identifiers)} lookups {lookup_seconds:.3f}s, "
+        f"+ iterate elements {iterate_seconds:.3f}s, + wires {wires_seconds:.3f}s"
+    )
+os.remove(sav_path)
+
+# -- outputs --
+# 25000 x 2 elements, 25000 wires
+# lazy=False: count + 10 lookups 3.059s, + iterate elements 3.072s, + wires 3.072s
+# lazy=True: count + 10 lookups 0.272s, + iterate elements 2.445s, + wires 3.341s
@@ -0,0 +1,43 @@
+import os
+import sys
+import tempfile
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from test_tool import Timer
+from physicsLab import *
+
+for count in (1_000, 10_000, 100_000):
+    sav_path = os.path.join(tempfile.gettempdir(), f"__bench_load_sav_{count}__.sav")
+    with Experiment(
+        OpenMode.crt, "__bench_load_sav__", ExperimentType.Circuit, force_crt=True
+    ) as expe:
+        for i in range(count):
+            crt_wire(
+                Logic_Input(i % 100, i // 100, 0, elementXYZ=True).o,
+                Logic_Output(i % 100, i // 100, 1, elementXYZ=True).i,
+            )
+        expe.save(target_path=sav_path, no_print_info=True)
+        expe.close(delete=True)
+
+    print(f"{count} x 2 elements, {count} wires")
+    with Timer():
+        expe = Experiment(OpenMode.load_by_filepath, sav_path)
+    expe.close()
+    os.remove(sav_path)
+
+# -- outputs (eval-based loader) --
+# 1000 x 2 elements, 1000 wires
+# time: 0.3803129196166992
+# 10000 x 2 elements, 10000 wires
+# time: 3.9922361373901367
+# 100000 x 2 elements, 100000 wires
+# time: 42.846019983291626
+
+# -- outputs --
+# 1000 x 2 elements, 1000 wires
+# time: 0.1611497402191162
+# 10000 x 2 elements, 10000 wires
+# time: 1.5602736473083496
+# 100000 x 2 elements, 100000 wires
+# time: 16.44649338722229
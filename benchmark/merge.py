@@ -0,0 +1,38 @@
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from physicsLab import *
+
+count = 10_000
+with Experiment(
+    OpenMode.crt, "__bench_merge_src__", ExperimentType.Circuit, force_crt=True
+) as src:
+    inputs = src.crt_elements_bulk(Logic_Input, [(i % 100, i // 100, 0) for i in range(count)])
+    outputs = src.crt_elements_bulk(Logic_Output, [(i % 100, i // 100, 1) for i in range(count)])
+    crt_wires_bulk([(a.o, b.i) for a, b in zip(inputs, outputs)])
+
+    print(f"merge {count} x 2 elements, {count} wires")
+    for repeat in (1, 4):
+        with Experiment(
+            OpenMode.crt, "__bench_merge_dst__", ExperimentType.Circuit, force_crt=True
+        ) as dst:
+            start = time.perf_counter()
+            dst.merge(src, 0, 0, 2, elementXYZ=False, repeat=repeat, spacing=(0, 100, 0))
+            seconds = time.perf_counter() - start
+            print(
+                f"repeat={repeat}: {seconds:.3f}s, "
+                f"{dst.get_elements_count()} elements, {dst.get_wires_count()} wires"
+            )
+            dst.close(delete=True)
+    src.close(delete=True)
+
+# -- outputs --
+# merge 10000 x 2 elements, 10000 wires
+# before (deepcopy each element and wire, repeat not supported):
+# repeat=1: 2.502s, 20000 elements, 10000 wires
+# after:
+# repeat=1: 0.685s, 20000 elements, 10000 wires
+# repeat=4: 3.348s, 80000 elements, 40000 wires
@@ -0,0 +1,43 @@
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from physicsLab import *
+from physicsLab.circuit.phy_engine import PhyEngineCircuit
+
+# 需要Phy-Engine的动态库, 详见docs/phy_engine.md
+count = 200
+analyses = 2_000
+with Experiment(
+    OpenMode.crt, "__bench_phy_engine__", ExperimentType.Circuit, force_crt=True
+) as expe:
+    source = Battery_Source(0, 0, 0)
+    resistors = expe.crt_elements_bulk(Resistor, [(i % 20, i // 20, 0) for i in range(count)])
+    crt_wires_bulk(
+        [(source.red, resistors[0].red), (resistors[-1].black, source.black)]
+        + [(a.black, b.red) for a, b in zip(resistors, resistors[1:])]
+    )
+
+    with PhyEngineCircuit(expe) as circuit:
+        start = time.perf_counter()
+        for _ in range(analyses):
+            circuit.analyze(analyze_type="DC")
+        print(f"analyze x{analyses}, {count + 1} elements: {time.perf_counter() - start:.3f}s")
+
+        start = time.perf_counter()
+        for i in range(analyses):
+            circuit.analyze_with_changes([(source, 0, 1 + i % 10)], analyze_type="DC")
+        print(f"analyze_with_changes x{analyses}, {count + 1} elements: {time.perf_counter() - start:.3f}s")
+    expe.close(delete=True)
+
+# -- outputs --
+# measured with a stand-in library of the same C ABI whose analysis is a no-op,
+# so only the python-side overhead per call is compared
+# before (pins counted and 6 ctypes arrays allocated on every call):
+# analyze x2000, 201 elements: 2.243s
+# analyze_with_changes x2000, 201 elements: 1.844s
+# after:
+# analyze x2000, 201 elements: 0.510s
+# analyze_with_changes x2000, 201 elements: 0.408s
@@ -0,0 +1,51 @@
+import os
+import sys
+import time
+import tempfile
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from physicsLab import *
+
+sav_path = os.path.join(tempfile.gettempdir(), "__bench_save_sav__.sav")
+
+for count in (1_000, 10_000, 100_000):
+    with Experiment(
+        OpenMode.crt, "__bench_save_sav__", ExperimentType.Circuit, force_crt=True
+    ) as expe:
+        for i in range(count):
+            crt_wire(
+                Logic_Input(i % 100, i // 100, 0, elementXYZ=True).o,
+                Logic_Output(i % 100, i // 100, 1, elementXYZ=True).i,
+            )
+
+        print(f"{count} x 2 elements, {count} wires")
+        for compact in (False, True):
+            start = time.perf_counter()
+            expe.save(target_path=sav_path, no_print_info=True, compact=compact)
+            seconds = time.perf_counter() - start
+            size = os.path.getsize(sav_path)
+
+            tracemalloc.start()
+            expe.save(target_path=sav_path, no_print_info=True, compact=compact)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(
+                f"compact={compact}: {seconds:.3f}s, {size / 2**20:.2f} MiB, "
+                f"{size / 2**20 / seconds:.2f} MiB/s, peak memory {peak / 2**20:.2f} MiB"
+            )
+        expe.close(delete=True)
+
+os.remove(sav_path)
+
+# -- outputs --
+# 1000 x 2 elements, 1000 wires
+# compact=False: 0.040s, 1.07 MiB, 26.83 MiB/s, peak memory 3.88 MiB
+# compact=True: 0.035s, 1.03 MiB, 29.69 MiB/s, peak memory 3.24 MiB
+# 10000 x 2 elements, 10000 wires
+# compact=False: 0.363s, 10.70 MiB, 29.48 MiB/s, peak memory 30.79 MiB
+# compact=True: 0.301s, 10.28 MiB, 34.20 MiB/s, peak memory 5.75 MiB
+# 100000 x 2 elements, 100000 wires
+# compact=False: 3.723s, 107.17 MiB, 28.79 MiB/s, peak memory 308.17 MiB
+# compact=True: 3.440s, 102.97 MiB, 29.93 MiB/s, peak memory 30.64 MiB
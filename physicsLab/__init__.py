@@ -35,6 +35,8 @@ from physicsLab.utils import *
 from physicsLab import web
 from physicsLab import lib
 from physicsLab import music
+from physicsLab import inspector
+from physicsLab import batch
 
 import os
 import platform
@@ -14,12 +14,16 @@ import time
 import gzip
 import requests
 import platform
+import threading
+import contextvars
 
 from physicsLab import plAR
 from physicsLab import _tools
 from physicsLab import _warn
 from physicsLab import errors
 from physicsLab import _colorUtils
+from physicsLab import _sav_writer
+from ._spatial import SpatialGrid
 from .web.api import User, _check_response
 from .enums import Category, Tag, ExperimentType, OpenMode
 from ._typing import (
@@ -32,57 +36,192 @@ from ._typing import (
     Tuple,
     final,
     NoReturn,
+    Any,
+    Iterable,
+    TYPE_CHECKING,
 )
 
+if TYPE_CHECKING:
+    from .circuit._circuit_core import Wire
+
 
 class _ExperimentStack:
+    # 所有已打开的实验 (不区分线程), 按打开的顺序排列
     data: List["_Experiment"] = []
+    # 已打开的实验的SAV_PATH -> 以该路径打开的实验的数量, 使inside的开销为O(1)
+    _sav_paths: Dict[str, int] = {}
+    _lock = threading.Lock()
+    # 当前线程 (或asyncio task) 中打开的实验, 栈顶即为get_current_experiment()
+    # 使用tuple而不是list, 使从同一个上下文复制出来的task不会共享对栈的修改
+    _context_stack: contextvars.ContextVar[Tuple["_Experiment", ...]] = (
+        contextvars.ContextVar("physicsLab_experiment_stack", default=())
+    )
 
     def __new__(cls):
         return cls
 
     @classmethod
     def inside(cls, item: "_Experiment") -> bool:
+        """是否已经打开了与item的SAV_PATH相同的实验"""
         errors.assert_true(isinstance(item, _Experiment))
 
-        for a_expe in cls.data:
-            if a_expe.SAV_PATH == item.SAV_PATH:
-                return True
-        return False
+        return item.SAV_PATH in cls._sav_paths
 
     @classmethod
     def remove(cls, data: "_Experiment") -> None:
         errors.assert_true(isinstance(data, _Experiment))
 
-        cls.data.remove(data)
+        with cls._lock:
+            cls.data.remove(data)
+            data._is_open = False
+            count = cls._sav_paths[data.SAV_PATH]
+            if count == 1:
+                del cls._sav_paths[data.SAV_PATH]
+            else:
+                cls._sav_paths[data.SAV_PATH] = count - 1
+
+        # 在其他上下文中被关闭的实验会在那些上下文的top中被跳过
+        stack = cls._context_stack.get()
+        if data in stack:
+            cls._context_stack.set(
+                tuple(a_expe for a_expe in stack if a_expe is not data)
+            )
 
     @classmethod
     def clear(cls) -> None:
-        cls.data.clear()
+        with cls._lock:
+            for a_expe in cls.data:
+                a_expe._is_open = False
+            cls.data.clear()
+            cls._sav_paths.clear()
+        cls._context_stack.set(())
 
     @classmethod
     def push(cls, data: "_Experiment") -> None:
         errors.assert_true(isinstance(data, _Experiment))
 
-        cls.data.append(data)
+        with cls._lock:
+            cls.data.append(data)
+            data._is_open = True
+            cls._sav_paths[data.SAV_PATH] = cls._sav_paths.get(data.SAV_PATH, 0) + 1
+        # 顺便移除在其他上下文中已被关闭的实验
+        stack = tuple(a_expe for a_expe in cls._context_stack.get() if a_expe._is_open)
+        cls._context_stack.set(stack + (data,))
 
     @classmethod
     def top(cls) -> "_Experiment":
-        if len(cls.data) == 0:
-            raise errors.ExperimentError("no experiment can be operated")
+        """当前上下文中最后打开且尚未关闭的实验"""
+        for a_expe in reversed(cls._context_stack.get()):
+            if a_expe._is_open:
+                return a_expe
+
+        raise errors.ExperimentError("no experiment can be operated")
+
+
+class _ElementList(list):
+    """记录了每个元件的index的list, 使`index`与`in`的开销为O(1)
+    删除元件后, 其后的元件的index会在下次查询时才被重新计算
+    """
 
-        return cls.data[-1]
+    def __init__(self, iterable=()) -> None:
+        super().__init__(iterable)
+        self._reindex()
+
+    def _reindex(self) -> None:
+        self._element2index: Dict["ElementBase", int] = {}
+        # index小于_dirty_from的记录一定是正确的
+        self._dirty_from: int = 0
+        self._renumber()
+
+    def _renumber(self) -> None:
+        for i in range(self._dirty_from, len(self)):
+            self._element2index[list.__getitem__(self, i)] = i
+        self._dirty_from = len(self)
+
+    def __contains__(self, element) -> bool:
+        return element in self._element2index
+
+    def index(self, element, *args) -> int:
+        if len(args) != 0:
+            return super().index(element, *args)
+
+        res = self._element2index.get(element)
+        if res is None:
+            raise ValueError("element is not in list")
+        if res >= self._dirty_from:
+            self._renumber()
+            res = self._element2index[element]
+        return res
+
+    def append(self, element) -> None:
+        super().append(element)
+        self._element2index[element] = len(self) - 1
+        if self._dirty_from == len(self) - 1:
+            self._dirty_from = len(self)
+
+    def extend(self, iterable) -> None:
+        start = len(self)
+        super().extend(iterable)
+        for i in range(start, len(self)):
+            self._element2index[list.__getitem__(self, i)] = i
+        if self._dirty_from == start:
+            self._dirty_from = len(self)
+
+    def __iadd__(self, iterable) -> Self:
+        self.extend(iterable)
+        return self
+
+    def remove(self, element) -> None:
+        self.pop(self.index(element))
+
+    def pop(self, index: int = -1):
+        if index < 0:
+            index += len(self)
+        element = super().pop(index)
+        del self._element2index[element]
+        self._dirty_from = min(self._dirty_from, index)
+        return element
+
+    def clear(self) -> None:
+        super().clear()
+        self._reindex()
+
+    def insert(self, index, element) -> None:
+        super().insert(index, element)
+        self._reindex()
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        self._reindex()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._reindex()
+
+    def __setitem__(self, key, value) -> None:
+        super().__setitem__(key, value)
+        self._reindex()
+
+    def __delitem__(self, key) -> None:
+        super().__delitem__(key)
+        self._reindex()
+
+    def __imul__(self, value) -> Self:
+        super().__imul__(value)
+        self._reindex()
+        return self
 
 
 def get_current_experiment() -> "_Experiment":
-    """获取当前正在操作的存档"""
+    """获取当前正在操作的存档
+    每个线程 (或asyncio task) 有各自的当前存档, 即在该线程中最后打开且尚未关闭的存档
+    """
     return _ExperimentStack.top()
 
 
 def _check_not_closed(method: Callable) -> Callable:
     def res(self: "_Experiment", *args, **kwargs):
-        errors.assert_true(isinstance(self, _Experiment))
-        if not _ExperimentStack.inside(self):  # 存档已被关闭
+        if not self._is_open:  # 存档已被关闭
             raise errors.ExperimentClosedError
 
         return method(self, *args, **kwargs)
@@ -103,6 +242,8 @@ class _Experiment:
 
     open_mode: OpenMode
     _position2elements: Dict[Tuple[num_type, num_type, num_type], List["ElementBase"]]
+    # 元件当前所在的坐标, 为_position2elements的反向索引
+    _element2position: Dict["ElementBase", Tuple[num_type, num_type, num_type]]
     _id2element: Dict[str, "ElementBase"]
     Elements: List["ElementBase"]
     SAV_PATH: str
@@ -110,8 +251,14 @@ class _Experiment:
     CameraSave: dict
     VisionCenter: _tools.position
     TargetRotation: _tools.position
+    # 导线的邻接索引: 元件的Identifier -> 引脚的label -> 连接在该引脚上的导线 (仅电学实验)
+    _wires_index: Dict[str, Dict[int, set]]
     # Only for compaatibility
     experiment_type: ExperimentType
+    # 该实验是否在_ExperimentStack中 (未被关闭), 由_ExperimentStack维护
+    _is_open: bool = False
+    # 元件坐标的空间索引, 在第一次进行区域查询时才建立, 此后随_position2elements一起更新
+    _spatial_grid: Optional[SpatialGrid] = None
 
     def __init__(
         self,
@@ -172,8 +319,15 @@ class _Experiment:
 
         self.open_mode = open_mode
         self._position2elements = _position2elements
+        self._element2position = {
+            a_element: position
+            for position, elements in _position2elements.items()
+            for a_element in elements
+        }
         self._id2element = _id2element
-        self.Elements = Elements
+        self.Elements = (
+            Elements if isinstance(Elements, _ElementList) else _ElementList(Elements)
+        )
         self.SAV_PATH = SAV_PATH
         self.PlSav = PlSav
         self.CameraSave = CameraSave
@@ -224,8 +378,11 @@ class _Experiment:
         """清空该实验的所有元件"""
         if self.experiment_type == ExperimentType.Circuit:
             self.Wires.clear()
+            self._wires_index.clear()
         self.Elements.clear()
         self._position2elements.clear()
+        self._element2position.clear()
+        self._spatial_grid = None
         self._id2element.clear()
         return self
 
@@ -245,32 +402,14 @@ class _Experiment:
         if element not in self.Elements:
             raise errors.ElementNotFound
 
-        identifier = element.data["Identifier"]
+        identifier = element._identifier
 
         if self.experiment_type == ExperimentType.Circuit:
-            rest_wires = set()
-            for a_wire in self.Wires:
-                if (
-                    a_wire.Source.element_self.data["Identifier"] == identifier
-                    or a_wire.Target.element_self.data["Identifier"] == identifier
-                ):
-                    continue
-
-                rest_wires.add(a_wire)
-            self.Wires = rest_wires
-
-        for position, elements in self._position2elements.items():
-            can_break: bool = False
-            if element in elements:
-                elements.remove(element)
-                can_break = True
-            if len(elements) == 0:
-                del self._position2elements[position]
-
-            if can_break:
-                break
-        else:
-            errors.unreachable()
+            for a_wire in self.wires_of(element):
+                self._unlink_wire(a_wire)
+
+        errors.assert_true(element in self._element2position)
+        self._remove_element_position(element)
 
         errors.assert_true(identifier in self._id2element.keys())
         del self._id2element[identifier]
@@ -280,6 +419,65 @@ class _Experiment:
 
         return self
 
+    def _register_elements(self, elements: List["ElementBase"]) -> None:
+        """将已设置好Identifier与坐标的元件加入实验, 并一次性更新各个索引"""
+        self.Elements.extend(elements)
+        for element in elements:
+            self._id2element[element._identifier] = element
+            position = element._position
+            if position in self._position2elements:
+                self._position2elements[position].append(element)
+            else:
+                self._position2elements[position] = [element]
+            self._element2position[element] = position
+        if self._spatial_grid is not None:
+            for element in elements:
+                self._spatial_grid.insert(element, element._position)
+
+    def _new_identifiers(self, count: int) -> List[str]:
+        """生成count个与已有元件及彼此都不重复的Identifier"""
+        identifiers = _tools.randStrings(count, 33)
+        # 与已有元件或同一批中的Identifier重复的概率极低, 但仍需避免
+        if len(set(identifiers)) != len(identifiers) or any(
+            identifier in self._id2element for identifier in identifiers
+        ):
+            used = set(self._id2element)
+            for i, identifier in enumerate(identifiers):
+                while identifier in used:
+                    identifier = _tools.randStrings(1, 33)[0]
+                identifiers[i] = identifier
+                used.add(identifier)
+        return identifiers
+
+    def _move_element(
+        self,
+        element: "ElementBase",
+        position: Tuple[num_type, num_type, num_type],
+    ) -> None:
+        """将元件在坐标索引中移动到position"""
+        self._remove_element_position(element)
+
+        if position in self._position2elements:
+            self._position2elements[position].append(element)
+        else:
+            self._position2elements[position] = [element]
+        self._element2position[element] = position
+        if self._spatial_grid is not None:
+            self._spatial_grid.insert(element, position)
+
+    def _remove_element_position(self, element: "ElementBase") -> None:
+        """将元件从坐标索引中移除, 若元件不在索引中则什么也不做"""
+        old_position = self._element2position.pop(element, None)
+        if old_position is None:
+            return
+        if self._spatial_grid is not None:
+            self._spatial_grid.remove(element)
+
+        elements = self._position2elements[old_position]
+        elements.remove(element)
+        if len(elements) == 0:
+            del self._position2elements[old_position]
+
     @_check_not_closed
     def get_element_from_position(
         self,
@@ -301,6 +499,106 @@ class _Experiment:
 
         return self._position2elements[position]
 
+    def _get_spatial_grid(self) -> SpatialGrid:
+        grid = self._spatial_grid
+        if grid is None or grid.is_overloaded():
+            grid = self._spatial_grid = SpatialGrid.build(self._element2position)
+        return grid
+
+    def _element_order(self, element: "ElementBase") -> int:
+        return self.Elements.index(element)
+
+    @_check_not_closed
+    def query_box(
+        self,
+        x1: num_type,
+        y1: num_type,
+        z1: num_type,
+        x2: num_type,
+        y2: num_type,
+        z2: num_type,
+    ) -> List["ElementBase"]:
+        """获取坐标在(x1, y1, z1)与(x2, y2, z2)围成的长方体内 (含边界) 的元件, 按index排序"""
+        for name, value in (
+            ("x1", x1),
+            ("y1", y1),
+            ("z1", z1),
+            ("x2", x2),
+            ("y2", y2),
+            ("z2", z2),
+        ):
+            if not isinstance(value, (int, float)):
+                raise TypeError(
+                    f"Parameter {name} must be of type `int | float`, but got value {value} of type `{type(value).__name__}`"
+                )
+
+        res = self._get_spatial_grid().query_box(
+            (min(x1, x2), min(y1, y2), min(z1, z2)),
+            (max(x1, x2), max(y1, y2), max(z1, z2)),
+        )
+        res.sort(key=self._element_order)
+        return res
+
+    @_check_not_closed
+    def query_radius(
+        self, x: num_type, y: num_type, z: num_type, radius: num_type
+    ) -> List["ElementBase"]:
+        """获取与(x, y, z)的距离不超过radius的元件, 按index排序"""
+        for name, value in (("x", x), ("y", y), ("z", z), ("radius", radius)):
+            if not isinstance(value, (int, float)):
+                raise TypeError(
+                    f"Parameter {name} must be of type `int | float`, but got value {value} of type `{type(value).__name__}`"
+                )
+        if radius < 0:
+            raise ValueError("Parameter radius must be non-negative")
+
+        res = self._get_spatial_grid().query_radius((x, y, z), radius)
+        res.sort(key=self._element_order)
+        return res
+
+    @_check_not_closed
+    def nearest(
+        self, x: num_type, y: num_type, z: num_type, count: int = 1
+    ) -> List["ElementBase"]:
+        """获取距离(x, y, z)最近的count个元件, 按距离排序 (距离相同时按index排序)"""
+        for name, value in (("x", x), ("y", y), ("z", z)):
+            if not isinstance(value, (int, float)):
+                raise TypeError(
+                    f"Parameter {name} must be of type `int | float`, but got value {value} of type `{type(value).__name__}`"
+                )
+        if not isinstance(count, int):
+            raise TypeError(
+                f"Parameter count must be of type `int`, but got value {count} of type `{type(count).__name__}`"
+            )
+        if count < 0:
+            raise ValueError("Parameter count must be non-negative")
+
+        return [
+            a_element
+            for _, a_element in self._get_spatial_grid().nearest(
+                (x, y, z), count, self._element_order
+            )
+        ]
+
+    @_check_not_closed
+    def find_overlaps(self, tolerance: num_type = 0) -> List[List["ElementBase"]]:
+        """检测重叠的元件
+
+        Args:
+            tolerance: 坐标的距离不超过tolerance的元件被视为重叠
+
+        Returns:
+            互相重叠的元件组成的组 (每组至少含2个元件), 组内与组间均按index排序
+        """
+        if not isinstance(tolerance, (int, float)):
+            raise TypeError(
+                f"Parameter tolerance must be of type `int | float`, but got value {tolerance} of type `{type(tolerance).__name__}`"
+            )
+        if tolerance < 0:
+            raise ValueError("Parameter tolerance must be non-negative")
+
+        return self._get_spatial_grid().overlaps(tolerance, self._element_order)
+
     @_check_not_closed
     def get_element_from_index(self, index: int) -> "ElementBase":
         """通过index (元件生成顺序) 索引元件, index从1开始"""
@@ -327,8 +625,79 @@ class _Experiment:
             raise errors.ExperimentTypeError
 
         self.Wires.clear()
+        self._wires_index.clear()
         return self
 
+    def _link_wire(self, wire: "Wire") -> None:
+        """将导线加入该实验, 并同步更新导线的邻接索引
+        重复的导线会被忽略
+        """
+        if wire in self.Wires:
+            return
+
+        self.Wires.add(wire)
+        for a_pin in (wire.Source, wire.Target):
+            self._wires_index.setdefault(
+                a_pin.element_self._identifier, {}
+            ).setdefault(a_pin._pin_label, set()).add(wire)
+
+    def _link_wires(self, wires: List["Wire"]) -> List["Wire"]:
+        """与逐个调用_link_wire一致, 返回新加入该实验的导线"""
+        res: List["Wire"] = []
+        for wire in wires:
+            # 通过长度的变化判断是否为重复的导线, 省去一次哈希
+            wires_count = len(self.Wires)
+            self.Wires.add(wire)
+            if len(self.Wires) == wires_count:
+                continue
+
+            res.append(wire)
+            for a_pin in (wire.Source, wire.Target):
+                self._wires_index.setdefault(
+                    a_pin.element_self._identifier, {}
+                ).setdefault(a_pin._pin_label, set()).add(wire)
+        return res
+
+    def _unlink_wire(self, wire: "Wire") -> None:
+        """从该实验中删除导线, 并同步更新导线的邻接索引
+        若导线不存在则抛出KeyError
+        """
+        self.Wires.remove(wire)
+        for a_pin in (wire.Source, wire.Target):
+            identifier = a_pin.element_self._identifier
+            pin2wires = self._wires_index.get(identifier)
+            if pin2wires is None:
+                continue
+            wires = pin2wires.get(a_pin._pin_label)
+            if wires is None:
+                continue
+            wires.discard(wire)
+            if len(wires) == 0:
+                del pin2wires[a_pin._pin_label]
+            if len(pin2wires) == 0:
+                del self._wires_index[identifier]
+
+    @_check_not_closed
+    def wires_of(self, element: "ElementBase") -> List["Wire"]:
+        """获取连接在该元件上的所有导线 (仅电学实验)
+
+        Args:
+            element: 该实验中的电学元件
+        """
+        if not isinstance(element, ElementBase):
+            raise TypeError(
+                f"Parameter element must be of type `ElementBase`, but got value {element} of type `{type(element).__name__}`"
+            )
+        if self.experiment_type != ExperimentType.Circuit:
+            raise errors.ExperimentTypeError
+        if element.experiment is not self:
+            raise errors.ExperimentError("element is not in this experiment")
+
+        res: set = set()
+        for wires in self._wires_index.get(element._identifier, {}).values():
+            res.update(wires)
+        return list(res)
+
     @_check_not_closed
     def get_wires_count(self) -> int:
         """获取当前导线数"""
@@ -337,11 +706,16 @@ class _Experiment:
 
         return len(self.Wires)
 
-    def __write(self) -> None:
+    def __status_save(self) -> dict:
+        """生成StatusSave对应的dict, 并更新存档中的其他信息
+        电学实验与电与磁实验的元件在写入时才被编码
+        """
+        elements = _sav_writer.LazyElements(self.Elements)
+
         if self.experiment_type == ExperimentType.Circuit:
             status_save: dict = {
                 "SimulationSpeed": 1.0,
-                "Elements": [a_element.data for a_element in self.Elements],
+                "Elements": elements,
                 "Wires": [a_wire.release() for a_wire in self.Wires],
             }
         elif self.experiment_type == ExperimentType.Celestial:
@@ -362,7 +736,7 @@ class _Experiment:
         elif self.experiment_type == ExperimentType.Electromagnetism:
             status_save: dict = {
                 "SimulationSpeed": 1.0,
-                "Elements": [a_element.data for a_element in self.Elements],
+                "Elements": elements,
             }
         else:
             errors.unreachable()
@@ -378,8 +752,11 @@ class _Experiment:
         )
         self.PlSav["Experiment"]["CameraSave"] = json.dumps(self.CameraSave)
 
-        self.PlSav["Experiment"]["StatusSave"] = json.dumps(
-            status_save, ensure_ascii=True, separators=(",", ": ")
+        return status_save
+
+    def __write(self) -> None:
+        self.PlSav["Experiment"]["StatusSave"] = _sav_writer.dumps_status_save(
+            self.__status_save()
         )
 
     @_check_not_closed
@@ -387,15 +764,20 @@ class _Experiment:
         self,
         target_path: Optional[str] = None,
         no_print_info: bool = False,
+        compact: bool = False,
     ) -> Self:
         """以物实存档的格式导出实验
 
         Args:
             target_path: 将存档保存在此路径 (要求必须是文件的路径), 默认为 SAV_PATH
             no_print_info: 是否打印写入存档的元件数, 导线数(如果是电学实验的话)
+            compact: 是否以紧凑的格式 (无缩进) 流式写入存档, 适用于大型实验
+                此时不会更新 PlSav["Experiment"]["StatusSave"]
         """
-        if not isinstance(target_path, (str, type(None))) or not isinstance(
-            no_print_info, bool
+        if (
+            not isinstance(target_path, (str, type(None)))
+            or not isinstance(no_print_info, bool)
+            or not isinstance(compact, bool)
         ):
             raise TypeError()
 
@@ -404,20 +786,23 @@ class _Experiment:
         else:
             target_path = os.path.abspath(target_path)
 
-        self.__write()
-
         try:
-            context: str = json.dumps(
-                self.PlSav, indent=2, ensure_ascii=False, separators=(",", ":")
-            )
+            if compact:
+                status_save = self.__status_save()
+                with _sav_writer.atomic_write(target_path) as f:
+                    _sav_writer.dump_sav(f, self.PlSav, status_save)
+            else:
+                self.__write()
+                context: str = json.dumps(
+                    self.PlSav, indent=2, ensure_ascii=False, separators=(",", ":")
+                )
+                with _sav_writer.atomic_write(target_path) as f:
+                    f.write(context)
         except TypeError as e:
             # 通常由序列化出现 <Generate>导致
             print("TypeError: ", e, file=sys.stderr)
             errors.unreachable()
 
-        with open(target_path, "w", encoding="utf-8") as f:
-            f.write(context)
-
         if not no_print_info:
             _colorUtils.cprint(
                 _colorUtils.Green("Successfully save experiment "), end=""
@@ -777,20 +1162,216 @@ class _Experiment:
     @_check_not_closed
     def export(self, output_path: str = "temp.pl.py", sav_name: str = "temp") -> Self:
         """以physicsLab代码的形式导出实验"""
-        res: str = (
-            f"from physicsLab import *\n\n"
-            f"expe = Experiment(OpenMode.crt, '{sav_name}', {self.experiment_type}, force_crt=True)\n"
-        )
+        with open(output_path, "w", encoding="utf-8") as f:
+            f.write(
+                f"from physicsLab import *\n\n"
+                f"expe = Experiment(OpenMode.crt, '{sav_name}', {self.experiment_type}, force_crt=True)\n"
+            )
+            f.writelines(self._iter_export_lines())
+            f.write("expe.save()\nexpe.close()\n")
+
+        return self
 
-        for a_element in self.Elements:
-            res += f"e{a_element.get_index()} = {str(a_element)}\n"
+    def _iter_export_lines(self) -> Iterable[str]:
+        """逐行生成export导出的元件与导线, 与调用`str(a_element)`及`str(a_wire)`的结果一致"""
+        # 元件 -> 元件的index, 元件的变量名为 e{index}
+        element2index: Dict["ElementBase", int] = {}
+        for index, a_element in enumerate(self.Elements, 1):
+            element2index[a_element] = index
+            yield f"e{index} = {a_element!r}\n"
+
+        if self.experiment_type != ExperimentType.Circuit:
+            return
+
+        def pin_str(a_pin) -> str:
+            a_element = a_pin.element_self
+            return f"e{element2index[a_element]}.{a_element.pin_names()[a_pin._pin_label]}"
+
+        # 导线颜色 -> 其导出的字符串, 省去每根导线对枚举的格式化
+        color_strs: dict = {}
         for a_wire in self.Wires:
-            res += str(a_wire) + "\n"
-        res += "expe.save()\nexpe.close()\n"
+            color_str = color_strs.get(a_wire.color)
+            if color_str is None:
+                color_str = color_strs[a_wire.color] = f"{a_wire.color}"
+            yield (
+                f"crt_wire({pin_str(a_wire.Source)}, {pin_str(a_wire.Target)}, "
+                f"color={color_str})\n"
+            )
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(res)
+    def _positions_in(
+        self, elements: List["ElementBase"], elementXYZ: bool
+    ) -> List[Tuple[num_type, num_type, num_type]]:
+        """获取元件在指定坐标系下的坐标 (elementXYZ仅对电学实验有效)"""
+        if self.experiment_type != ExperimentType.Circuit:
+            return [a_element._position for a_element in elements]
+
+        origin = self._elementXYZ_origin_position
+        res: List[Tuple[num_type, num_type, num_type]] = []
+        for a_element in elements:
+            position = a_element._position
+            if elementXYZ and not a_element.is_elementXYZ:
+                position = native_to_elementXYZ(
+                    *position, origin, a_element.is_bigElement
+                )
+            elif not elementXYZ and a_element.is_elementXYZ:
+                position = elementXYZ_to_native(
+                    *position, origin, a_element.is_bigElement
+                )
+            res.append(position)
+        return res
+
+    def _place_elements(
+        self,
+        elements: List["ElementBase"],
+        positions: List[Tuple[num_type, num_type, num_type]],
+        elementXYZ: Optional[bool],
+    ) -> None:
+        """设置元件的坐标, 但不更新坐标索引
+        仅用于尚未加入实验的元件, 或之后会自行更新坐标索引的情况
+        """
+        if self.experiment_type != ExperimentType.Circuit:
+            for a_element, (x, y, z) in zip(elements, positions):
+                x, y, z = _tools.round_data(x), _tools.round_data(y), _tools.round_data(z)
+                a_element._position = _tools.position(x, y, z)
+                a_element._set_data_field("Position", f"{x},{z},{y}")
+            return
+
+        is_elementXYZ: bool = (
+            elementXYZ is True or self.is_elementXYZ is True and elementXYZ is None
+        )
+        origin = self._elementXYZ_origin_position
+        for a_element, (x, y, z) in zip(elements, positions):
+            # 坐标的类型已被检查过, 直接使用与_tools.round_data一致的round
+            x, y, z = round(x, 6), round(y, 6), round(z, 6)
+            a_element._position = _tools.position(x, y, z)
+            a_element.is_elementXYZ = is_elementXYZ
+            if is_elementXYZ:
+                x, y, z = elementXYZ_to_native(
+                    x, y, z, origin, a_element.is_bigElement
+                )
+            a_element._set_native_position(x, y, z)
+
+    def _set_positions(
+        self,
+        elements: List["ElementBase"],
+        positions: List[Tuple[num_type, num_type, num_type]],
+        elementXYZ: Optional[bool],
+    ) -> None:
+        """与逐个调用 a_element.set_position(x, y, z, elementXYZ) 的结果一致,
+        但不再检查参数的类型, 坐标系的判断也对所有元件只进行一次
+        """
+        if self.experiment_type != ExperimentType.Circuit:
+            for a_element, (x, y, z) in zip(elements, positions):
+                a_element.set_position(x, y, z)
+            return
+
+        self._place_elements(elements, positions, elementXYZ)
+        for a_element in elements:
+            self._move_element(a_element, a_element._position)
+
+    def _elements_in(
+        self, elements: Optional[Iterable["ElementBase"]]
+    ) -> List["ElementBase"]:
+        """检查elements中的元件都属于该实验, 为None时为该实验的所有元件"""
+        if elements is None:
+            return list(self.Elements)
+
+        res = list(elements)
+        for a_element in res:
+            if not isinstance(a_element, ElementBase):
+                raise TypeError(
+                    f"Parameter elements must be an iterable of `ElementBase`, but got value {a_element} of type `{type(a_element).__name__}`"
+                )
+            if a_element.experiment is not self:
+                raise errors.ExperimentError("element is not in this experiment")
+        return res
+
+    @_check_not_closed
+    def translate_elements(
+        self,
+        x: num_type,
+        y: num_type,
+        z: num_type,
+        elements: Optional[Iterable["ElementBase"]] = None,
+        elementXYZ: Optional[bool] = None,
+    ) -> Self:
+        """平移元件, 与对每个元件调用
+        a_element.set_position(e_x + x, e_y + y, e_z + z, elementXYZ) 的结果一致
+        (e_x, e_y, e_z为元件在elementXYZ对应的坐标系下的坐标)
+
+        Args:
+            x, y, z: 平移的距离
+            elements: 要平移的元件, 默认为该实验的所有元件
+            elementXYZ: 是否使用元件坐标系 (仅电学实验), 平移后所有元件都将使用该坐标系
+        """
+        if not isinstance(x, (int, float)):
+            raise TypeError(
+                f"Parameter x must be of type `int | float`, but got value {x} of type `{type(x).__name__}`"
+            )
+        if not isinstance(y, (int, float)):
+            raise TypeError(
+                f"Parameter y must be of type `int | float`, but got value {y} of type `{type(y).__name__}`"
+            )
+        if not isinstance(z, (int, float)):
+            raise TypeError(
+                f"Parameter z must be of type `int | float`, but got value {z} of type `{type(z).__name__}`"
+            )
+        if not isinstance(elementXYZ, (bool, type(None))):
+            raise TypeError(
+                f"Parameter elementXYZ must be of type `Optional[bool]`, but got value {elementXYZ} of type `{type(elementXYZ).__name__}`"
+            )
+
+        elements = self._elements_in(elements)
+        is_elementXYZ: bool = (
+            elementXYZ is True or self.is_elementXYZ is True and elementXYZ is None
+        )
+        positions = self._positions_in(elements, is_elementXYZ)
+        self._set_positions(
+            elements,
+            [(e_x + x, e_y + y, e_z + z) for e_x, e_y, e_z in positions],
+            elementXYZ,
+        )
+        return self
+
+    @_check_not_closed
+    def set_elements_rotation(
+        self,
+        x_r: num_type,
+        y_r: num_type,
+        z_r: num_type,
+        elements: Optional[Iterable["ElementBase"]] = None,
+    ) -> Self:
+        """设置元件的角度, 与对每个元件调用 a_element.set_rotation(x_r, y_r, z_r) 的结果一致
+        角度不影响坐标索引, 因此只需对所有元件设置同一个Rotation
+
+        Args:
+            x_r, y_r, z_r: 元件的角度
+            elements: 要设置角度的元件, 默认为该实验的所有元件
+        """
+        if self.experiment_type == ExperimentType.Celestial:
+            raise errors.ExperimentTypeError
+        if not isinstance(x_r, (int, float)):
+            raise TypeError(
+                f"Parameter x_r must be of type `int | float`, but got value {x_r} of type `{type(x_r).__name__}`"
+            )
+        if not isinstance(y_r, (int, float)):
+            raise TypeError(
+                f"Parameter y_r must be of type `int | float`, but got value {y_r} of type `{type(y_r).__name__}`"
+            )
+        if not isinstance(z_r, (int, float)):
+            raise TypeError(
+                f"Parameter z_r must be of type `int | float`, but got value {z_r} of type `{type(z_r).__name__}`"
+            )
 
+        elements = self._elements_in(elements)
+        x_r, y_r, z_r = (
+            _tools.round_data(x_r),
+            _tools.round_data(y_r),
+            _tools.round_data(z_r),
+        )
+        rotation = f"{x_r},{z_r},{y_r}"
+        for a_element in elements:
+            a_element._set_data_field("Rotation", rotation)
         return self
 
     @_check_not_closed
@@ -801,19 +1382,56 @@ class _Experiment:
         y: num_type = 0,
         z: num_type = 0,
         elementXYZ: Optional[bool] = None,
+        *,
+        repeat: int = 1,
+        spacing: Tuple[num_type, num_type, num_type] = (0, 0, 0),
     ) -> Self:
         """合并另一实验
         x, y, z, elementXYZ为重新设置要合并的实验的坐标系原点在self的坐标系的位置
         不是电学实验时, elementXYZ参数无效
+        合并进来的元件会使用新的Identifier, 因此同一个实验可以被合并多次
+
+        Args:
+            repeat: 将other合并的次数, 第i份 (从0开始) 的原点为 (x, y, z) + i * spacing
+            spacing: 相邻两份之间的距离
         """
+        if not isinstance(other, _Experiment):
+            raise TypeError(
+                f"Parameter other must be of type `Experiment`, but got value {other} of type `{type(other).__name__}`"
+            )
+        if not isinstance(x, (int, float)):
+            raise TypeError(
+                f"Parameter x must be of type `int | float`, but got value {x} of type `{type(x).__name__}`"
+            )
+        if not isinstance(y, (int, float)):
+            raise TypeError(
+                f"Parameter y must be of type `int | float`, but got value {y} of type `{type(y).__name__}`"
+            )
+        if not isinstance(z, (int, float)):
+            raise TypeError(
+                f"Parameter z must be of type `int | float`, but got value {z} of type `{type(z).__name__}`"
+            )
+        if not isinstance(elementXYZ, (bool, type(None))):
+            raise TypeError(
+                f"Parameter elementXYZ must be of type `Optional[bool]`, but got value {elementXYZ} of type `{type(elementXYZ).__name__}`"
+            )
+        if not isinstance(repeat, int) or isinstance(repeat, bool):
+            raise TypeError(
+                f"Parameter repeat must be of type `int`, but got value {repeat} of type `{type(repeat).__name__}`"
+            )
+        if repeat < 0:
+            raise ValueError(f"Parameter repeat must be non-negative, but got {repeat}")
         if (
-            not isinstance(other, _Experiment)
-            or not isinstance(x, (int, float))
-            or not isinstance(y, (int, float))
-            or not isinstance(z, (int, float))
-            or not isinstance(elementXYZ, (bool, type(bool)))
+            not isinstance(spacing, (tuple, list))
+            or len(spacing) != 3
+            or not all(
+                isinstance(num, (int, float)) and not isinstance(num, bool)
+                for num in spacing
+            )
         ):
-            raise TypeError()
+            raise TypeError(
+                f"Parameter spacing must be a tuple of 3 `int | float`, but got value {spacing}"
+            )
         if self.experiment_type != other.experiment_type:
             raise errors.ExperimentTypeError
         if self is other:
@@ -821,59 +1439,68 @@ class _Experiment:
                 "can not merge to itself"
             )  # TODO 换一个更好的异常类型?
 
-        if self is other:
-            return self
-
-        identifier_to_element: dict = {}
-
-        # TODO 对天体与电学实验的支持可能不太好吧
-        for a_element in other.Elements:
-            a_element = copy.deepcopy(a_element, memo={id(a_element.experiment): self})
-            e_x, e_y, e_z = a_element.get_position()
-            if self.experiment_type == ExperimentType.Circuit:
-                if elementXYZ and not a_element.is_elementXYZ:
-                    e_x, e_y, e_z = native_to_elementXYZ(
-                        e_x,
-                        e_y,
-                        e_z,
-                        self._elementXYZ_origin_position,
-                        a_element.is_bigElement,
-                    )
-                elif not elementXYZ and a_element.is_elementXYZ:
-                    e_x, e_y, e_z = elementXYZ_to_native(
-                        e_x,
-                        e_y,
-                        e_z,
-                        self._elementXYZ_origin_position,
-                        a_element.is_bigElement,
+        templates: List["ElementBase"] = list(other.Elements)
+        wires: list = []
+        is_elementXYZ: bool = False
+        if self.experiment_type == ExperimentType.Circuit:
+            wires = list(other.Wires)
+            is_elementXYZ = (
+                elementXYZ is True or self.is_elementXYZ is True and elementXYZ is None
+            )
+        # 元件在合并后的坐标系下相对于原点的坐标, 对每一份都相同
+        positions = self._positions_in(templates, is_elementXYZ)
+        dx, dy, dz = spacing
+
+        for i in range(repeat):
+            # 只复制data与引脚, 不通过deepcopy复制整个对象图
+            identifiers = self._new_identifiers(len(templates))
+            elements: List["ElementBase"] = [
+                a_element._clone(self, identifier)
+                for a_element, identifier in zip(templates, identifiers)
+            ]
+            o_x, o_y, o_z = x + i * dx, y + i * dy, z + i * dz
+            self._place_elements(
+                elements,
+                [(e_x + o_x, e_y + o_y, e_z + o_z) for e_x, e_y, e_z in positions],
+                elementXYZ,
+            )
+            self._register_elements(elements)
+
+            if len(wires) == 0:
+                continue
+            # 通过原元件找到复制出的元件, 再通过引脚的label找到对应的引脚
+            clone_of: Dict["ElementBase", "ElementBase"] = dict(zip(templates, elements))
+            label2pin: Dict["ElementBase", dict] = {}
+
+            def pin_of(a_pin):
+                a_element = clone_of[a_pin.element_self]
+                pins = label2pin.get(a_element)
+                if pins is None:
+                    pins = {
+                        b_pin._pin_label: b_pin for _, b_pin in a_element.all_pins()
+                    }
+                    label2pin[a_element] = pins
+                return pins[a_pin._pin_label]
+
+            self._link_wires(
+                [
+                    type(a_wire)._construct(
+                        pin_of(a_wire.Source), pin_of(a_wire.Target), a_wire.color
                     )
-            a_element.set_position(e_x + x, e_y + y, e_z + z, elementXYZ)
-            # set_Position已处理与_elements_position有关的操作
-            self.Elements.append(a_element)
+                    for a_wire in wires
+                ]
+            )
 
-            identifier_to_element[a_element.data["Identifier"]] = a_element
+        return self
 
-        if (
-            self.experiment_type == ExperimentType.Circuit
-            and other.experiment_type == ExperimentType.Circuit
-        ):
-            for a_wire in other.Wires:
-                a_wire = copy.deepcopy(
-                    a_wire,
-                    memo={
-                        id(a_wire.Source.element_self): identifier_to_element[
-                            a_wire.Source.element_self.data["Identifier"]
-                        ],
-                        id(a_wire.Target.element_self): identifier_to_element[
-                            a_wire.Target.element_self.data["Identifier"]
-                        ],
-                    },
-                )
-                self.Wires.add(
-                    a_wire
-                )  # TODO 这里wire不深拷贝，通过wire拿到的element不对吧
 
-        return self
+def _copy_value(value):
+    """复制data中的值 (仅包含dict, list与不可变的值)"""
+    if isinstance(value, dict):
+        return {k: _copy_value(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_value(v) for v in value]
+    return value
 
 
 class ElementBase:
@@ -891,6 +1518,46 @@ class ElementBase:
     def zh_name():
         raise NotImplementedError
 
+    @property
+    def _identifier(self) -> str:
+        """元件的Identifier"""
+        return self.data["Identifier"]
+
+    def _get_data_field(self, key: str) -> Any:
+        """读取data中的一项"""
+        return self.data[key]
+
+    def _set_data_field(self, key: str, value: Any) -> None:
+        """修改data中的一项"""
+        self.data[key] = value
+
+    def _set_native_position(self, x: num_type, y: num_type, z: num_type) -> None:
+        """设置存档中的Position (x, y, z为已转换为原生坐标系的坐标)"""
+        self._set_data_field("Position", f"{round(x, 6)},{round(z, 6)},{round(y, 6)}")
+
+    def _dump_data(self) -> dict:
+        """生成写入存档的dict, 调用者不应修改其内容"""
+        return self.data
+
+    def _dump_json(self, compact: bool) -> str:
+        """生成写入存档的json
+
+        Args:
+            compact: 为True时使用紧凑存档的格式, 否则与StatusSave的格式一致
+        """
+        return _sav_writer.encode_element(self._dump_data(), compact)
+
+    def _clone(self, experiment: _Experiment, identifier: str) -> Self:
+        """复制该元件, 复制出的元件属于experiment但尚未被加入实验, 坐标也需要之后再设置
+        data会被逐层复制, 其他属性只进行浅拷贝
+        """
+        res = type(self).__new__(type(self))
+        res.__dict__.update(self.__dict__)
+        res.experiment = experiment
+        res.data = _copy_value(self.data)
+        res._set_data_field("Identifier", identifier)
+        return res
+
     def set_position(self, x: num_type, y: num_type, z: num_type) -> Self:
         """设置元件的位置"""
         if not isinstance(x, (int, float)):
@@ -908,35 +1575,29 @@ class ElementBase:
 
         x, y, z = _tools.round_data(x), _tools.round_data(y), _tools.round_data(z)
         errors.assert_true(hasattr(self, "experiment"))
-        _Expe: _Experiment = self.experiment
 
-        for self_list in _Expe._position2elements.values():
-            if self in self_list:
-                self_list.remove(self)
-
-        errors.assert_true(hasattr(self, "data"))
-        self.data["Position"] = f"{x},{z},{y}"
+        self._set_data_field("Position", f"{x},{z},{y}")
 
         errors.assert_true(hasattr(self, "_position"))
-        if self._position in _Expe._position2elements.keys():
-            _Expe._position2elements[self._position].append(self)
-        else:
-            _Expe._position2elements[self._position] = [self]
+        self.experiment._move_element(self, self._position)
 
         return self
 
     @final
     def _set_identifier(self, identifier: Optional[str] = None) -> None:
         if identifier is None:
-            self.data["Identifier"] = _tools.randString(33)
-        else:
-            self.data["Identifier"] = identifier
+            identifier = _tools.randStrings(1, 33)[0]
+            # 与已有元件的Identifier重复的概率极低, 但仍需避免
+            while identifier in self.experiment._id2element:
+                identifier = _tools.randStrings(1, 33)[0]
+        self._set_data_field("Identifier", identifier)
 
     @final
     def get_position(self) -> _tools.position:
         """获取元件的坐标"""
         errors.assert_true(hasattr(self, "_position"))
-        return copy.deepcopy(self._position)
+        # position是namedtuple, 不需要复制
+        return self._position
 
     @final
     def get_index(self) -> int:
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""读写存档时使用的json编解码器
+安装了orjson或ujson时会自动使用它们加速, 也可以通过环境变量`PHYSICSLAB_JSON_BACKEND`
+或`set_backend`指定只使用某一个后端 ("orjson", "ujson", "json")
+
+无论使用哪个后端, 结果都与标准库json完全一致:
+* 解码失败时会交由标准库json重新解码, 异常也由标准库json抛出
+* orjson会将超出64位的整数静默地解码为浮点数, 因此可能含有这样的整数时使用标准库json解码
+* orjson无法生成与标准库json一致的输出 (浮点数格式不同且不支持ensure_ascii),
+  因此只用于解码
+* ujson的浮点数仅在指数形式下与标准库json不同 (e.g. 1e-5与1e-05), 而其指数总是带有符号,
+  因此编码结果中出现"e-"或"e+"时会使用标准库json重新编码
+"""
+import os
+import json
+
+from physicsLab import _warn
+from ._typing import Any, Optional, Callable, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+BACKENDS = ("orjson", "ujson", "json")
+
+_loads: Optional[Callable[[str], Any]] = None
+_dumps: Optional[Callable[[Any, bool], str]] = None
+
+
+# 数字 -> b"0", 其余字节 -> b" "
+_DIGITS_TABLE = bytes(48 if 48 <= i <= 57 else 32 for i in range(256))
+# 超出64位的整数至少有19位数字, 没有19位连续数字的输入中一定不含这样的整数
+_LONG_DIGITS_LENGTH = 19
+# 每次只复制并检查这么长的一块, 而不是复制整个输入
+_SCAN_CHUNK_SIZE = 1 << 20
+
+
+def _has_long_digits(data: Union[str, memoryview]) -> bool:
+    # bytes.translate比正则表达式快得多, 相比orjson解码本身的开销很小
+    # 相邻的块重叠 _LONG_DIGITS_LENGTH - 1 个字符, 跨块的数字也能被找到
+    long_digits = b"0" * _LONG_DIGITS_LENGTH
+    for start in range(0, len(data), _SCAN_CHUNK_SIZE):
+        chunk = data[start : start + _SCAN_CHUNK_SIZE + _LONG_DIGITS_LENGTH - 1]
+        if isinstance(chunk, str):
+            chunk = chunk.encode("utf-8", "surrogatepass")
+        else:
+            chunk = bytes(chunk)
+        if long_digits in chunk.translate(_DIGITS_TABLE):
+            return True
+    return False
+
+
+def _ujson_dumps(obj: Any, ensure_ascii: bool) -> str:
+    res = ujson.dumps(obj, ensure_ascii=ensure_ascii, escape_forward_slashes=False)
+    if ensure_ascii and "\x7f" in res:
+        # 标准库json在ensure_ascii时会转义DEL
+        res = res.replace("\x7f", "\\u007f")
+    return res
+
+
+def set_backend(backend: Optional[str] = None) -> None:
+    """指定读写存档时使用的json后端
+
+    Args:
+        backend: "orjson", "ujson"或"json", 为None时自动选择已安装的最快的后端
+            (解码优先使用orjson, 编码使用ujson)
+    """
+    global _loads, _dumps
+
+    if not isinstance(backend, (str, type(None))):
+        raise TypeError(
+            f"Parameter backend must be of type `Optional[str]`, but got `{type(backend).__name__}`"
+        )
+    if backend is not None and backend not in BACKENDS:
+        raise ValueError(f"Parameter backend must be one of {BACKENDS}")
+    if backend == "orjson" and orjson is None:
+        raise ImportError("orjson is not installed")
+    if backend == "ujson" and ujson is None:
+        raise ImportError("ujson is not installed")
+
+    if backend is None:
+        if orjson is not None:
+            _loads = orjson.loads
+        elif ujson is not None:
+            _loads = ujson.loads
+        else:
+            _loads = None
+        _dumps = _ujson_dumps if ujson is not None else None
+    elif backend == "orjson":
+        _loads = orjson.loads
+        _dumps = None
+    elif backend == "ujson":
+        _loads = ujson.loads
+        _dumps = _ujson_dumps
+    else:
+        _loads = None
+        _dumps = None
+
+
+def loads(s: str) -> Any:
+    """与 json.loads(s) 的结果一致"""
+    if _loads is not None:
+        try:
+            if orjson is not None and _loads is orjson.loads:
+                if not _has_long_digits(s):
+                    return _loads(s)
+            else:
+                return _loads(s)
+        except Exception:
+            pass
+    return json.loads(s)
+
+
+def loads_buffer(buf: Any) -> Any:
+    """与 json.loads(bytes(buf)) 的结果一致
+    buf为支持buffer协议的对象 (e.g. mmap), 使用orjson解码时不会复制整个buf
+    (只有含有19位以上连续数字, 需要交由标准库json解码时才会复制)
+    """
+    if _loads is not None:
+        try:
+            if orjson is not None and _loads is orjson.loads:
+                with memoryview(buf) as view:
+                    if not _has_long_digits(view):
+                        return _loads(view)
+            else:
+                return _loads(bytes(buf))
+        except Exception:
+            pass
+    return json.loads(bytes(buf))
+
+
+def dumps(obj: Any, ensure_ascii: bool = False) -> str:
+    """与 json.dumps(obj, ensure_ascii=ensure_ascii, separators=(",", ":")) 的结果一致"""
+    if _dumps is not None:
+        try:
+            res = _dumps(obj, ensure_ascii)
+        except Exception:
+            pass
+        else:
+            if "e-" not in res and "e+" not in res:
+                return res
+    return json.dumps(obj, ensure_ascii=ensure_ascii, separators=(",", ":"))
+
+
+try:
+    set_backend(os.environ.get("PHYSICSLAB_JSON_BACKEND") or None)
+except (ImportError, ValueError) as e:
+    _warn.warning(f"invalid PHYSICSLAB_JSON_BACKEND: {e}")
+    set_backend()
@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+"""流式读取存档的元信息 (InternalName, Summary, Experiment.Type)
+存档中体积最大的是被转义为字符串的StatusSave, 读取元信息时仅跳过它而不会对其进行解码
+"""
+import json
+
+from physicsLab import errors
+from ._typing import Iterator, Dict, Any
+
+# 每次从文件中读取的字符数
+_CHUNK_SIZE = 1 << 16
+
+_WHITESPACE = " \t\r\n"
+
+_decoder = json.JSONDecoder()
+
+
+class _IncompleteSav(Exception):
+    """文件在读取完一个完整的json值前就结束了"""
+
+
+class _SavHeaderReader:
+    """以块为单位读取存档, 只解析顶层 (与Experiment中) 的键值对"""
+
+    def __init__(self, chunks: Iterator[str]) -> None:
+        self._chunks = chunks
+        self._buf: str = ""
+        self._pos: int = 0
+        self._is_eof: bool = False
+
+    def _read_chunk(self) -> bool:
+        """读取下一块数据, 若文件已结束则返回False"""
+        if self._is_eof:
+            return False
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            self._is_eof = True
+            return False
+        # 与_open_sav保持一致: 忽略所有的换行符
+        self._buf = self._buf[self._pos :] + chunk.replace("\n", "")
+        self._pos = 0
+        return True
+
+    def _peek(self) -> str:
+        """跳过空白字符并返回下一个字符"""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._read_chunk():
+                raise _IncompleteSav
+
+    def _expect(self, char: str) -> None:
+        if self._peek() != char:
+            raise errors.InvalidSavError
+        self._pos += 1
+
+    def _find_string_end(self, skip: bool) -> int:
+        """返回从self._pos开始的json字符串的结束引号的位置
+        skip为True时, 已扫描过的数据会被丢弃, 因此只适合用于跳过字符串
+        """
+        # 相对于self._pos的位置, 因为读取新的数据块后self._pos会被重置
+        start = 1
+        while True:
+            end = self._buf.find('"', self._pos + start)
+            while end != -1:
+                backslashes = 0
+                while self._buf[end - 1 - backslashes] == "\\":
+                    backslashes += 1
+                if backslashes % 2 == 0:
+                    return end
+                end = self._buf.find('"', end + 1)
+
+            # 末尾的反斜杠决定了下一块数据开头的引号是否被转义, 因此需要保留
+            keep = len(self._buf) - len(self._buf.rstrip("\\"))
+            if skip:
+                # 保留开头的引号, 使其作为反斜杠计数的边界
+                self._buf = '"' + self._buf[len(self._buf) - keep :]
+                self._pos = 0
+                start = 1 + keep
+            else:
+                start = len(self._buf) - self._pos - keep
+            if not self._read_chunk():
+                raise _IncompleteSav
+
+    def _read_string(self) -> str:
+        if self._peek() != '"':
+            raise errors.InvalidSavError
+        end = self._find_string_end(skip=False)
+        res = json.loads(self._buf[self._pos : end + 1])
+        self._pos = end + 1
+        return res
+
+    def _skip_string(self) -> None:
+        if self._peek() != '"':
+            raise errors.InvalidSavError
+        self._pos = self._find_string_end(skip=True) + 1
+
+    def _read_value(self) -> Any:
+        self._peek()
+        while True:
+            try:
+                res, end = _decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                pass
+            else:
+                # 数字等值可能恰好在块的末尾被截断, 因此要求其后还有数据
+                if end < len(self._buf) or self._is_eof:
+                    self._pos = end
+                    return res
+            if self._is_eof:
+                raise _IncompleteSav
+            # 每次至少使缓冲区翻倍, 避免对较大的值反复解码
+            target = 2 * (len(self._buf) - self._pos)
+            while len(self._buf) - self._pos < target and self._read_chunk():
+                pass
+
+    def _walk_object(self, on_item) -> None:
+        """遍历一个json对象, on_item(key)负责读取或跳过对应的值
+        on_item返回True时停止遍历
+        """
+        self._expect("{")
+        if self._peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self._read_string()
+            self._expect(":")
+            if on_item(key):
+                return
+            char = self._peek()
+            self._pos += 1
+            if char == "}":
+                return
+            if char != ",":
+                raise errors.InvalidSavError
+
+    def read_header(self) -> Dict[str, Any]:
+        top: Dict[str, Any] = {}
+        experiment: Dict[str, Any] = {}
+
+        def on_experiment_item(key: str) -> bool:
+            if key == "StatusSave":
+                if self._peek() == '"':
+                    self._skip_string()
+                else:
+                    self._read_value()
+            else:
+                experiment[key] = self._read_value()
+            return False
+
+        def on_top_item(key: str) -> bool:
+            if key == "Experiment" and self._peek() == "{":
+                self._walk_object(on_experiment_item)
+                top[key] = experiment
+            elif key == "StatusSave" and self._peek() == '"':
+                # 物实导出的存档只含有.sav的Experiment部分
+                self._skip_string()
+            else:
+                top[key] = self._read_value()
+            # InternalName 位于 Experiment 与 Summary 之后
+            return "InternalName" in top and "Experiment" in top and "Summary" in top
+
+        if self._peek() == "\ufeff":
+            self._pos += 1
+        self._walk_object(on_top_item)
+        return _make_header(top)
+
+
+def _make_header(sav: dict) -> Dict[str, Any]:
+    if "Experiment" in sav:
+        experiment = sav["Experiment"]
+        internal_name = sav.get("InternalName")
+    else:
+        experiment = sav
+        internal_name = None
+    if not isinstance(experiment, dict):
+        raise errors.InvalidSavError
+
+    return {
+        "InternalName": internal_name if isinstance(internal_name, str) else None,
+        "Summary": sav.get("Summary"),
+        "Type": experiment.get("Type"),
+    }
+
+
+def _iter_chunks(f) -> Iterator[str]:
+    while True:
+        chunk = f.read(_CHUNK_SIZE)
+        if not chunk:
+            return
+        yield chunk
+
+
+def read_sav_header(sav_path: str) -> Dict[str, Any]:
+    """读取存档的元信息, 不会解码StatusSave
+    返回 {"InternalName": ..., "Summary": ..., "Type": ...}, 其中Type为Experiment.Type
+    物实导出的存档不含InternalName, 此时其值为None
+
+    Args:
+        sav_path: 存档的路径
+    """
+    try:
+        with open(sav_path, encoding="utf-8") as f:
+            return _SavHeaderReader(_iter_chunks(f)).read_header()
+    except (
+        UnicodeDecodeError,
+        json.JSONDecodeError,
+        errors.InvalidSavError,
+        _IncompleteSav,
+    ):
+        pass
+
+    # 非utf-8编码或格式不规范的存档, 交由_open_sav处理
+    from .element import _open_sav
+
+    sav = _open_sav(sav_path)
+    if not isinstance(sav, dict):
+        raise errors.InvalidSavError
+    return _make_header(sav)
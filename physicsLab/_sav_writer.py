@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+"""以紧凑的格式流式写入存档
+StatusSave在存档中是一个被转义的json字符串, 写入时逐个元件编码并转义后直接写入文件,
+不会生成完整的StatusSave字符串, 也不会对其进行二次编码
+"""
+import os
+import json
+import contextlib
+from collections.abc import Sequence
+from json.encoder import encode_basestring, encode_basestring_ascii, c_make_encoder  # type: ignore
+
+from physicsLab import _json_codec
+from ._typing import Dict, Any, Iterator, TextIO, List, NoReturn
+
+# 每次编码并写入这么多个元件 (或导线)
+_BATCH_SIZE = 1024
+
+
+# 与 json.dumps(..., ensure_ascii=True, separators=(",", ": ")) 一致, 用于编码StatusSave
+_status_save_encoder = json.JSONEncoder(ensure_ascii=True, separators=(",", ": "))
+
+
+def _raise_type_error(o: Any) -> NoReturn:
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+# JSONEncoder.encode每次都会创建新的c_make_encoder, 编码大量小dict时直接复用同一个
+if c_make_encoder is not None:
+    _c_status_save_encoder = c_make_encoder(
+        None,
+        _raise_type_error,
+        encode_basestring_ascii,
+        None,
+        ": ",
+        ",",
+        False,
+        False,
+        True,
+    )
+else:
+    _c_status_save_encoder = None
+
+
+def encode_element(data: dict, compact: bool) -> str:
+    """编码一个元件写入存档的dict
+
+    Args:
+        compact: 为True时使用紧凑存档的格式, 否则与StatusSave的格式一致
+    """
+    if compact:
+        return _json_codec.dumps(data, ensure_ascii=True)
+    if _c_status_save_encoder is not None:
+        return "".join(_c_status_save_encoder(data, 0))
+    return _status_save_encoder.encode(data)
+
+
+class LazyElements(Sequence):
+    """按需生成元件写入存档的dict或json, 避免同时持有所有元件的dict
+    元件的json由元件自己生成, 未被修改过的元件会直接使用上次保存时缓存的json
+    """
+
+    __slots__ = ("_elements",)
+
+    def __init__(self, elements: list) -> None:
+        self._elements = elements
+
+    def __len__(self) -> int:
+        return len(self._elements)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [a_element._dump_data() for a_element in self._elements[index]]
+        return self._elements[index]._dump_data()
+
+    def iter_json(self, compact: bool) -> Iterator[str]:
+        """逐批生成元件的json, 批与批之间需要以","连接"""
+        for start in range(0, len(self._elements), _BATCH_SIZE):
+            yield ",".join(
+                [
+                    a_element._dump_json(compact)
+                    for a_element in self._elements[start : start + _BATCH_SIZE]
+                ]
+            )
+
+
+def _dumps(obj: Any) -> str:
+    return _json_codec.dumps(obj)
+
+
+def _escape(text: str) -> str:
+    """将json转义为json字符串的内容 (不含两端的引号)"""
+    return encode_basestring(text)[1:-1]
+
+
+def _iter_status_save(status_save: Dict[str, Any]) -> Iterator[str]:
+    """逐段生成StatusSave的json (ensure_ascii), 列表与字典中的项被分批编码"""
+    yield "{"
+    for i, (key, value) in enumerate(status_save.items()):
+        if i != 0:
+            yield ","
+        yield json.dumps(key)
+        yield ":"
+        if isinstance(value, LazyElements):
+            yield "["
+            for j, chunk in enumerate(value.iter_json(compact=True)):
+                if j != 0:
+                    yield ","
+                yield chunk
+            yield "]"
+        elif isinstance(value, list) and value:
+            yield "["
+            for start in range(0, len(value), _BATCH_SIZE):
+                if start != 0:
+                    yield ","
+                # 去掉切片编码结果的"[]"
+                yield _json_codec.dumps(
+                    value[start : start + _BATCH_SIZE], ensure_ascii=True
+                )[1:-1]
+            yield "]"
+        elif isinstance(value, dict) and value:
+            yield "{"
+            items = list(value.items())
+            for start in range(0, len(items), _BATCH_SIZE):
+                if start != 0:
+                    yield ","
+                yield _json_codec.dumps(
+                    dict(items[start : start + _BATCH_SIZE]), ensure_ascii=True
+                )[1:-1]
+            yield "}"
+        else:
+            yield _json_codec.dumps(value, ensure_ascii=True)
+    yield "}"
+
+
+def dumps_status_save(status_save: Dict[str, Any]) -> str:
+    """生成StatusSave的json, 与
+    json.dumps(status_save, ensure_ascii=True, separators=(",", ": ")) 的结果一致
+    """
+    chunks: List[str] = []
+    for key, value in status_save.items():
+        if isinstance(value, LazyElements):
+            value_json = "[" + ",".join(value.iter_json(compact=False)) + "]"
+        else:
+            value_json = _status_save_encoder.encode(value)
+        chunks.append(f"{_status_save_encoder.encode(key)}: {value_json}")
+    return "{" + ",".join(chunks) + "}"
+
+
+def dump_sav(f: TextIO, pl_sav: dict, status_save: Dict[str, Any]) -> None:
+    """将存档以紧凑的格式写入f, pl_sav["Experiment"]["StatusSave"]会被status_save代替
+
+    Args:
+        f: 以文本模式打开的文件
+        pl_sav: 存档 (除StatusSave外)
+        status_save: StatusSave对应的dict
+    """
+    f.write("{")
+    for i, (key, value) in enumerate(pl_sav.items()):
+        if i != 0:
+            f.write(",")
+        f.write(_dumps(key))
+        f.write(":")
+        if key != "Experiment":
+            f.write(_dumps(value))
+            continue
+
+        f.write("{")
+        for j, (experiment_key, experiment_value) in enumerate(value.items()):
+            if j != 0:
+                f.write(",")
+            f.write(_dumps(experiment_key))
+            f.write(":")
+            if experiment_key == "StatusSave":
+                f.write('"')
+                for chunk in _iter_status_save(status_save):
+                    f.write(_escape(chunk))
+                f.write('"')
+            else:
+                f.write(_dumps(experiment_value))
+        f.write("}")
+    f.write("}")
+
+
+@contextlib.contextmanager
+def atomic_write(path: str) -> Iterator[TextIO]:
+    """先写入临时文件, 写入成功后再替换path, 避免写入中断时损坏存档"""
+    if os.path.exists(path) and not os.path.isfile(path):
+        # e.g. os.devnull, 无法被替换
+        with open(path, "w", encoding="utf-8") as f:
+            yield f
+        return
+
+    temp_path = f"{path}.tmp"
+    try:
+        with open(temp_path, "w", encoding="utf-8") as f:
+            yield f
+        os.replace(temp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(temp_path)
+        raise
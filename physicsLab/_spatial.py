@@ -0,0 +1,291 @@
+# -*- coding: utf-8 -*-
+"""元件坐标的空间索引 (均匀网格)
+每个元件按坐标被放入边长为cell_size的立方体格子中, 区域查询只需遍历与区域相交的格子
+"""
+import math
+import heapq
+import itertools
+
+from ._typing import Any, Dict, List, Tuple, Callable, Iterator, Hashable
+
+point_type = Tuple[float, float, float]
+cell_type = Tuple[int, int, int]
+
+# 平均每个格子中的元件数
+_ITEMS_PER_CELL = 4
+# 元件数超过建立索引时的这么多倍时, 格子的边长可能已经不合适了, 需要重新建立索引
+_REBUILD_FACTOR = 4
+
+
+def _squared_distance(a: point_type, b: point_type) -> float:
+    return (a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2 + (a[2] - b[2]) ** 2
+
+
+class SpatialGrid:
+    """均匀网格空间索引, 保存元件 (可哈希的对象) 与其坐标"""
+
+    __slots__ = ("cell_size", "_cells", "_points", "_built_count")
+
+    def __init__(self, cell_size: float) -> None:
+        self.cell_size: float = cell_size
+        self._cells: Dict[cell_type, Dict[Hashable, point_type]] = {}
+        self._points: Dict[Hashable, point_type] = {}
+        self._built_count: int = 0
+
+    @classmethod
+    def build(cls, points: Dict[Any, point_type]) -> "SpatialGrid":
+        """根据元件的分布选择格子的边长, 并建立索引"""
+        cell_size = 1.0
+        if len(points) != 0:
+            extents = [
+                max(a_point[i] for a_point in points.values())
+                - min(a_point[i] for a_point in points.values())
+                for i in range(3)
+            ]
+            extents = [extent for extent in extents if extent > 0]
+            if len(extents) != 0:
+                volume = math.prod(extents)
+                cell_size = (volume * _ITEMS_PER_CELL / len(points)) ** (
+                    1 / len(extents)
+                )
+                if cell_size <= 0 or not math.isfinite(cell_size):
+                    cell_size = max(extents)
+
+        res = cls(cell_size)
+        for item, a_point in points.items():
+            res.insert(item, a_point)
+        res._built_count = len(points)
+        return res
+
+    def is_overloaded(self) -> bool:
+        """元件数是否已远多于建立索引时的元件数"""
+        return len(self._points) > _REBUILD_FACTOR * self._built_count + 64
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def _cell_of(self, a_point: point_type) -> cell_type:
+        cell_size = self.cell_size
+        return (
+            math.floor(a_point[0] / cell_size),
+            math.floor(a_point[1] / cell_size),
+            math.floor(a_point[2] / cell_size),
+        )
+
+    def insert(self, item: Hashable, a_point: point_type) -> None:
+        """加入元件, 若元件已在索引中则将其移动到a_point"""
+        if item in self._points:
+            self.remove(item)
+        self._points[item] = a_point
+        cell = self._cell_of(a_point)
+        items = self._cells.get(cell)
+        if items is None:
+            self._cells[cell] = {item: a_point}
+        else:
+            items[item] = a_point
+
+    def remove(self, item: Hashable) -> None:
+        """移除元件, 若元件不在索引中则什么也不做"""
+        a_point = self._points.pop(item, None)
+        if a_point is None:
+            return
+        cell = self._cell_of(a_point)
+        items = self._cells[cell]
+        del items[item]
+        if len(items) == 0:
+            del self._cells[cell]
+
+    def _iter_box(
+        self, lower: point_type, upper: point_type
+    ) -> Iterator[Tuple[Hashable, point_type]]:
+        lower_cell = self._cell_of(lower)
+        upper_cell = self._cell_of(upper)
+        cells_count = math.prod(
+            upper_cell[i] - lower_cell[i] + 1 for i in range(3)
+        )
+        if cells_count <= len(self._cells):
+            cells = (
+                self._cells.get(cell)
+                for cell in itertools.product(
+                    *(range(lower_cell[i], upper_cell[i] + 1) for i in range(3))
+                )
+            )
+        else:
+            # 区域比所有被占用的格子还大时, 直接遍历被占用的格子
+            cells = (
+                items
+                for cell, items in self._cells.items()
+                if all(lower_cell[i] <= cell[i] <= upper_cell[i] for i in range(3))
+            )
+
+        for items in cells:
+            if items is None:
+                continue
+            for item, a_point in items.items():
+                if all(lower[i] <= a_point[i] <= upper[i] for i in range(3)):
+                    yield item, a_point
+
+    def query_box(self, lower: point_type, upper: point_type) -> List[Hashable]:
+        """获取坐标在lower与upper围成的长方体内 (含边界) 的元件"""
+        return [item for item, _ in self._iter_box(lower, upper)]
+
+    def query_radius(self, center: point_type, radius: float) -> List[Hashable]:
+        """获取与center的距离不超过radius的元件"""
+        lower = (center[0] - radius, center[1] - radius, center[2] - radius)
+        upper = (center[0] + radius, center[1] + radius, center[2] + radius)
+        squared_radius = radius * radius
+        return [
+            item
+            for item, a_point in self._iter_box(lower, upper)
+            if _squared_distance(a_point, center) <= squared_radius
+        ]
+
+    def _iter_ring(self, center: cell_type, r: int) -> Iterator[cell_type]:
+        """遍历与center的切比雪夫距离为r的格子"""
+        cx, cy, cz = center
+        for dx in range(-r, r + 1):
+            for dy in range(-r, r + 1):
+                if abs(dx) == r or abs(dy) == r:
+                    for dz in range(-r, r + 1):
+                        yield cx + dx, cy + dy, cz + dz
+                else:
+                    yield cx + dx, cy + dy, cz - r
+                    yield cx + dx, cy + dy, cz + r
+
+    def nearest(
+        self, center: point_type, count: int, order_key: Callable[[Any], Any]
+    ) -> List[Tuple[float, Hashable]]:
+        """获取距离center最近的count个元件, 按 (距离, order_key(元件)) 排序"""
+        if count <= 0 or len(self._points) == 0:
+            return []
+
+        # heap中保存最近的count个元件, 堆顶为其中最远的
+        heap: List[Tuple[float, Any, int, Hashable]] = []
+        tie_breaker = itertools.count()
+
+        def push(item: Hashable, a_point: point_type) -> None:
+            entry = (
+                -_squared_distance(a_point, center),
+                _Reversed(order_key(item)),
+                next(tie_breaker),
+                item,
+            )
+            if len(heap) < count:
+                heapq.heappush(heap, entry)
+            elif entry[:2] > heap[0][:2]:
+                heapq.heapreplace(heap, entry)
+
+        center_cell = self._cell_of(center)
+        r = 0
+        while True:
+            if (2 * r + 1) ** 3 > 8 * len(self._cells):
+                # 需要遍历的格子比被占用的格子还多, 直接遍历剩下的元件
+                for cell, items in self._cells.items():
+                    if max(abs(cell[i] - center_cell[i]) for i in range(3)) >= r:
+                        for item, a_point in items.items():
+                            push(item, a_point)
+                break
+
+            for cell in self._iter_ring(center_cell, r):
+                items = self._cells.get(cell)
+                if items is not None:
+                    for item, a_point in items.items():
+                        push(item, a_point)
+            # 更外层的格子中的元件与center的距离不小于 r * cell_size
+            if len(heap) == count and -heap[0][0] < (r * self.cell_size) ** 2:
+                break
+            r += 1
+
+        return [
+            (math.sqrt(-squared), item)
+            for squared, _, _, item in sorted(heap, reverse=True)
+        ]
+
+    def overlaps(
+        self, tolerance: float, order_key: Callable[[Any], Any]
+    ) -> List[List[Hashable]]:
+        """获取坐标的距离不超过tolerance的元件组成的组 (至少含2个元件), 组内按order_key排序"""
+        groups: List[List[Hashable]]
+        if tolerance == 0:
+            point2items: Dict[point_type, List[Hashable]] = {}
+            for item, a_point in self._points.items():
+                point2items.setdefault(a_point, []).append(item)
+            groups = [items for items in point2items.values() if len(items) > 1]
+        else:
+            # 并查集: 距离不超过tolerance的元件属于同一组
+            parent: Dict[Hashable, Hashable] = {item: item for item in self._points}
+
+            def find(item: Hashable) -> Hashable:
+                root = item
+                while parent[root] is not root:
+                    root = parent[root]
+                while parent[item] is not root:
+                    parent[item], item = root, parent[item]
+                return root
+
+            def union(item: Hashable, other: Hashable) -> None:
+                root, other_root = find(item), find(other)
+                if root is not other_root:
+                    parent[other_root] = root
+
+            grid = self
+            if tolerance > self.cell_size:
+                # 格子的边长不小于tolerance时, 每个格子只需与相邻的26个格子比较,
+                # 否则需要比较的格子数会随 (tolerance / cell_size) ** 3 增长
+                grid = SpatialGrid(tolerance)
+                for item, a_point in self._points.items():
+                    grid.insert(item, a_point)
+
+            squared_tolerance = tolerance * tolerance
+            reach = math.ceil(tolerance / grid.cell_size)
+            # 每对相邻的格子只比较一次
+            offsets = [
+                offset
+                for offset in itertools.product(range(-reach, reach + 1), repeat=3)
+                if offset > (0, 0, 0)
+            ]
+            for (cx, cy, cz), items in grid._cells.items():
+                cell_items = list(items.items())
+                for i, (item, a_point) in enumerate(cell_items):
+                    for other, other_point in cell_items[i + 1 :]:
+                        if _squared_distance(a_point, other_point) <= squared_tolerance:
+                            union(item, other)
+                for dx, dy, dz in offsets:
+                    other_items = grid._cells.get((cx + dx, cy + dy, cz + dz))
+                    if other_items is None:
+                        continue
+                    for item, a_point in cell_items:
+                        for other, other_point in other_items.items():
+                            if (
+                                _squared_distance(a_point, other_point)
+                                <= squared_tolerance
+                            ):
+                                union(item, other)
+
+            root2items: Dict[Hashable, List[Hashable]] = {}
+            for item in self._points:
+                root2items.setdefault(find(item), []).append(item)
+            groups = [items for items in root2items.values() if len(items) > 1]
+
+        for items in groups:
+            items.sort(key=order_key)
+        groups.sort(key=lambda items: order_key(items[0]))
+        return groups
+
+
+class _Reversed:
+    """反转比较的顺序, 使heap中order_key较大的元件先被替换"""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def __lt__(self, other: "_Reversed") -> bool:
+        return other.value < self.value
+
+    def __gt__(self, other: "_Reversed") -> bool:
+        return other.value > self.value
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Reversed) and self.value == other.value
@@ -1,9 +1,11 @@
 # -*- coding: utf-8 -*-
+import os
+import random
 from random import choice
 from string import ascii_lowercase, ascii_letters, digits
 
 from collections import namedtuple
-from ._typing import num_type
+from ._typing import num_type, Tuple, List, Optional
 
 # TODO 元件坐标系也应该由这玩意负责
 # TODO 什么抽象玩意, 直接写成class罢
@@ -25,3 +27,67 @@ def randString(length: int, is_lower: bool = False) -> str:
     else:
         letters = ascii_letters
     return "".join(choice(letters + digits) for _ in range(length))
+
+
+_RAND_LETTERS = ascii_letters + digits
+# 将随机的字节映射为_RAND_LETTERS中的字符
+# 大于等于 len(_RAND_LETTERS) * 4 的字节会被丢弃, 以保证每个字符出现的概率相同
+_RAND_TABLE = bytes(ord(_RAND_LETTERS[i % len(_RAND_LETTERS)]) for i in range(256))
+_RAND_DELETE = bytes(range(len(_RAND_LETTERS) * 4, 256))
+# 为None时使用os.urandom, 否则使用该随机数生成器生成可复现的随机字符串
+_seeded_random: Optional[random.Random] = None
+
+
+def seed_rand_strings(seed: Optional[int] = None) -> None:
+    """设置randStrings的随机数种子, 为None时恢复使用os.urandom"""
+    global _seeded_random
+
+    if seed is None:
+        _seeded_random = None
+    else:
+        _seeded_random = random.Random(seed)
+
+
+def _rand_bytes(size: int, seeded: bool) -> bytes:
+    if _seeded_random is None or not seeded:
+        return os.urandom(size)
+    return _seeded_random.getrandbits(size * 8).to_bytes(size, "little")
+
+
+def randStrings(count: int, length: int, *, seeded: bool = True) -> List[str]:
+    """一次生成count个长度为length的随机字符串 (字符集与randString一致)
+
+    Args:
+        seeded: 是否使用seed_rand_strings设置的随机数种子
+    """
+    if (
+        not isinstance(count, int)
+        or not isinstance(length, int)
+        or not isinstance(seeded, bool)
+    ):
+        raise TypeError
+
+    size = count * length
+    letters = b""
+    while len(letters) < size:
+        # 平均约有3%的字节会被丢弃, 因此多生成一些
+        remain = size - len(letters)
+        letters += _rand_bytes(remain + remain // 16 + 16, seeded).translate(
+            _RAND_TABLE, _RAND_DELETE
+        )
+    text = letters[:size].decode("ascii")
+    return [text[i : i + length] for i in range(0, size, length)]
+
+
+def parse_vector(vector: str) -> Tuple[num_type, ...]:
+    """解析存档中以逗号分隔的向量 (e.g. "1,0.5,-2E-05")
+    整数字面量会被解析为int, 其余为float, 与`eval`的结果一致
+    """
+    res = []
+    for num in vector.split(","):
+        num = num.strip()
+        if num.lstrip("+-").isdigit():
+            res.append(int(num))
+        else:
+            res.append(float(num))
+    return tuple(res)
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""在多个进程中批量处理存档
+每个存档在子进程中以`Experiment`打开, 因此不同存档的实验互不影响
+"""
+import os
+import time
+import pathlib
+import traceback
+import concurrent.futures
+
+from ._core import _ExperimentStack
+from .element import Experiment
+from .enums import OpenMode
+from ._typing import Any, Callable, Iterable, Iterator, List, Optional, Union
+
+
+class BatchResult:
+    """处理一个存档的结果"""
+
+    __slots__ = ("path", "value", "error", "seconds")
+
+    def __init__(
+        self, path: str, value: Any, error: Optional[str], seconds: float
+    ) -> None:
+        self.path: str = path
+        # func的返回值, 处理失败时为None
+        self.value: Any = value
+        # 处理失败时为异常的traceback, 否则为None
+        self.error: Optional[str] = error
+        # 在子进程中打开并处理该存档所用的时间 (秒)
+        self.seconds: float = seconds
+
+    @property
+    def ok(self) -> bool:
+        """是否处理成功"""
+        return self.error is None
+
+    def __repr__(self) -> str:
+        status = "ok" if self.ok else "failed"
+        return f"BatchResult({self.path!r}, {status}, {self.seconds:.3f}s)"
+
+
+def _init_worker() -> None:
+    # 通过fork创建的子进程会继承父进程中打开的实验, 它们在子进程中不应被操作
+    _ExperimentStack.clear()
+
+
+def _process_sav(
+    func: Callable[[Experiment], Any], path: str, lazy: bool
+) -> BatchResult:
+    start = time.perf_counter()
+    try:
+        expe = Experiment(OpenMode.load_by_filepath, path, lazy=lazy)
+        try:
+            value = func(expe)
+        finally:
+            # func可以自行保存或关闭实验, 未关闭的实验不会被保存
+            expe.ensure_close()
+    except Exception:
+        return BatchResult(
+            path, None, traceback.format_exc(), time.perf_counter() - start
+        )
+    return BatchResult(path, value, None, time.perf_counter() - start)
+
+
+def map_saves(
+    func: Callable[[Experiment], Any],
+    paths: Iterable[Union[str, pathlib.Path]],
+    workers: Optional[int] = None,
+    *,
+    lazy: bool = False,
+) -> Iterator[BatchResult]:
+    """在多个进程中分别打开每个存档并调用func(experiment), 按处理完成的顺序生成结果
+
+    func需要能被pickle (e.g. 定义在模块顶层的函数), 其返回值也需要能被pickle。
+    func返回后实验会被关闭但不会被保存, 需要写回存档时请在func中调用`experiment.save()`
+
+    Args:
+        func: 处理一个实验的函数
+        paths: 存档的路径
+        workers: 进程数, 默认为CPU的数量
+        lazy: 是否以lazy模式打开存档, 详见`Experiment`
+    """
+    if not callable(func):
+        raise TypeError(
+            f"Parameter func must be callable, but got value {func} of type `{type(func).__name__}`"
+        )
+    if not isinstance(workers, (int, type(None))) or isinstance(workers, bool):
+        raise TypeError(
+            f"Parameter workers must be of type `Optional[int]`, but got value {workers} of type `{type(workers).__name__}`"
+        )
+    if workers is not None and workers <= 0:
+        raise ValueError(f"Parameter workers must be positive, but got {workers}")
+    if not isinstance(lazy, bool):
+        raise TypeError(
+            f"Parameter lazy must be of type `bool`, but got value {lazy} of type `{type(lazy).__name__}`"
+        )
+
+    abs_paths = []
+    for path in paths:
+        if not isinstance(path, (str, pathlib.Path)):
+            raise TypeError(
+                f"Parameter paths must be an iterable of `str | pathlib.Path`, but got value {path} of type `{type(path).__name__}`"
+            )
+        abs_paths.append(os.path.abspath(path))
+
+    return _iter_results(func, abs_paths, workers, lazy)
+
+
+def _iter_results(
+    func: Callable[[Experiment], Any],
+    paths: List[str],
+    workers: Optional[int],
+    lazy: bool,
+) -> Iterator[BatchResult]:
+    if len(paths) == 0:
+        return
+
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker
+    ) as executor:
+        futures = [executor.submit(_process_sav, func, path, lazy) for path in paths]
+        try:
+            for future in concurrent.futures.as_completed(futures):
+                yield future.result()
+        finally:
+            # 调用者提前停止迭代时, 不再处理剩下的存档
+            for future in futures:
+                future.cancel()
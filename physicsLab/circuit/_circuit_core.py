@@ -4,6 +4,7 @@ import inspect
 
 from physicsLab import errors
 from physicsLab import _tools
+from physicsLab import _sav_writer
 
 from physicsLab.enums import ExperimentType, WireColor
 from physicsLab._tools import round_data
@@ -11,7 +12,9 @@ from physicsLab._core import (
     _Experiment,
     get_current_experiment,
     ElementBase,
+    ElementXYZ,
     elementXYZ_to_native,
+    _copy_value,
 )
 from physicsLab._typing import (
     Optional,
@@ -24,6 +27,10 @@ from physicsLab._typing import (
     List,
     Tuple,
     Iterator,
+    Iterable,
+    Union,
+    Dict,
+    CircuitElementData,
 )
 
 
@@ -64,18 +71,17 @@ class Pin(metaclass=_PinMeta):
         """获取该引脚在该元件中的名字
         @return: (e.g. i_up)
         """
-        for name, a_pin in self.element_self.all_pins():
-            if a_pin == self:
-                return name[1:-4]
-        errors.unreachable()
+        res = self.element_self.pin_names().get(self._pin_label)
+        if res is None:
+            errors.unreachable()
+        return res
 
     def get_wires(self) -> List["Wire"]:
         """获取该引脚上连接的所有导线"""
-        res = []
-        for a_wire in self.element_self.experiment.Wires:
-            if a_wire.Source == self or a_wire.Target == self:
-                res.append(a_wire)
-        return res
+        pin2wires = self.element_self.experiment._wires_index.get(
+            self.element_self._identifier, {}
+        )
+        return list(pin2wires.get(self._pin_label, ()))
 
 
 class InputPin(Pin):
@@ -123,6 +129,19 @@ class Wire:
         self.Target: Pin = target_pin
         self.color: WireColor = color
 
+    @classmethod
+    def _construct(
+        cls, source_pin: Pin, target_pin: Pin, color: WireColor
+    ) -> "Wire":
+        """创建导线, 但不再检查参数
+        仅用于参数已被检查过的情况
+        """
+        self = cls.__new__(cls)
+        self.Source = source_pin
+        self.Target = target_pin
+        self.color = color
+        return self
+
     def __hash__(self) -> int:
         return hash(self.Source) + hash(self.Target)
 
@@ -146,9 +165,9 @@ class Wire:
 
     def release(self) -> dict:
         return {
-            "Source": self.Source.element_self.data["Identifier"],
+            "Source": self.Source.element_self._identifier,
             "SourcePin": self.Source._pin_label,
-            "Target": self.Target.element_self.data["Identifier"],
+            "Target": self.Target.element_self._identifier,
             "TargetPin": self.Target._pin_label,
             "ColorName": f"{self.color.value}色导线",
         }
@@ -174,11 +193,76 @@ def crt_wire(*pins: Pin, color: WireColor = WireColor.blue) -> List[Wire]:
         source_pin, target_pin = pins[i], pins[i + 1]
         a_wire = Wire(source_pin, target_pin, color)
         res.append(a_wire)
-        _expe.Wires.add(a_wire)
+        _expe._link_wire(a_wire)
 
     return res
 
 
+def _pin_from_label(element: "CircuitBase", pin_label: int) -> Pin:
+    pin_name = element.pin_names().get(pin_label)
+    if pin_name is None:
+        raise errors.InvalidWireError(f"{element} does not have pin {pin_label}")
+    return getattr(element, f"_{pin_name}_pin")
+
+
+def crt_wires_bulk(
+    pairs: Iterable[Union[Tuple[Pin, Pin], Tuple[int, int, int, int]]],
+    color: WireColor = WireColor.blue,
+) -> List[Wire]:
+    """批量连接导线, 重复的导线会被忽略
+
+    Args:
+        pairs: 每一项为 (source_pin, target_pin),
+            或 (源元件的index, 源引脚的label, 目标元件的index, 目标引脚的label),
+            其中index与 Experiment.get_element_from_index 一致 (从1开始)
+        color: 所有导线的颜色
+
+    Returns:
+        新连接的导线 (不含被忽略的重复导线)
+    """
+    if not isinstance(color, WireColor):
+        raise TypeError(
+            f"Parameter color must be of type `WireColor`, but got value {color} of type `{type(color).__name__}`"
+        )
+
+    _expe = get_current_experiment()
+    if _expe.experiment_type != ExperimentType.Circuit:
+        raise errors.ExperimentTypeError
+    elements = _expe.Elements
+
+    wires: List[Wire] = []
+    for pair in pairs:
+        if len(pair) == 2:
+            source_pin, target_pin = pair
+            if not isinstance(source_pin, Pin) or not isinstance(target_pin, Pin):
+                raise TypeError(
+                    f"Parameter pairs must be an iterable of `(Pin, Pin)` or `(int, int, int, int)`, but got value {pair}"
+                )
+        elif len(pair) == 4 and all(type(num) is int for num in pair):
+            source_index, source_label, target_index, target_label = pair
+            if not 0 < source_index <= len(elements) or not 0 < target_index <= len(
+                elements
+            ):
+                raise errors.ElementNotFound(f"{pair} out of range")
+            source_pin = _pin_from_label(elements[source_index - 1], source_label)
+            target_pin = _pin_from_label(elements[target_index - 1], target_label)
+        else:
+            raise TypeError(
+                f"Parameter pairs must be an iterable of `(Pin, Pin)` or `(int, int, int, int)`, but got value {pair}"
+            )
+
+        if (
+            source_pin.element_self.experiment is not _expe
+            or target_pin.element_self.experiment is not _expe
+        ):
+            raise errors.InvalidWireError("can't link wire in two experiment")
+        if source_pin == target_pin:
+            raise errors.InvalidWireError("can't link wire to itself")
+        wires.append(Wire._construct(source_pin, target_pin, color))
+
+    return _expe._link_wires(wires)
+
+
 def del_wire(source_pin: Pin, target_pin: Pin) -> None:
     """删除导线"""
     if not isinstance(source_pin, Pin):
@@ -194,7 +278,7 @@ def del_wire(source_pin: Pin, target_pin: Pin) -> None:
     if _expe.experiment_type != ExperimentType.Circuit:
         raise errors.ExperimentTypeError
 
-    _expe.Wires.remove(Wire(source_pin, target_pin))
+    _expe._unlink_wire(Wire(source_pin, target_pin))
 
 
 # electricity class's metaClass
@@ -246,8 +330,23 @@ class _CircuitMeta(type):
                 f"Can't create {cls.__name__} because experiment_type is {_Expe.experiment_type}"
             )
 
+        return cls._construct(_Expe, x, y, z, elementXYZ, identifier, kwargs)
+
+    def _construct(
+        cls,
+        experiment: _Experiment,
+        x: num_type,
+        y: num_type,
+        z: num_type,
+        elementXYZ: Optional[bool],
+        identifier: Optional[str],
+        kwargs: dict,
+    ):
+        """创建元件, 但不再检查参数的类型
+        仅用于参数已被检查过或来自可信的存档数据的情况
+        """
         self: "CircuitBase" = cls.__new__(cls)
-        self.experiment = _Expe
+        self.experiment = experiment
 
         self.__init__(x, y, z, **kwargs)
         assert hasattr(self, "data") and isinstance(self.data, dict)
@@ -255,23 +354,372 @@ class _CircuitMeta(type):
         self._set_identifier(identifier)
         self.set_position(x, y, z, elementXYZ)
         self.set_rotation()
+        self._compact()
 
-        self.experiment.Elements.append(self)
-        self.experiment._id2element[self.data["Identifier"]] = self
+        experiment.Elements.append(self)
+        experiment._id2element[self._identifier] = self
 
         return self
 
+    def _construct_bulk(
+        cls,
+        experiment: _Experiment,
+        positions: List[Tuple[num_type, num_type, num_type]],
+        elementXYZ: Optional[bool],
+        kwargs: dict,
+    ) -> List["CircuitBase"]:
+        """批量创建元件, 但不再检查参数的类型
+        与逐个调用`_construct`的结果一致, 但坐标的转换与索引的更新对整批元件一次完成
+
+        Args:
+            positions: 已经round_data过的坐标
+        """
+        is_elementXYZ: bool = (
+            elementXYZ is True or experiment.is_elementXYZ is True and elementXYZ is None
+        )
+        if is_elementXYZ:
+            # 与 elementXYZ_to_native 的运算顺序保持一致
+            origin = experiment._elementXYZ_origin_position
+            natives = [
+                (
+                    x * ElementXYZ._X_UNIT + origin.x,
+                    y * ElementXYZ._Y_UNIT + origin.y,
+                    z * ElementXYZ._Z_UNIT + origin.z,
+                )
+                for x, y, z in positions
+            ]
+            if cls.is_bigElement:
+                natives = [(x, y + ElementXYZ._Y_AMEND, z) for x, y, z in natives]
+        else:
+            natives = positions
+
+        # set_rotation() 的默认值
+        rotation = f"{round_data(0)},{round_data(180)},{round_data(0)}"
+
+        identifiers = experiment._new_identifiers(len(positions))
+
+        res: List["CircuitBase"] = []
+        for (x, y, z), (native_x, native_y, native_z), identifier in zip(
+            positions, natives, identifiers
+        ):
+            self: "CircuitBase" = cls.__new__(cls)
+            self.experiment = experiment
+            self.__init__(x, y, z, **kwargs)
+            assert hasattr(self, "data") and isinstance(self.data, dict)
+
+            self._set_identifier(identifier)
+            self._position = _tools.position(x, y, z)
+            self.is_elementXYZ = is_elementXYZ
+            self.data["Position"] = (
+                f"{round_data(native_x)},{round_data(native_z)},{round_data(native_y)}"
+            )
+            self.data["Rotation"] = rotation
+            self._compact()
+            res.append(self)
+
+        experiment._register_elements(res)
+
+        return res
+
+    def _construct_loaded(
+        cls,
+        experiment: _Experiment,
+        x: num_type,
+        y: num_type,
+        z: num_type,
+        identifier: str,
+        kwargs: dict,
+    ):
+        """根据存档中的数据创建元件, 但不将其加入实验
+        x, y, z为物实坐标系下的坐标, 元件之后需要通过`Experiment._register_elements`加入实验
+        """
+        self: "CircuitBase" = cls.__new__(cls)
+        self.experiment = experiment
+        self.__init__(x, y, z, **kwargs)
+        assert hasattr(self, "data") and isinstance(self.data, dict)
+
+        x, y, z = round_data(x), round_data(y), round_data(z)
+        self._set_data_field("Identifier", identifier)
+        self._position = _tools.position(x, y, z)
+        self.is_elementXYZ = False
+        self._set_data_field("Position", f"{x},{z},{y}")
+        self.set_rotation()
+        self._compact()
+
+        return self
+
+
+# 共享的data模板中由各元件自己保存的字段的占位符
+_INSTANCE_FIELD = object()
+# 紧凑存储时保存在元件的slot中的字段
+_INSTANCE_FIELDS = {
+    "Identifier": "_compact_identifier",
+    "Properties": "_compact_properties",
+    "Position": "_compact_position",
+    "Rotation": "_compact_rotation",
+}
+
+
+def _is_same_value(a, b) -> bool:
+    """a与b是否相等且写入存档的结果一致 (e.g. 1与True相等, 但写入存档的结果不同)"""
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, dict):
+        return len(a) == len(b) and all(
+            ka == kb and _is_same_value(va, vb)
+            for (ka, va), (kb, vb) in zip(a.items(), b.items())
+        )
+    if isinstance(a, list):
+        return len(a) == len(b) and all(map(_is_same_value, a, b))
+    return a == b
+
+
+class _Properties(dict):
+    """紧凑存储的元件的Properties, 被修改时会记录下来, 以便保存时只重新编码被修改过的元件"""
+
+    __slots__ = ("_modified",)
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._modified: bool = True
+
+    def __setitem__(self, key, value) -> None:
+        self._modified = True
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key) -> None:
+        self._modified = True
+        super().__delitem__(key)
+
+    def __ior__(self, other) -> Self:
+        # dict在python3.9之前没有__ior__
+        self.update(other)
+        return self
+
+    def update(self, *args, **kwargs) -> None:
+        self._modified = True
+        super().update(*args, **kwargs)
+
+    def setdefault(self, key, default=None):
+        self._modified = True
+        return super().setdefault(key, default)
+
+    def pop(self, *args):
+        self._modified = True
+        return super().pop(*args)
+
+    def popitem(self):
+        self._modified = True
+        return super().popitem()
+
+    def clear(self) -> None:
+        self._modified = True
+        super().clear()
+
 
 class CircuitBase(ElementBase, metaclass=_CircuitMeta):
-    """所有电学元件的父类"""
+    """所有电学元件的父类
+
+    创建元件后, 若data除Identifier, Properties, Position, Rotation以外的部分与
+    同类元件共享的模板一致, 则只在slot中保存这几项, 完整的data在第一次被读取时才生成
+    紧凑存储的元件还会缓存其写入存档的json, 直到元件被修改
+    """
+
+    __slots__ = (
+        "_data",
+        "_compact_identifier",
+        "_compact_properties",
+        "_position_str",
+        "_pending_position",
+        "_compact_rotation",
+        "_json_cache",
+        "_json_cache_compact",
+    )
 
     experiment: _Experiment  # 元件所属的实验
     is_elementXYZ: bool
     is_bigElement = False  # 该元件是否是逻辑电路的两体积元件
+    # 同类元件共享的data模板, 由_compact为每个类分别生成, 不会被子类继承
+    _data_template: Optional[dict] = None
+    # 同类元件共享的 引脚的label -> 引脚名, 由pin_names为每个类分别生成, 不会被子类继承
+    _pin_names: Optional[Dict[int, str]] = None
 
     def __init__(*args, **kwargs) -> NoReturn:
         raise NotImplementedError
 
+    @property
+    def data(self) -> CircuitElementData:
+        """元件在存档中对应的dict"""
+        if self._data is None:
+            self._data = self._materialize(copy=True)
+            # data可能被任意修改, 因此不再使用缓存的json
+            self._json_cache = None
+        return self._data
+
+    @data.setter
+    def data(self, data: CircuitElementData) -> None:
+        self._data = data
+
+    @property
+    def _compact_position(self) -> str:
+        """紧凑存储的元件的Position, 被批量移动的元件在第一次读取时 (e.g. 保存时) 才生成"""
+        pending = self._pending_position
+        if pending is not None:
+            x, y, z = pending
+            self._position_str = f"{round(x, 6)},{round(z, 6)},{round(y, 6)}"
+            self._pending_position = None
+        return self._position_str
+
+    @_compact_position.setter
+    def _compact_position(self, value: str) -> None:
+        self._position_str = value
+        self._pending_position = None
+
+    @override
+    def _set_native_position(self, x: num_type, y: num_type, z: num_type) -> None:
+        if self._data is not None:
+            super()._set_native_position(x, y, z)
+            return
+        self._pending_position = (x, y, z)
+        self._json_cache = None
+
+    def _materialize(self, copy: bool) -> dict:
+        """由模板与slot生成完整的data
+
+        Args:
+            copy: 是否复制模板中的值, 为False时生成的dict只能用于写入存档
+        """
+        res: dict = type(self).__dict__["_data_template"].copy()
+        res["Identifier"] = self._compact_identifier
+        res["Properties"] = self._compact_properties
+        res["Position"] = self._compact_position
+        res["Rotation"] = self._compact_rotation
+        if copy:
+            for key, value in res.items():
+                if key not in _INSTANCE_FIELDS and isinstance(value, (dict, list)):
+                    res[key] = _copy_value(value)
+        return res
+
+    def _compact(self) -> None:
+        """若data与该类的模板一致, 则改为紧凑存储"""
+        if type(self).data is not CircuitBase.data:
+            # e.g. Simple_Instrument, 其data有额外的逻辑
+            return
+        data = self._data
+        if data is None:
+            return
+
+        if not all(key in data for key in _INSTANCE_FIELDS) or not isinstance(
+            data["Properties"], dict
+        ):
+            return
+
+        cls = type(self)
+        template: Optional[dict] = cls.__dict__.get("_data_template")
+        if template is None:
+            template = {
+                key: _INSTANCE_FIELD if key in _INSTANCE_FIELDS else _copy_value(value)
+                for key, value in data.items()
+            }
+            cls._data_template = template
+        elif len(template) != len(data) or not all(
+            key == data_key
+            and (value is _INSTANCE_FIELD or _is_same_value(value, data_value))
+            for (key, value), (data_key, data_value) in zip(
+                template.items(), data.items()
+            )
+        ):
+            return
+
+        for key, slot in _INSTANCE_FIELDS.items():
+            setattr(self, slot, data[key])
+        self._compact_properties = _Properties(data["Properties"])
+        self._json_cache = None
+        self._json_cache_compact = False
+        self._data = None
+
+    @override
+    def _clone(self, experiment: _Experiment, identifier: str) -> Self:
+        cls = type(self)
+        res = cls.__new__(cls)
+        # 引脚需要指向复制出的元件, 按label重新创建
+        pins = {
+            a_pin._pin_label: type(a_pin)(res, a_pin._pin_label)
+            for _, a_pin in self.all_pins()
+        }
+        for key, value in self.__dict__.items():
+            if isinstance(value, Pin):
+                value = pins[value._pin_label]
+            elif key == "_all_pins":
+                value = tuple((name, pins[a_pin._pin_label]) for name, a_pin in value)
+            elif isinstance(value, (dict, list)):
+                value = _copy_value(value)
+            res.__dict__[key] = value
+        res.experiment = experiment
+
+        if self._data is None:
+            # 紧凑存储的元件只需复制slot, 模板仍与同类元件共享
+            res._data = None
+            res._compact_identifier = identifier
+            res._compact_properties = _Properties(_copy_value(self._compact_properties))
+            res._position_str = self._position_str
+            res._pending_position = self._pending_position
+            res._compact_rotation = self._compact_rotation
+            res._json_cache = None
+            res._json_cache_compact = False
+        else:
+            res._data = _copy_value(self._data)
+            res._set_data_field("Identifier", identifier)
+        return res
+
+    @property
+    @override
+    def _identifier(self) -> str:
+        if self._data is None:
+            return self._compact_identifier
+        return self.data["Identifier"]
+
+    @override
+    def _get_data_field(self, key: str):
+        if self._data is None and key in _INSTANCE_FIELDS:
+            return getattr(self, _INSTANCE_FIELDS[key])
+        return self.data[key]
+
+    @override
+    def _set_data_field(self, key: str, value) -> None:
+        if self._data is None and key in _INSTANCE_FIELDS:
+            if key == "Properties":
+                value = _Properties(value)
+            setattr(self, _INSTANCE_FIELDS[key], value)
+            self._json_cache = None
+        else:
+            self.data[key] = value
+
+    @override
+    def _dump_data(self) -> dict:
+        if self._data is None:
+            return self._materialize(copy=False)
+        return self.data
+
+    @override
+    def _dump_json(self, compact: bool) -> str:
+        if self._data is not None:
+            return super()._dump_json(compact)
+
+        properties: _Properties = self._compact_properties
+        if (
+            self._json_cache is not None
+            and self._json_cache_compact is compact
+            and not properties._modified
+        ):
+            return self._json_cache
+
+        res = _sav_writer.encode_element(self._materialize(copy=False), compact)
+        self._json_cache = res
+        self._json_cache_compact = compact
+        properties._modified = False
+        return res
+
     def __repr__(self) -> str:
         return (
             f"{self.__class__.__name__}"
@@ -283,7 +731,7 @@ class CircuitBase(ElementBase, metaclass=_CircuitMeta):
     @final
     def properties(self) -> dict:
         """返回元件的属性"""
-        return self.data["Properties"]
+        return self._get_data_field("Properties")
 
     @final
     def set_rotation(
@@ -304,7 +752,7 @@ class CircuitBase(ElementBase, metaclass=_CircuitMeta):
             )
 
         x_r, y_r, z_r = round_data(x_r), round_data(y_r), round_data(z_r)
-        self.data["Rotation"] = f"{x_r},{z_r},{y_r}"
+        self._set_data_field("Rotation", f"{x_r},{z_r},{y_r}")
         return self
 
     @override
@@ -355,6 +803,11 @@ class CircuitBase(ElementBase, metaclass=_CircuitMeta):
 
         return super().set_position(x, y, z)
 
+    @final
+    def get_wires(self) -> List[Wire]:
+        """获取连接在该元件上的所有导线"""
+        return self.experiment.wires_of(self)
+
     @property
     @final
     def lock(self) -> bool:
@@ -379,13 +832,29 @@ class CircuitBase(ElementBase, metaclass=_CircuitMeta):
     @final
     def modelID(self) -> str:
         """存档的modelID"""
-        assert not isinstance(self.data["ModelID"], type(Generate))
-        return self.data["ModelID"]
+        model_id = self._get_data_field("ModelID")
+        assert not isinstance(model_id, type(Generate))
+        return model_id
 
     @abc.abstractmethod
     def all_pins(self) -> Iterator[Tuple[str, Pin]]:
         raise NotImplementedError
 
+    @final
+    def pin_names(self) -> Dict[int, str]:
+        """引脚的label -> 引脚名 (e.g. {0: "i_up"})
+        同类元件共享同一个dict, 调用者不应修改其内容
+        """
+        cls = type(self)
+        res: Optional[Dict[int, str]] = cls.__dict__.get("_pin_names")
+        if res is not None:
+            return res
+
+        # 所有元件的引脚都只由类决定, 因此可以按类缓存
+        res = {a_pin._pin_label: name[1:-4] for name, a_pin in self.all_pins()}
+        cls._pin_names = res
+        return res
+
     @final
     @classmethod
     def get_all_pins_property(cls):
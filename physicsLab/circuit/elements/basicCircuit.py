@@ -37,7 +37,7 @@ class _SwitchBase(CircuitBase):
 
     def turn_off_switch(self) -> Self:
         """断开开关"""
-        self.data["Properties"]["开关"] = 0
+        self.properties["开关"] = 0
         return self
 
 
@@ -94,13 +94,13 @@ class Simple_Switch(_SwitchBase):
             f"elementXYZ={self.is_elementXYZ})"
         )
 
-        if self.data["Properties"]["开关"] == 1:
+        if self.properties["开关"] == 1:
             res += ".turn_on_switch()"
         return res
 
     def turn_on_switch(self) -> Self:
         """闭合开关"""
-        self.data["Properties"]["开关"] = 1
+        self.properties["开关"] = 1
         return self
 
 
@@ -151,20 +151,20 @@ class SPDT_Switch(_SwitchBase):
             f"elementXYZ={self.is_elementXYZ})"
         )
 
-        if self.data["Properties"]["开关"] == 1:
+        if self.properties["开关"] == 1:
             res += ".left_turn_on_switch()"
-        elif self.data["Properties"]["开关"] == 2:
+        elif self.properties["开关"] == 2:
             res += ".right_turn_on_switch()"
         return res
 
     def left_turn_on_switch(self) -> Self:
         """向左闭合开关"""
-        self.data["Properties"]["开关"] = 1
+        self.properties["开关"] = 1
         return self
 
     def right_turn_on_switch(self) -> Self:
         """向右闭合开关"""
-        self.data["Properties"]["开关"] = 2
+        self.properties["开关"] = 2
         return self
 
     @property
@@ -240,21 +240,21 @@ class DPDT_Switch(_SwitchBase):
             f"elementXYZ={self.is_elementXYZ})"
         )
 
-        if self.data["Properties"]["开关"] == 1:
+        if self.properties["开关"] == 1:
             res += ".left_turn_on_switch()"
-        elif self.data["Properties"]["开关"] == 2:
+        elif self.properties["开关"] == 2:
             res += ".right_turn_on_switch()"
         return res
 
     # TODO 改为enum是否会更好
     def left_turn_on_switch(self) -> Self:
         """向左闭合开关"""
-        self.data["Properties"]["开关"] = 1
+        self.properties["开关"] = 1
         return self
 
     def right_turn_on_switch(self) -> Self:
         """向右闭合开关"""
-        self.data["Properties"]["开关"] = 2
+        self.properties["开关"] = 2
         return self
 
     @property
@@ -412,18 +412,18 @@ class Air_Switch(CircuitBase):
             f"elementXYZ={self.is_elementXYZ})"
         )
 
-        if self.data["Properties"]["开关"] == 1:
+        if self.properties["开关"] == 1:
             res += ".turn_on_switch()"
         return res
 
     def turn_off_switch(self) -> Self:
         """断开开关"""
-        self.data["Properties"]["开关"] = 0
+        self.properties["开关"] = 0
         return self
 
     def turn_on_switch(self) -> Self:
         """闭合开关"""
-        self.data["Properties"]["开关"] = 1
+        self.properties["开关"] = 1
         return self
 
 
@@ -1596,14 +1596,14 @@ class Eight_Bit_Input(_LogicBase):
             f"elementXYZ={self.is_elementXYZ})"
         )
 
-        if self.data["Properties"]["十进制"] != 0:
-            res += f".set_num({self.data['Properties']['十进制']})"
+        if self.properties["十进制"] != 0:
+            res += f".set_num({self.properties['十进制']})"
         return res
 
     # TODO 改为@property
     def set_num(self, num: int):
         if 0 <= num <= 255:
-            self.data["Properties"]["十进制"] = num
+            self.properties["十进制"] = num
         else:
             raise RuntimeError("The number range entered is incorrect")
 
@@ -342,6 +342,11 @@ def _to_phy_engine_element(element) -> Tuple[int, List[float]]:
     )
 
 
+def _count_pins(elements) -> int:
+    # pin_names按类缓存, 因此每个元件只需O(1)
+    return sum(len(e.pin_names()) for e in elements)
+
+
 def _analyze_type_value(analyze_type: Union[str, int]) -> int:
     if isinstance(analyze_type, int):
         return int(analyze_type)
@@ -393,6 +398,7 @@ class PhyEngineCircuit:
         self._comp_elements: List[object] = []
         self._comp_codes: List[int] = []
         self._comp_index: Dict[object, int] = {}
+        self._buffers: Tuple[ctypes.Array, ...] = ()
 
         self._create()
 
@@ -470,6 +476,44 @@ class PhyEngineCircuit:
         self._comp_codes = comp_codes[: int(comp_size.value)]
         self._comp_index = {e: i for i, e in enumerate(self._comp_elements)}
 
+        # The topology is fixed once created, so the pin/branch counts and the output
+        # buffers are computed once and reused by every analyze call.
+        comp_count = len(self._comp_elements)
+        total_pins = _count_pins(self._comp_elements)
+        total_branches = sum(int(_ELEMENT_BRANCHES.get(code, 0)) for code in self._comp_codes)
+        total_branches = max(total_branches, total_pins)
+        self._buffers = (
+            (ctypes.c_double * max(1, total_pins))(),
+            (ctypes.c_size_t * (comp_count + 1))(),
+            (ctypes.c_double * max(1, total_branches))(),
+            (ctypes.c_size_t * (comp_count + 1))(),
+            (ctypes.c_bool * max(1, total_pins))(),
+            (ctypes.c_size_t * (comp_count + 1))(),
+        )
+
+    def _read_sample(self) -> PhyEngineSample:
+        # Copy out of the shared buffers: they are overwritten by the next analyze call.
+        voltage, voltage_ord, current, current_ord, digital, digital_ord = self._buffers
+        voltage_ord = voltage_ord[:]
+        current_ord = current_ord[:]
+        digital_ord = digital_ord[:]
+
+        pin_voltage: Dict[object, List[float]] = {}
+        pin_digital: Dict[object, List[bool]] = {}
+        branch_current: Dict[object, List[float]] = {}
+
+        for i, e in enumerate(self._comp_elements):
+            pin_voltage[e] = voltage[voltage_ord[i] : voltage_ord[i + 1]]
+            pin_digital[e] = digital[digital_ord[i] : digital_ord[i + 1]]
+            branch_current[e] = current[current_ord[i] : current_ord[i + 1]]
+
+        return PhyEngineSample(
+            elements=list(self._comp_elements),
+            pin_voltage=pin_voltage,
+            pin_digital=pin_digital,
+            branch_current=branch_current,
+        )
+
     def _configure_analyzer(
         self,
         analyze_type: Union[str, int],
@@ -535,23 +579,7 @@ class PhyEngineCircuit:
                 raise PhyEngineAnalyzeError("Phy-Engine circuit_digital_clk() failed")
 
         comp_size = int(self._comp_size.value)
-        total_pins = 0
-        for e in self._comp_elements:
-            count_all_pins = getattr(type(e), "count_all_pins", None)
-            if callable(count_all_pins):
-                total_pins += int(count_all_pins())
-            else:
-                total_pins += sum(1 for _ in e.all_pins())
-
-        total_branches = sum(int(_ELEMENT_BRANCHES.get(code, 0)) for code in self._comp_codes)
-        total_branches = max(total_branches, total_pins)
-
-        voltage = (ctypes.c_double * max(1, total_pins))()
-        voltage_ord = (ctypes.c_size_t * (comp_size + 1))()
-        current = (ctypes.c_double * max(1, total_branches))()
-        current_ord = (ctypes.c_size_t * (comp_size + 1))()
-        digital = (ctypes.c_bool * max(1, total_pins))()
-        digital_ord = (ctypes.c_size_t * (comp_size + 1))()
+        voltage, voltage_ord, current, current_ord, digital, digital_ord = self._buffers
 
         rc = self._lib.circuit_sample(
             self._circuit_ptr,
@@ -568,28 +596,7 @@ class PhyEngineCircuit:
         if rc != 0:
             raise PhyEngineAnalyzeError(f"Phy-Engine circuit_sample() failed (rc={rc})")
 
-        pin_voltage: Dict[object, List[float]] = {}
-        pin_digital: Dict[object, List[bool]] = {}
-        branch_current: Dict[object, List[float]] = {}
-
-        for i, e in enumerate(self._comp_elements):
-            v0 = int(voltage_ord[i])
-            v1 = int(voltage_ord[i + 1])
-            d0 = int(digital_ord[i])
-            d1 = int(digital_ord[i + 1])
-            c0 = int(current_ord[i])
-            c1 = int(current_ord[i + 1])
-
-            pin_voltage[e] = [float(voltage[j]) for j in range(v0, v1)]
-            pin_digital[e] = [bool(digital[j]) for j in range(d0, d1)]
-            branch_current[e] = [float(current[j]) for j in range(c0, c1)]
-
-        return PhyEngineSample(
-            elements=list(self._comp_elements),
-            pin_voltage=pin_voltage,
-            pin_digital=pin_digital,
-            branch_current=branch_current,
-        )
+        return self._read_sample()
 
     def set_digital_state(self, element, state: int, *, attribute_index: int = 0) -> None:
         """Set a digital attribute on an element without rebuilding the circuit.
@@ -659,23 +666,7 @@ class PhyEngineCircuit:
             changed_prop.append(float(value))
 
         comp_size = int(self._comp_size.value)
-        total_pins = 0
-        for e in self._comp_elements:
-            count_all_pins = getattr(type(e), "count_all_pins", None)
-            if callable(count_all_pins):
-                total_pins += int(count_all_pins())
-            else:
-                total_pins += sum(1 for _ in e.all_pins())
-
-        total_branches = sum(int(_ELEMENT_BRANCHES.get(code, 0)) for code in self._comp_codes)
-        total_branches = max(total_branches, total_pins)
-
-        voltage = (ctypes.c_double * max(1, total_pins))()
-        voltage_ord = (ctypes.c_size_t * (comp_size + 1))()
-        current = (ctypes.c_double * max(1, total_branches))()
-        current_ord = (ctypes.c_size_t * (comp_size + 1))()
-        digital = (ctypes.c_bool * max(1, total_pins))()
-        digital_ord = (ctypes.c_size_t * (comp_size + 1))()
+        voltage, voltage_ord, current, current_ord, digital, digital_ord = self._buffers
 
         if changed_ele:
             changed_ele_arr = (ctypes.c_int * len(changed_ele))(*changed_ele)
@@ -725,28 +716,7 @@ class PhyEngineCircuit:
             if rc != 0:
                 raise PhyEngineAnalyzeError(f"Phy-Engine circuit_sample() failed (rc={rc})")
 
-        pin_voltage: Dict[object, List[float]] = {}
-        pin_digital: Dict[object, List[bool]] = {}
-        branch_current: Dict[object, List[float]] = {}
-
-        for i, e in enumerate(self._comp_elements):
-            v0 = int(voltage_ord[i])
-            v1 = int(voltage_ord[i + 1])
-            d0 = int(digital_ord[i])
-            d1 = int(digital_ord[i + 1])
-            c0 = int(current_ord[i])
-            c1 = int(current_ord[i + 1])
-
-            pin_voltage[e] = [float(voltage[j]) for j in range(v0, v1)]
-            pin_digital[e] = [bool(digital[j]) for j in range(d0, d1)]
-            branch_current[e] = [float(current[j]) for j in range(c0, c1)]
-
-        return PhyEngineSample(
-            elements=list(self._comp_elements),
-            pin_voltage=pin_voltage,
-            pin_digital=pin_digital,
-            branch_current=branch_current,
-        )
+        return self._read_sample()
 
 
 def analyze_experiment_with_phy_engine(
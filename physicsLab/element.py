@@ -3,20 +3,88 @@ import os
 import copy
 import json
 import pathlib
+import threading
 
 from . import _tools
 from . import errors
 from . import savTemplate
+from . import _json_codec
 from physicsLab import circuit
 from physicsLab import celestial
 from physicsLab import electromagnetism
 from .web.api import User
 from .web.api import anonymous_login
 from .savTemplate import Generate
-from .circuit._circuit_core import crt_wire, Pin
+from ._sav_reader import read_sav_header
+from .circuit._circuit_core import Wire, Pin
 from .enums import ExperimentType, Category, OpenMode, WireColor
-from ._core import _Experiment, _ExperimentStack, _check_not_closed, ElementBase
-from ._typing import num_type, Optional, Union, List, overload, Tuple, Self, Dict
+from ._core import (
+    _Experiment,
+    _ExperimentStack,
+    _ElementList,
+    _check_not_closed,
+    ElementBase,
+)
+from ._typing import (
+    num_type,
+    Optional,
+    Union,
+    List,
+    overload,
+    Tuple,
+    Self,
+    Dict,
+    Iterable,
+    Any,
+    TYPE_CHECKING,
+)
+
+
+def _element_classes(module, base: type) -> Dict[str, type]:
+    """获取module中所有元件的类, 以类名为键"""
+    return {
+        name: obj
+        for name, obj in vars(module).items()
+        if isinstance(obj, type) and issubclass(obj, base)
+    }
+
+
+# 通过元件的类名 (或将ModelID中的" "与"-"替换为"_"后的名字) 索引元件的类
+_ELEMENT_CLASSES: Dict[ExperimentType, Dict[str, type]] = {
+    ExperimentType.Circuit: {
+        **_element_classes(circuit, circuit.CircuitBase),
+        "555_Timer": circuit.NE555,
+        "8bit_Input": circuit.Eight_Bit_Input,
+        "8bit_Display": circuit.Eight_Bit_Display,
+    },
+    ExperimentType.Celestial: _element_classes(celestial, celestial.PlanetBase),
+    ExperimentType.Electromagnetism: _element_classes(
+        electromagnetism, electromagnetism.ElectromagnetismBase
+    ),
+}
+
+
+def _get_element_class(experiment_type: ExperimentType, name: str) -> type:
+    """通过元件的ModelID或其类名获取元件的类"""
+    name = name.strip().replace(" ", "_").replace("-", "_")
+    res = _ELEMENT_CLASSES[experiment_type].get(name)
+    if res is None:
+        raise errors.ElementNotFound(f"Unknown element `{name}` in {experiment_type}")
+    return res
+
+
+# 存档中导线颜色名的首字 -> 导线颜色
+_WIRE_COLORS: Dict[str, WireColor] = {
+    "蓝": WireColor.blue,
+    "红": WireColor.red,
+    "绿": WireColor.green,
+    "黄": WireColor.yellow,
+    "黑": WireColor.black,
+}
+
+# 以lazy模式打开存档时, 在第一次被访问时才生成的元件与导线的索引
+_LAZY_ELEMENT_ATTRS = ("Elements", "_id2element", "_position2elements", "_element2position")
+_LAZY_WIRE_ATTRS = ("Wires", "_wires_index")
 
 
 def _get_all_pl_sav() -> List[str]:
@@ -35,7 +103,7 @@ def _open_sav(sav_path) -> dict:
     def encode_sav(path: str, encoding: str) -> Optional[dict]:
         try:
             with open(path, encoding=encoding) as f:
-                d = json.loads(f.read().replace("\n", ""))
+                d = _json_codec.loads(f.read().replace("\n", ""))
         except (json.decoder.JSONDecodeError, UnicodeDecodeError):  # 文件不是物实存档
             return None
         else:
@@ -64,6 +132,46 @@ def _open_sav(sav_path) -> dict:
     raise errors.InvalidSavError
 
 
+# 缓存 存档文件名 -> 存档名(InternalName) 的索引文件, 位于SAV_PATH_DIR下
+# 以文件的修改时间与大小判断索引是否过期, 仅重新读取发生了变化的存档
+_SAV_INDEX_FILENAME = ".physicsLab_sav_index.json"
+_SAV_INDEX_VERSION = 1
+
+
+def _load_sav_index() -> Dict[str, dict]:
+    """读取存档目录的索引, 索引不存在或已损坏时返回空索引"""
+    index_path = os.path.join(_Experiment.SAV_PATH_DIR, _SAV_INDEX_FILENAME)
+    try:
+        with open(index_path, encoding="utf-8") as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+    if (
+        not isinstance(index, dict)
+        or index.get("Version") != _SAV_INDEX_VERSION
+        or not isinstance(index.get("Files"), dict)
+    ):
+        return {}
+    return index["Files"]
+
+
+def _dump_sav_index(files: Dict[str, dict]) -> None:
+    """写入存档目录的索引 (先写入临时文件再替换, 避免索引写坏)"""
+    index_path = os.path.join(_Experiment.SAV_PATH_DIR, _SAV_INDEX_FILENAME)
+    # 每个线程使用各自的临时文件, 使同时打开实验的多个线程不会写坏彼此的索引
+    temp_path = f"{index_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"Version": _SAV_INDEX_VERSION, "Files": files}, f, ensure_ascii=False
+            )
+        os.replace(temp_path, index_path)
+    except OSError:
+        # 索引仅用于加速, 写入失败 (e.g. 没有写权限) 时不影响search_experiment的结果
+        pass
+
+
 def search_experiment(sav_name: str) -> Tuple[Optional[str], Optional[dict]]:
     """检测实验是否存在, 若存在则返回存档对应的文件名, 若不存在则返回None
 
@@ -75,34 +183,88 @@ def search_experiment(sav_name: str) -> Tuple[Optional[str], Optional[dict]]:
             f"Parameter sav_name must be of type `str`, but got `{type(sav_name).__name__}`"
         )
 
-    for a_sav in _get_all_pl_sav():
+    files = _load_sav_index()
+    is_index_changed: bool = False
+    res: Tuple[Optional[str], Optional[dict]] = (None, None)
+
+    all_savs = _get_all_pl_sav()
+    for a_sav in all_savs:
+        sav_path = os.path.join(_Experiment.SAV_PATH_DIR, a_sav)
+        try:
+            stat = os.stat(sav_path)
+        except OSError:
+            continue
+
+        entry = files.get(a_sav)
+        if (
+            not isinstance(entry, dict)
+            or entry.get("MTime") != stat.st_mtime_ns
+            or entry.get("Size") != stat.st_size
+        ):
+            # 只读取存档的元信息, 不解码StatusSave
+            try:
+                internal_name = read_sav_header(sav_path)["InternalName"]
+            except errors.InvalidSavError:
+                internal_name = None
+            entry = {
+                "MTime": stat.st_mtime_ns,
+                "Size": stat.st_size,
+                "InternalName": internal_name,
+            }
+            files[a_sav] = entry
+            is_index_changed = True
+
+        if entry["InternalName"] != sav_name:
+            continue
         try:
-            sav = _open_sav(os.path.join(_Experiment.SAV_PATH_DIR, a_sav))
+            sav = _open_sav(sav_path)
         except errors.InvalidSavError:
             continue
-        if sav.get("InternalName") == sav_name:
-            return a_sav, sav
+        if isinstance(sav, dict) and sav.get("InternalName") == sav_name:
+            res = (a_sav, sav)
+            break
+
+    # 移除已被删除的存档
+    exist_savs = set(all_savs)
+    for a_sav in [a_sav for a_sav in files if a_sav not in exist_savs]:
+        del files[a_sav]
+        is_index_changed = True
 
-    return None, None
+    if is_index_changed:
+        _dump_sav_index(files)
+
+    return res
 
 
 class Experiment(_Experiment):
+    # 以lazy模式打开的存档中尚未导入的元件与导线的数据
+    _lazy_elements: Optional[list] = None
+    _lazy_wires: Optional[list] = None
+
     @overload
-    def __init__(self, open_mode: OpenMode, filepath: Union[str, pathlib.Path]) -> None:
+    def __init__(
+        self,
+        open_mode: OpenMode,
+        filepath: Union[str, pathlib.Path],
+        *,
+        lazy: bool = False,
+    ) -> None:
         """根据存档对应的文件路径打开存档
 
         Args:
             open_mode = OpenMode.load_by_filepath
             filepath: 存档对应的文件的完整路径
+            lazy: 是否在第一次访问元件或导线时才导入它们
         """
 
     @overload
-    def __init__(self, open_mode: OpenMode, sav_name: str) -> None:
+    def __init__(self, open_mode: OpenMode, sav_name: str, *, lazy: bool = False) -> None:
         """根据存档名打开存档
 
         Args:
             open_mode = OpenMode.load_by_sav_name
             sav_name: 存档的名字
+            lazy: 是否在第一次访问元件或导线时才导入它们
         """
 
     @overload
@@ -114,6 +276,7 @@ class Experiment(_Experiment):
         /,
         *,
         user: Optional[User] = None,
+        lazy: bool = False,
     ) -> None:
         """从物实服务器中获取存档
 
@@ -122,6 +285,7 @@ class Experiment(_Experiment):
             content_id: 物实 实验/讨论 的id
             category: 实验区还是黑洞区
             user: 执行获取实验操作的用户, 若未指定则会创建一个临时匿名用户执行该操作 (会导致程序变慢)
+            lazy: 是否在第一次访问元件或导线时才导入它们
         """
 
     @overload
@@ -150,28 +314,37 @@ class Experiment(_Experiment):
             )
 
         self.open_mode: OpenMode = open_mode
+        lazy = False
+        if open_mode != OpenMode.crt:
+            lazy = kwargs.pop("lazy", False)
+            if not isinstance(lazy, bool):
+                raise TypeError(
+                    f"Parameter lazy must be of type `bool`, but got `{type(lazy).__name__}`"
+                )
         # 通过坐标索引元件
         self._position2elements = {}
+        # 元件当前所在的坐标 (_position2elements的反向索引)
+        self._element2position = {}
         # 通过元件的Identifier索引元件
         self._id2element = {}
         # 通过index（元件生成顺序）索引元件
-        self.Elements = []
+        self.Elements = _ElementList()
 
         # 尽管读取存档时会将元件的字符串一并读入, 但只有在调用 load_elements 将元件的信息
         # 导入self.Elements与self._element_position之后, 元件信息才被完全导入
         if open_mode == OpenMode.load_by_filepath:
             if len(kwargs) == 1:
                 raise TypeError(
-                    f"When open_mode is OpenMode.load_by_filepath, constructor is `def __init__(self, open_mode: OpenMode, filepath: str | pathlib.Path) -> None`, but an unexpected keyword argument is gotten: {list(kwargs.keys())[0]}={list(kwargs.values())[0]}"
+                    f"When open_mode is OpenMode.load_by_filepath, constructor is `def __init__(self, open_mode: OpenMode, filepath: str | pathlib.Path, *, lazy: bool = False) -> None`, but an unexpected keyword argument is gotten: {list(kwargs.keys())[0]}={list(kwargs.values())[0]}"
                 )
             elif len(kwargs) != 0:
                 raise TypeError(
-                    f"When open_mode is OpenMode.load_by_filepath, constructor is `def __init__(self, open_mode: OpenMode, filepath: str | pathlib.Path) -> None`, but unexpected keyword arguments are gotten: {''.join(str(key) + '=' + str(value) + ' ' for key, value in kwargs.items())}"
+                    f"When open_mode is OpenMode.load_by_filepath, constructor is `def __init__(self, open_mode: OpenMode, filepath: str | pathlib.Path, *, lazy: bool = False) -> None`, but unexpected keyword arguments are gotten: {''.join(str(key) + '=' + str(value) + ' ' for key, value in kwargs.items())}"
                 )
 
             if len(args) != 1:
                 raise TypeError(
-                    f"When open_mode is OpenMode.load_by_filepath, constructor is `def __init__(self, open_mode: OpenMode, filepath: str | pathlib.Path) -> None`, but got {len(args)} positional arguments"
+                    f"When open_mode is OpenMode.load_by_filepath, constructor is `def __init__(self, open_mode: OpenMode, filepath: str | pathlib.Path, *, lazy: bool = False) -> None`, but got {len(args)} positional arguments"
                 )
             sav_name = args[0]
             if not isinstance(sav_name, (str, pathlib.Path)):
@@ -208,16 +381,16 @@ class Experiment(_Experiment):
         elif open_mode == OpenMode.load_by_sav_name:
             if len(kwargs) == 1:
                 raise TypeError(
-                    f"When open_mode is OpenMode.load_by_sav_name, constructor is `def __init__(self, open_mode: OpenMode, sav_name: str) -> None`, but an unexpected keyword argument is gotten: {list(kwargs.keys())[0]}={list(kwargs.values())[0]}"
+                    f"When open_mode is OpenMode.load_by_sav_name, constructor is `def __init__(self, open_mode: OpenMode, sav_name: str, *, lazy: bool = False) -> None`, but an unexpected keyword argument is gotten: {list(kwargs.keys())[0]}={list(kwargs.values())[0]}"
                 )
             elif len(kwargs) != 0:
                 raise TypeError(
-                    f"When open_mode is OpenMode.load_by_sav_name, constructor is `def __init__(self, open_mode: OpenMode, sav_name: str) -> None`, but unexpected keyword arguments are gotten: {''.join(str(key) + '=' + str(value) + ' ' for key, value in kwargs.items())}"
+                    f"When open_mode is OpenMode.load_by_sav_name, constructor is `def __init__(self, open_mode: OpenMode, sav_name: str, *, lazy: bool = False) -> None`, but unexpected keyword arguments are gotten: {''.join(str(key) + '=' + str(value) + ' ' for key, value in kwargs.items())}"
                 )
 
             if len(args) != 1:
                 raise TypeError(
-                    f"When open_mode is OpenMode.load_by_sav_name, constructor is `def __init__(self, open_mode: OpenMode, sav_name: str) -> None`, but got {len(args)} positional arguments"
+                    f"When open_mode is OpenMode.load_by_sav_name, constructor is `def __init__(self, open_mode: OpenMode, sav_name: str, *, lazy: bool = False) -> None`, but got {len(args)} positional arguments"
                 )
             sav_name = args[0]
             if not isinstance(sav_name, str):
@@ -334,14 +507,20 @@ class Experiment(_Experiment):
                     os.remove(path.replace(".sav", ".jpg"))
 
             self.experiment_type = experiment_type
-            self.SAV_PATH = os.path.join(
-                _Experiment.SAV_PATH_DIR, f"{_tools.randString(34)}.sav"
-            )
+            # 文件名不使用seed_identifiers设置的种子, 以免覆盖其他存档
+            while True:
+                self.SAV_PATH = os.path.join(
+                    _Experiment.SAV_PATH_DIR,
+                    f"{_tools.randStrings(1, 34, seeded=False)[0]}.sav",
+                )
+                if not os.path.exists(self.SAV_PATH):
+                    break
 
             if self.experiment_type == ExperimentType.Circuit:
                 self._is_elementXYZ: bool = False
                 self.PlSav: dict = copy.deepcopy(savTemplate.Circuit)
                 self.Wires: set = set()  # Set[Wire] # 存档对应的导线
+                self._wires_index = {}
                 # 存档对应的StatusSave, 存放实验元件，导线（如果是电学实验的话）
                 self.CameraSave: dict = {
                     "Mode": 0,
@@ -383,8 +562,9 @@ class Experiment(_Experiment):
 
         assert isinstance(self.open_mode, OpenMode)
         assert isinstance(self._position2elements, dict)
+        assert isinstance(self._element2position, dict)
         assert isinstance(self._id2element, dict)
-        assert isinstance(self.Elements, list)
+        assert isinstance(self.Elements, _ElementList)
         assert isinstance(self.SAV_PATH, str)
         assert isinstance(self.PlSav, dict)
         assert isinstance(self.CameraSave, dict)
@@ -393,6 +573,7 @@ class Experiment(_Experiment):
         assert isinstance(self.experiment_type, ExperimentType)
         if self.experiment_type == ExperimentType.Circuit:
             assert isinstance(self.Wires, set)
+            assert isinstance(self._wires_index, dict)
             assert isinstance(self._is_elementXYZ, bool)
             assert isinstance(self._elementXYZ_origin_position, _tools.position)
 
@@ -403,26 +584,128 @@ class Experiment(_Experiment):
             or self.open_mode == OpenMode.load_by_filepath
             or self.open_mode == OpenMode.load_by_plar_app
         ):
-            status_sav = json.loads(self.PlSav["Experiment"]["StatusSave"])
+            status_sav = _json_codec.loads(self.PlSav["Experiment"]["StatusSave"])
 
+            _wires: Optional[list] = None
             if self.experiment_type == ExperimentType.Circuit:
-                self.__load_elements(status_sav["Elements"])
-                self.__load_wires(status_sav["Wires"])
+                _elements = status_sav["Elements"]
+                _wires = status_sav["Wires"]
             elif self.experiment_type == ExperimentType.Celestial:
-                self.__load_elements(list(status_sav["Elements"].values()))
+                _elements = list(status_sav["Elements"].values())
             elif self.experiment_type == ExperimentType.Electromagnetism:
-                self.__load_elements(status_sav["Elements"])
+                _elements = status_sav["Elements"]
             else:
                 errors.unreachable()
 
+            if lazy:
+                self.__defer_load(_elements, _wires)
+            else:
+                self.__load_elements(_elements)
+                if _wires is not None:
+                    self.__load_wires(_wires)
+
+    def __defer_load(self, _elements: list, _wires: Optional[list]) -> None:
+        """以lazy模式打开存档: 只保存存档中元件与导线的数据, 并移除元件与导线的索引,
+        在第一次访问这些索引时 (见`__getattr__`) 才导入全部元件或导线
+        """
+        self._lazy_elements = _elements
+        # 已通过get_element_from_identifier创建的元件, 键为元件在存档中的index
+        self._lazy_built: Dict[int, circuit.CircuitBase] = {}
+        self._lazy_id2index: Optional[Dict[str, int]] = None
+        for name in _LAZY_ELEMENT_ATTRS:
+            delattr(self, name)
+        if _wires is not None:
+            self._lazy_wires = _wires
+            for name in _LAZY_WIRE_ATTRS:
+                delattr(self, name)
+
+    if not TYPE_CHECKING:
+        # 仅在运行时定义, 以免类型检查器忽略对不存在的属性的访问
+        def __getattr__(self, name: str) -> Any:
+            # 只有实例中不存在该属性时才会被调用, 因此不影响完全导入后的开销
+            if name in _LAZY_ELEMENT_ATTRS and self._lazy_elements is not None:
+                self.__load_lazy_elements()
+                return getattr(self, name)
+            if name in _LAZY_WIRE_ATTRS and self._lazy_wires is not None:
+                self.__load_lazy_wires()
+                return getattr(self, name)
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+
+    def __load_lazy_elements(self) -> None:
+        """导入以lazy模式打开的存档中的全部元件
+        已通过`get_element_from_identifier`创建的元件会被直接加入实验
+        """
+        _elements = self._lazy_elements
+        assert _elements is not None
+        built = self._lazy_built
+        self._lazy_elements = None
+        self._lazy_built = {}
+        self._lazy_id2index = None
+
+        self._position2elements = {}
+        self._element2position = {}
+        self._id2element = {}
+        self.Elements = _ElementList()
+        if self.experiment_type == ExperimentType.Circuit:
+            self._register_elements(
+                [
+                    built[i] if i in built else self.__crt_loaded_element(element)
+                    for i, element in enumerate(_elements)
+                ]
+            )
+        else:
+            self.__load_elements(_elements)
+
+    def __load_lazy_wires(self) -> None:
+        """导入以lazy模式打开的存档中的全部导线"""
+        _wires = self._lazy_wires
+        assert _wires is not None
+        self._lazy_wires = None
+
+        self.Wires = set()
+        self._wires_index = {}
+        if self._lazy_elements is not None:
+            self.__load_lazy_elements()
+        self.__load_wires(_wires)
+
+    @_check_not_closed
+    def get_element_from_identifier(self, identifier: str) -> ElementBase:
+        """通过元件的id获取元件的引用
+        以lazy模式打开的电学实验只会创建该元件, 而不会导入其他元件
+        """
+        if self._lazy_elements is None or self.experiment_type != ExperimentType.Circuit:
+            return super().get_element_from_identifier(identifier)
+
+        if self._lazy_id2index is None:
+            self._lazy_id2index = {
+                element["Identifier"]: i for i, element in enumerate(self._lazy_elements)
+            }
+        index = self._lazy_id2index.get(identifier)
+        if index is None:
+            raise errors.ElementNotFound
+        res = self._lazy_built.get(index)
+        if res is None:
+            res = self.__crt_loaded_element(self._lazy_elements[index])
+            self._lazy_built[index] = res
+        return res
+
+    @_check_not_closed
+    def get_elements_count(self) -> int:
+        """该实验的元件的数量"""
+        if self._lazy_elements is not None:
+            return len(self._lazy_elements)
+        return super().get_elements_count()
+
     def __load(self) -> None:
         assert isinstance(self.PlSav["Experiment"]["CameraSave"], str)
         self.CameraSave = json.loads(self.PlSav["Experiment"]["CameraSave"])
-        temp = eval(f"({self.CameraSave['VisionCenter']})")
+        temp = _tools.parse_vector(self.CameraSave["VisionCenter"])
         self.VisionCenter: _tools.position = _tools.position(
             temp[0], temp[2], temp[1]
         )  # x, z, y
-        temp = eval(f"({self.CameraSave['TargetRotation']})")
+        temp = _tools.parse_vector(self.CameraSave["TargetRotation"])
         self.TargetRotation: _tools.position = _tools.position(
             temp[0], temp[2], temp[1]
         )  # x, z, y
@@ -435,6 +718,7 @@ class Experiment(_Experiment):
             # 是否将该实验在全局范围中设置为元件坐标系
             self._is_elementXYZ: bool = False
             self.Wires: set = set()  # Set[Wire] # 存档对应的导线
+            self._wires_index = {}
         elif self.PlSav["Experiment"]["Type"] == ExperimentType.Celestial.value:
             self.experiment_type = ExperimentType.Celestial
         elif self.PlSav["Experiment"]["Type"] == ExperimentType.Electromagnetism.value:
@@ -446,88 +730,83 @@ class Experiment(_Experiment):
         assert self.experiment_type == ExperimentType.Circuit
 
         for wire_dict in _wires:
-            if wire_dict["ColorName"][0] == "蓝":
-                color = WireColor.blue
-            elif wire_dict["ColorName"][0] == "红":
-                color = WireColor.red
-            elif wire_dict["ColorName"][0] == "绿":
-                color = WireColor.green
-            elif wire_dict["ColorName"][0] == "黄":
-                color = WireColor.yellow
-            elif wire_dict["ColorName"][0] == "黑":
-                color = WireColor.black
-            else:
+            color = _WIRE_COLORS.get(wire_dict["ColorName"][0])
+            if color is None:
                 errors.unreachable()
 
-            crt_wire(
-                Pin(
-                    self.get_element_from_identifier(wire_dict["Source"]),
-                    wire_dict["SourcePin"],
-                ),
-                Pin(
-                    self.get_element_from_identifier(wire_dict["Target"]),
-                    wire_dict["TargetPin"],
-                ),
-                color=color,
+            self._link_wire(
+                Wire(
+                    Pin(
+                        self.get_element_from_identifier(wire_dict["Source"]),
+                        wire_dict["SourcePin"],
+                    ),
+                    Pin(
+                        self.get_element_from_identifier(wire_dict["Target"]),
+                        wire_dict["TargetPin"],
+                    ),
+                    color,
+                )
+            )
+
+    def __crt_loaded_element(self, element: dict) -> circuit.CircuitBase:
+        """根据存档中的数据创建电学元件, 但不将其加入实验"""
+        # Unity 采用左手坐标系
+        x, z, y = _tools.parse_vector(element["Position"])
+        cls = _get_element_class(self.experiment_type, element["ModelID"])
+
+        # 存档中的数据是可信的, 因此绕过元件构造时的参数检查
+        if cls is circuit.Simple_Instrument:
+            pitches = []
+            for attr, val in element["Properties"].items():
+                if attr.startswith("音高"):
+                    pitches.append(int(val))
+
+            obj = cls._construct_loaded(
+                self,
+                x,
+                y,
+                z,
+                element["Identifier"],
+                {
+                    "pitches": pitches,
+                    "instrument": int(element["Properties"].get("乐器", 0)),
+                    "volume": element["Properties"]["音量"],
+                    "rated_oltage": element["Properties"]["额定电压"],
+                    "is_ideal": bool(element["Properties"]["理想模式"]),
+                    "is_pulse": bool(element["Properties"]["脉冲"]),
+                },
             )
+        else:
+            obj = cls._construct_loaded(self, x, y, z, element["Identifier"], {})
+            obj._set_data_field("Properties", element["Properties"])
+        # 设置角度信息
+        r_x, r_z, r_y = _tools.parse_vector(element["Rotation"])
+        obj.set_rotation(r_x, r_y, r_z)
+        return obj
 
     def __load_elements(self, _elements: list) -> None:
         assert isinstance(_elements, list)
 
-        for element in _elements:
-            # Unity 采用左手坐标系
-            x, z, y = eval(f"({element['Position']})")
-
-            # 实例化对象
-            if self.experiment_type == ExperimentType.Circuit:
-                if element["ModelID"] == "Simple Instrument":
-                    from .circuit.elements.otherCircuit import Simple_Instrument
-
-                    pitches = []
-                    for attr, val in element["Properties"].items():
-                        if attr.startswith("音高"):
-                            pitches.append(int(val))
-
-                    obj = Simple_Instrument(
-                        x,
-                        y,
-                        z,
-                        pitches=pitches,
-                        identifier=element["Identifier"],
-                        elementXYZ=False,
-                        instrument=int(element["Properties"].get("乐器", 0)),
-                        volume=element["Properties"]["音量"],
-                        rated_oltage=element["Properties"]["额定电压"],
-                        is_ideal=bool(element["Properties"]["理想模式"]),
-                        is_pulse=bool(element["Properties"]["脉冲"]),
-                    )
-                else:
-                    obj = self.crt_element(
-                        element["ModelID"],
-                        x,
-                        y,
-                        z,
-                        elementXYZ=False,
-                        identifier=element["Identifier"],
-                    )
-                    obj.data["Properties"] = element["Properties"]
-                # 设置角度信息
-                rotation = eval(f'({element["Rotation"]})')
-                r_x, r_y, r_z = rotation[0], rotation[2], rotation[1]
-                obj.set_rotation(r_x, r_y, r_z)
-
-            elif self.experiment_type == ExperimentType.Celestial:
-                obj = self.crt_element(
-                    element["Model"], x, y, z, identifier=element["Identifier"]
+        if self.experiment_type == ExperimentType.Circuit:
+            self._register_elements(
+                [self.__crt_loaded_element(element) for element in _elements]
+            )
+        elif self.experiment_type == ExperimentType.Celestial:
+            for element in _elements:
+                x, z, y = _tools.parse_vector(element["Position"])
+                obj = _get_element_class(self.experiment_type, element["Model"])(
+                    x, y, z, identifier=element["Identifier"], experiment=self
                 )
                 obj.data = element
-            elif self.experiment_type == ExperimentType.Electromagnetism:
-                obj = self.crt_element(
-                    element["ModelID"], x, y, z, identifier=element["Identifier"]
+        elif self.experiment_type == ExperimentType.Electromagnetism:
+            for element in _elements:
+                x, z, y = _tools.parse_vector(element["Position"])
+                obj = _get_element_class(self.experiment_type, element["ModelID"])(
+                    x, y, z, identifier=element["Identifier"], experiment=self
                 )
                 obj.data = element
-            else:
-                errors.unreachable()
+        else:
+            errors.unreachable()
 
     @_check_not_closed
     def crt_element(
@@ -557,21 +836,63 @@ class Experiment(_Experiment):
                 f"Parameter 'z' must be of type `int | float`, but got value `{z}` of type `{type(z).__name__}`"
             )
 
-        name = name.strip().replace(" ", "_").replace("-", "_")
         x, y, z = _tools.round_data(x), _tools.round_data(y), _tools.round_data(z)
 
+        return _get_element_class(self.experiment_type, name)(x, y, z, **kwargs)
+
+    @_check_not_closed
+    def crt_elements_bulk(
+        self,
+        cls: Union[str, type],
+        positions: Iterable[Tuple[num_type, num_type, num_type]],
+        /,
+        *,
+        elementXYZ: Optional[bool] = None,
+        **common_props,
+    ) -> List[ElementBase]:
+        """批量创建同一种元件, 结果与逐个创建元件一致, 但参数只会被检查一次
+
+        Args:
+            cls: 元件的类, 或元件的ModelID或类名
+            positions: 每个元件的坐标 (x, y, z)
+            elementXYZ: 是否使用元件坐标系 (仅电学实验)
+            common_props: 所有元件共用的构造参数 (e.g. output_status=True)
+        """
+        if isinstance(cls, str):
+            cls = _get_element_class(self.experiment_type, cls)
+        if not isinstance(cls, type) or cls not in _ELEMENT_CLASSES[
+            self.experiment_type
+        ].values():
+            raise TypeError(
+                f"Parameter cls must be an element class of {self.experiment_type}, but got value `{cls}`"
+            )
+        if not isinstance(elementXYZ, (bool, type(None))):
+            raise TypeError(
+                f"Parameter elementXYZ must be of type `Optional[bool]`, but got value {elementXYZ} of type `{type(elementXYZ).__name__}`"
+            )
+        if "identifier" in common_props or "experiment" in common_props:
+            raise TypeError(
+                "crt_elements_bulk() does not accept `identifier` or `experiment`"
+            )
+
+        _positions: List[Tuple[num_type, num_type, num_type]] = []
+        for position in positions:
+            if len(position) != 3 or not all(
+                isinstance(num, (int, float)) for num in position
+            ):
+                raise TypeError(
+                    f"Parameter positions must be an iterable of `(int | float, int | float, int | float)`, but got value `{position}`"
+                )
+            x, y, z = position
+            _positions.append(
+                (_tools.round_data(x), _tools.round_data(y), _tools.round_data(z))
+            )
+
         if self.experiment_type == ExperimentType.Circuit:
-            if name == "555_Timer":
-                return circuit.NE555(x, y, z, **kwargs)
-            elif name == "8bit_Input":
-                return circuit.Eight_Bit_Input(x, y, z, **kwargs)
-            elif name == "8bit_Display":
-                return circuit.Eight_Bit_Display(x, y, z, **kwargs)
-            else:
-                return eval(f"circuit.{name}({x}, {y}, {z}, **{kwargs})")
-        elif self.experiment_type == ExperimentType.Celestial:
-            return eval(f"celestial.{name}({x}, {y}, {z}, **{kwargs})")
-        elif self.experiment_type == ExperimentType.Electromagnetism:
-            return eval(f"electromagnetism.{name}({x}, {y}, {z}, **{kwargs})")
-        else:
-            errors.unreachable()
+            return cls._construct_bulk(self, _positions, elementXYZ, common_props)
+
+        if elementXYZ is not None:
+            raise errors.ExperimentTypeError(
+                "elementXYZ is only supported in circuit experiment"
+            )
+        return [cls(x, y, z, experiment=self, **common_props) for x, y, z in _positions]
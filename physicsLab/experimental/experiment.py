@@ -46,7 +46,10 @@ class CircuitExperiment(_Experiment):
             TargetRotation,
             ExperimentType.Circuit,
         )
-        self.Wires = wires
+        self.Wires = set()
+        self._wires_index = {}
+        for a_wire in wires:
+            self._link_wire(a_wire)
         self._is_elementXYZ = is_elementXYZ
         self._elementXYZ_origin_position = elementXYZ_origin_position
 
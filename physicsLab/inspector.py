@@ -0,0 +1,304 @@
+# -*- coding: utf-8 -*-
+"""只读地批量分析存档
+不会创建Experiment, 元件与导线也不会被创建, 只提供存档中的数据的轻量的视图,
+适用于统计大量存档中的元件, 导线与元件属性
+
+    from physicsLab import inspector
+
+    counts = inspector.count_model_ids(inspector.iter_savs("/path/of/savs"))
+"""
+import os
+import mmap
+import collections
+
+from physicsLab import errors
+from physicsLab import _tools
+from physicsLab import _warn
+from physicsLab import _json_codec
+from .enums import ExperimentType, WireColor
+from .element import _open_sav, _WIRE_COLORS
+from ._typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+
+class ElementRecord:
+    """存档中一个元件的只读视图"""
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: dict) -> None:
+        self._data = data
+
+    @property
+    def data(self) -> dict:
+        """元件在存档中对应的dict, 不应修改其内容"""
+        return self._data
+
+    @property
+    def model_id(self) -> str:
+        """元件的类型 (天体物理实验为Model)"""
+        res = self._data.get("ModelID")
+        if res is None:
+            res = self._data["Model"]
+        return res
+
+    @property
+    def identifier(self) -> str:
+        return self._data["Identifier"]
+
+    @property
+    def properties(self) -> dict:
+        return self._data.get("Properties", {})
+
+    @property
+    def position(self) -> _tools.position:
+        """元件在物实坐标系中的坐标"""
+        # Unity 采用左手坐标系
+        x, z, y = _tools.parse_vector(self._data["Position"])
+        return _tools.position(x, y, z)
+
+    def __repr__(self) -> str:
+        return f"ElementRecord({self.model_id!r}, {self.identifier!r})"
+
+
+class WireRecord:
+    """存档中一根导线的只读视图"""
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: dict) -> None:
+        self._data = data
+
+    @property
+    def data(self) -> dict:
+        """导线在存档中对应的dict, 不应修改其内容"""
+        return self._data
+
+    @property
+    def source(self) -> str:
+        """导线起点所在元件的Identifier"""
+        return self._data["Source"]
+
+    @property
+    def source_pin(self) -> int:
+        return self._data["SourcePin"]
+
+    @property
+    def target(self) -> str:
+        """导线终点所在元件的Identifier"""
+        return self._data["Target"]
+
+    @property
+    def target_pin(self) -> int:
+        return self._data["TargetPin"]
+
+    @property
+    def color(self) -> WireColor:
+        res = _WIRE_COLORS.get(self._data["ColorName"][0])
+        if res is None:
+            raise errors.InvalidSavError
+        return res
+
+    def __repr__(self) -> str:
+        return (
+            f"WireRecord({self.source!r}, {self.source_pin}, "
+            f"{self.target!r}, {self.target_pin})"
+        )
+
+
+class SavRecord:
+    """一个存档的只读视图, StatusSave在第一次访问元件或导线时才被解码"""
+
+    __slots__ = (
+        "path",
+        "internal_name",
+        "summary",
+        "experiment_type",
+        "_status_save_str",
+        "_status_save",
+    )
+
+    def __init__(self, path: str, sav: dict) -> None:
+        self.path: str = path
+        if "Experiment" in sav:
+            experiment = sav["Experiment"]
+            internal_name = sav.get("InternalName")
+            summary = sav.get("Summary")
+        else:  # 物实导出的存档只含有.sav的Experiment部分
+            experiment = sav
+            internal_name = None
+            summary = None
+        if not isinstance(experiment, dict) or not isinstance(
+            experiment.get("StatusSave"), str
+        ):
+            raise errors.InvalidSavError
+
+        self.internal_name: Optional[str] = (
+            internal_name if isinstance(internal_name, str) else None
+        )
+        self.summary: Optional[dict] = summary
+        try:
+            self.experiment_type: ExperimentType = ExperimentType(experiment["Type"])
+        except (KeyError, ValueError):
+            raise errors.InvalidSavError
+        self._status_save_str: Optional[str] = experiment["StatusSave"]
+        self._status_save: Optional[dict] = None
+
+    @property
+    def status_save(self) -> dict:
+        """StatusSave解码后的dict, 不应修改其内容"""
+        if self._status_save is None:
+            assert self._status_save_str is not None
+            self._status_save = _json_codec.loads(self._status_save_str)
+            self._status_save_str = None
+        return self._status_save
+
+    def _raw_elements(self) -> List[dict]:
+        elements = self.status_save.get("Elements") or []
+        if isinstance(elements, dict):
+            # 天体物理实验的Elements为 Identifier -> 元件
+            return list(elements.values())
+        return elements
+
+    @property
+    def elements(self) -> Iterator[ElementRecord]:
+        """遍历存档中的元件"""
+        return map(ElementRecord, self._raw_elements())
+
+    @property
+    def wires(self) -> Iterator[WireRecord]:
+        """遍历存档中的导线, 只有电学实验有导线"""
+        return map(WireRecord, self.status_save.get("Wires") or [])
+
+    @property
+    def elements_count(self) -> int:
+        return len(self._raw_elements())
+
+    @property
+    def wires_count(self) -> int:
+        return len(self.status_save.get("Wires") or [])
+
+    def count_model_ids(self) -> Dict[str, int]:
+        """统计每种元件的数量"""
+        return count_model_ids((self,))
+
+    def __repr__(self) -> str:
+        return f"SavRecord({self.path!r}, {self.experiment_type})"
+
+
+def _read_sav_dict(path: str) -> dict:
+    """读取存档对应的dict, 优先通过mmap直接解码文件的内容
+    使用orjson时不会复制整个文件, 详见_json_codec.loads_buffer
+    """
+    try:
+        with open(path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                res = _json_codec.loads_buffer(buf)
+    except (ValueError, OSError, UnicodeDecodeError):
+        # 空文件或无法被mmap的文件, 以及非utf-8编码或含有换行符的存档, 交由_open_sav处理
+        res = None
+    if not isinstance(res, dict):
+        res = _open_sav(path)
+    if not isinstance(res, dict):
+        raise errors.InvalidSavError
+    return res
+
+
+def read_sav(path: Union[str, os.PathLike]) -> SavRecord:
+    """以只读的方式读取存档, 不会创建Experiment
+
+    Args:
+        path: 存档的路径
+    """
+    if not isinstance(path, (str, os.PathLike)):
+        raise TypeError(
+            f"Parameter path must be of type `str | os.PathLike`, but got value {path} of type `{type(path).__name__}`"
+        )
+    path = os.path.abspath(path)
+    if not os.path.isfile(path):
+        raise FileNotFoundError(f'"{path}" not found')
+
+    return SavRecord(path, _read_sav_dict(path))
+
+
+def iter_savs(
+    directory: Union[str, os.PathLike], recursive: bool = False, skip_invalid: bool = True
+) -> Iterator[SavRecord]:
+    """按文件名的顺序读取目录下的所有.sav存档
+
+    Args:
+        directory: 存档所在的目录
+        recursive: 是否读取子目录中的存档
+        skip_invalid: 是否跳过无法读取的存档 (会发出警告), 否则抛出异常
+    """
+    if not isinstance(directory, (str, os.PathLike)):
+        raise TypeError(
+            f"Parameter directory must be of type `str | os.PathLike`, but got value {directory} of type `{type(directory).__name__}`"
+        )
+    if not isinstance(recursive, bool):
+        raise TypeError(
+            f"Parameter recursive must be of type `bool`, but got value {recursive} of type `{type(recursive).__name__}`"
+        )
+    if not isinstance(skip_invalid, bool):
+        raise TypeError(
+            f"Parameter skip_invalid must be of type `bool`, but got value {skip_invalid} of type `{type(skip_invalid).__name__}`"
+        )
+
+    paths: List[str] = []
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        paths.extend(
+            os.path.join(root, filename)
+            for filename in sorted(files)
+            if filename.endswith(".sav")
+        )
+        if not recursive:
+            break
+
+    for path in paths:
+        try:
+            # StatusSave在这里被解码, 以便跳过其无法被解码的存档
+            res = read_sav(path)
+            res.status_save
+        except (errors.InvalidSavError, ValueError) as e:
+            if not skip_invalid:
+                raise
+            _warn.warning(f"skip invalid sav {path}: {type(e).__name__}")
+            continue
+        yield res
+
+
+def count_model_ids(savs: Iterable[SavRecord]) -> Dict[str, int]:
+    """统计所有存档中每种元件的数量"""
+    res: collections.Counter = collections.Counter()
+    for a_sav in savs:
+        res.update(a_element.model_id for a_element in a_sav.elements)
+    return dict(res)
+
+
+def property_histogram(
+    savs: Iterable[SavRecord], name: str, model_id: Optional[str] = None
+) -> Dict[Any, int]:
+    """统计所有存档中元件的某个属性的每种取值的数量
+
+    Args:
+        name: 属性名 (Properties中的键)
+        model_id: 只统计该类型的元件, 为None时统计所有含有该属性的元件
+    """
+    if not isinstance(name, str):
+        raise TypeError(
+            f"Parameter name must be of type `str`, but got value {name} of type `{type(name).__name__}`"
+        )
+    if not isinstance(model_id, (str, type(None))):
+        raise TypeError(
+            f"Parameter model_id must be of type `Optional[str]`, but got value {model_id} of type `{type(model_id).__name__}`"
+        )
+
+    res: collections.Counter = collections.Counter()
+    for a_sav in savs:
+        for a_element in a_sav.elements:
+            if model_id is not None and a_element.model_id != model_id:
+                continue
+            properties = a_element.properties
+            if name in properties:
+                res[properties[name]] += 1
+    return dict(res)
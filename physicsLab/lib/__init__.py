@@ -1,3 +1,4 @@
 # -*- coding: utf-8 -*-
 from .logic_circuit import *
 from .analog_circuit import *
+from .template import *
@@ -3,8 +3,9 @@ from typing import Union, Callable, Tuple
 
 from physicsLab import _warn
 from physicsLab import errors
-from physicsLab.enums import WireColor
-from physicsLab.circuit._circuit_core import crt_wire, del_wire, Pin
+from physicsLab.enums import ExperimentType, WireColor
+from physicsLab._core import get_current_experiment
+from physicsLab.circuit._circuit_core import del_wire, Pin, Wire
 from physicsLab._typing import overload
 
 
@@ -81,8 +82,15 @@ def crt_wires(
     assert isinstance(source_pin, UnitPin) and isinstance(
         target_pin, UnitPin
     ), errors.BUG_REPORT
-    for i, o in zip(source_pin.pins, target_pin.pins):
-        crt_wire(i, o, color=color)
+    # 与逐个调用crt_wire的检查一致 (不使用crt_wires_bulk更严格的检查), 但导线一次性加入实验
+    wires = [Wire(i, o, color) for i, o in zip(source_pin.pins, target_pin.pins)]
+    if len(wires) == 0:
+        return
+
+    _expe = get_current_experiment()
+    if _expe.experiment_type != ExperimentType.Circuit:
+        raise errors.ExperimentTypeError
+    _expe._link_wires(wires)
 
 
 @_check_union_pin_type
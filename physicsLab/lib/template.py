@@ -0,0 +1,342 @@
+# -*- coding: utf-8 -*-
+"""电路模板: 录制一次子电路, 之后在不同的位置多次放置
+放置时复制录制下来的元件与导线, 不再经过元件的构造函数
+"""
+from .logic_circuit.wires import UnitPin
+from physicsLab import errors
+from physicsLab._core import _Experiment, get_current_experiment
+from physicsLab.circuit._circuit_core import CircuitBase, Pin, Wire, _Properties
+from physicsLab.enums import ExperimentType, WireColor
+from physicsLab._typing import (
+    num_type,
+    Optional,
+    Union,
+    Self,
+    List,
+    Dict,
+    Tuple,
+    Iterable,
+)
+
+# 预先编码元件时Identifier与Position的占位符, 只包含无需转义的字符
+_IDENTIFIER_PLACEHOLDER = "__physicsLab_template_identifier__"
+_POSITION_PLACEHOLDER = "__physicsLab_template_position__"
+
+
+class TemplateInstance:
+    """放置模板得到的子电路"""
+
+    def __init__(
+        self, elements: List[CircuitBase], pins: Dict[str, Union[Pin, UnitPin]]
+    ) -> None:
+        # 按录制时的顺序排列的元件
+        self.elements: List[CircuitBase] = elements
+        self._pins = pins
+
+    def __getitem__(self, name: str) -> Union[Pin, UnitPin]:
+        """获取模板中名为name的引脚"""
+        if not isinstance(name, str):
+            raise TypeError(
+                f"Parameter name must be of type `str`, but got value {name} of type `{type(name).__name__}`"
+            )
+        res = self._pins.get(name)
+        if res is None:
+            raise KeyError(f"template has no pin named {name!r}")
+        return res
+
+
+class CircuitTemplate:
+    """电路模板
+
+    在with语句中创建的元件与它们之间的导线会被录制下来:
+
+        with CircuitTemplate() as template:
+            register = Register(0, 0, 0, bitnum=8, elementXYZ=True)
+            template.expose("clk", register.clk)
+            template.expose("inputs", register.inputs)
+        instances = template.place_many([(2 * i, 0, 0) for i in range(100)])
+        crt_wires(instances[0]["inputs"], ...)
+
+    录制的是退出with语句时元件的状态, 之后修改这些元件不会影响模板
+    """
+
+    def __init__(self) -> None:
+        self._experiment: Optional[_Experiment] = None
+        self._start: int = 0
+        self._is_recorded: bool = False
+        # 录制时的元件 -> 其在模板中的index
+        self._index_of: Dict[CircuitBase, int] = {}
+        # 以下均在录制结束时生成
+        self._prototypes: List[CircuitBase] = []
+        # 元件在物实坐标系与元件坐标系下的坐标
+        self._native_positions: List[Tuple[num_type, num_type, num_type]] = []
+        self._elementXYZ_positions: List[Tuple[num_type, num_type, num_type]] = []
+        # (源元件的index, 源引脚的label, 目标元件的index, 目标引脚的label, 颜色)
+        self._wires: List[Tuple[int, int, int, int, WireColor]] = []
+        # 引脚名 -> (是否为UnitPin, 每个引脚的 (元件的index, 引脚的label))
+        self._pins: Dict[str, Tuple[bool, Tuple[Tuple[int, int], ...]]] = {}
+        self._pending_pins: Dict[str, Union[Pin, UnitPin]] = {}
+        # 元件在存档中的json, Identifier与Position为占位符, 只有紧凑存储的元件才有
+        self._fragments: List[Optional[str]] = []
+
+    @classmethod
+    def from_elements(
+        cls,
+        elements: Iterable[CircuitBase],
+        pins: Optional[Dict[str, Union[Pin, UnitPin]]] = None,
+    ) -> "CircuitTemplate":
+        """由已经存在的元件生成模板, 只有两端都在elements中的导线会被录制
+
+        Args:
+            elements: 同一个电学实验中的元件
+            pins: 引脚名 -> 模板对外暴露的引脚
+        """
+        elements = list(elements)
+        for a_element in elements:
+            if not isinstance(a_element, CircuitBase):
+                raise TypeError(
+                    f"Parameter elements must be an iterable of `CircuitBase`, but got value {a_element} of type `{type(a_element).__name__}`"
+                )
+        if not isinstance(pins, (dict, type(None))):
+            raise TypeError(
+                f"Parameter pins must be of type `Optional[dict]`, but got value {pins} of type `{type(pins).__name__}`"
+            )
+        if len(elements) == 0:
+            raise ValueError("can not create a template without elements")
+        experiment = elements[0].experiment
+        if any(a_element.experiment is not experiment for a_element in elements):
+            raise errors.ExperimentError("elements are not in the same experiment")
+
+        res = cls()
+        res._experiment = experiment
+        res._record(elements)
+        if pins is not None:
+            for name, a_pin in pins.items():
+                res.expose(name, a_pin)
+        return res
+
+    def __enter__(self) -> Self:
+        if self._experiment is not None:
+            raise errors.ExperimentError("template has already been recorded")
+        self._experiment = get_current_experiment()
+        if self._experiment.experiment_type != ExperimentType.Circuit:
+            raise errors.ExperimentTypeError
+        self._start = len(self._experiment.Elements)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_type is not None:
+            return
+        assert self._experiment is not None, errors.BUG_REPORT
+
+        elements = self._experiment.Elements[self._start :]
+        if len(elements) == 0:
+            raise ValueError("can not create a template without elements")
+        self._record(elements)
+        pending_pins, self._pending_pins = self._pending_pins, {}
+        for name, a_pin in pending_pins.items():
+            self.expose(name, a_pin)
+
+    def _record(self, elements: List[CircuitBase]) -> None:
+        experiment = self._experiment
+        assert experiment is not None, errors.BUG_REPORT
+
+        self._index_of = {a_element: i for i, a_element in enumerate(elements)}
+        # 复制一份元件, 使之后对原元件的修改不影响模板
+        self._prototypes = [
+            a_element._clone(experiment, a_element._identifier) for a_element in elements
+        ]
+        self._native_positions = experiment._positions_in(elements, False)
+        self._elementXYZ_positions = experiment._positions_in(elements, True)
+
+        wires: set = set()
+        for a_element in elements:
+            for pin2wires in experiment._wires_index.get(a_element._identifier, {}).values():
+                wires.update(pin2wires)
+        self._wires = [
+            (
+                self._index_of[a_wire.Source.element_self],
+                a_wire.Source._pin_label,
+                self._index_of[a_wire.Target.element_self],
+                a_wire.Target._pin_label,
+                a_wire.color,
+            )
+            for a_wire in wires
+            if a_wire.Source.element_self in self._index_of
+            and a_wire.Target.element_self in self._index_of
+        ]
+
+        self._fragments = []
+        for a_prototype in self._prototypes:
+            fragment: Optional[str] = None
+            if a_prototype._data is None:
+                identifier = a_prototype._compact_identifier
+                position = a_prototype._compact_position
+                a_prototype._compact_identifier = _IDENTIFIER_PLACEHOLDER
+                a_prototype._compact_position = _POSITION_PLACEHOLDER
+                fragment = a_prototype._dump_json(False)
+                a_prototype._compact_identifier = identifier
+                a_prototype._compact_position = position
+                a_prototype._json_cache = None
+                if (
+                    fragment.count(_IDENTIFIER_PLACEHOLDER) != 1
+                    or fragment.count(_POSITION_PLACEHOLDER) != 1
+                ):
+                    fragment = None
+            self._fragments.append(fragment)
+        self._is_recorded = True
+
+    def expose(self, name: str, pin: Union[Pin, UnitPin]) -> Self:
+        """将模板中的引脚以name暴露出来, 放置模板后可以通过 instance[name] 获取对应的引脚
+
+        Args:
+            name: 引脚名
+            pin: 模板中的元件的引脚
+        """
+        if not isinstance(name, str):
+            raise TypeError(
+                f"Parameter name must be of type `str`, but got value {name} of type `{type(name).__name__}`"
+            )
+        if not isinstance(pin, (Pin, UnitPin)):
+            raise TypeError(
+                f"Parameter pin must be of type `Pin | UnitPin`, but got value {pin} of type `{type(pin).__name__}`"
+            )
+        if not self._is_recorded:
+            if self._experiment is None:
+                raise errors.ExperimentError("template has not been recorded")
+            self._pending_pins[name] = pin
+            return self
+
+        pins = (pin,) if isinstance(pin, Pin) else pin.pins
+        labels: List[Tuple[int, int]] = []
+        for a_pin in pins:
+            index = self._index_of.get(a_pin.element_self)
+            if index is None:
+                raise errors.ElementNotFound(f"{a_pin.element_self} is not in the template")
+            labels.append((index, a_pin._pin_label))
+        self._pins[name] = (isinstance(pin, UnitPin), tuple(labels))
+        return self
+
+    def get_elements_count(self) -> int:
+        """模板中元件的数量"""
+        return len(self._prototypes)
+
+    def get_wires_count(self) -> int:
+        """模板中导线的数量"""
+        return len(self._wires)
+
+    def place(
+        self,
+        x: num_type,
+        y: num_type,
+        z: num_type,
+        /,
+        *,
+        elementXYZ: Optional[bool] = None,
+    ) -> TemplateInstance:
+        """在当前实验中放置模板, 录制时的坐标原点被放置在(x, y, z)
+
+        Args:
+            x, y, z: 放置的位置
+            elementXYZ: 是否使用元件坐标系, None时跟随Experiment的设置
+        """
+        return self.place_many([(x, y, z)], elementXYZ=elementXYZ)[0]
+
+    def place_many(
+        self,
+        origins: Iterable[Tuple[num_type, num_type, num_type]],
+        *,
+        elementXYZ: Optional[bool] = None,
+    ) -> List[TemplateInstance]:
+        """在当前实验中多次放置模板, 所有元件与导线一次性加入实验
+
+        Args:
+            origins: 每次放置的位置
+            elementXYZ: 是否使用元件坐标系, None时跟随Experiment的设置
+        """
+        if not self._is_recorded:
+            raise errors.ExperimentError("template has not been recorded")
+        if not isinstance(elementXYZ, (bool, type(None))):
+            raise TypeError(
+                f"Parameter elementXYZ must be of type `Optional[bool]`, but got value {elementXYZ} of type `{type(elementXYZ).__name__}`"
+            )
+        origins = list(origins)
+        for origin in origins:
+            if (
+                not isinstance(origin, (tuple, list))
+                or len(origin) != 3
+                or not all(isinstance(num, (int, float)) for num in origin)
+            ):
+                raise TypeError(
+                    f"Parameter origins must be an iterable of `(int | float, int | float, int | float)`, but got value {origin}"
+                )
+
+        _expe = get_current_experiment()
+        if _expe.experiment_type != ExperimentType.Circuit:
+            raise errors.ExperimentTypeError
+
+        is_elementXYZ: bool = (
+            elementXYZ is True or _expe.is_elementXYZ is True and elementXYZ is None
+        )
+        relative_positions = (
+            self._elementXYZ_positions if is_elementXYZ else self._native_positions
+        )
+        identifiers = _expe._new_identifiers(len(self._prototypes) * len(origins))
+
+        all_elements: List[CircuitBase] = []
+        positions: List[Tuple[num_type, num_type, num_type]] = []
+        for i, (o_x, o_y, o_z) in enumerate(origins):
+            start = i * len(self._prototypes)
+            all_elements.extend(
+                a_prototype._clone(_expe, identifier)
+                for a_prototype, identifier in zip(
+                    self._prototypes, identifiers[start : start + len(self._prototypes)]
+                )
+            )
+            positions.extend(
+                (e_x + o_x, e_y + o_y, e_z + o_z) for e_x, e_y, e_z in relative_positions
+            )
+        _expe._place_elements(all_elements, positions, elementXYZ)
+        self._fill_json_cache(all_elements)
+        _expe._register_elements(all_elements)
+
+        res: List[TemplateInstance] = []
+        wires: List[Wire] = []
+        count = len(self._prototypes)
+        for i in range(len(origins)):
+            elements = all_elements[i * count : (i + 1) * count]
+            label2pin: List[Dict[int, Pin]] = [
+                {a_pin._pin_label: a_pin for _, a_pin in a_element.all_pins()}
+                for a_element in elements
+            ]
+            wires.extend(
+                Wire._construct(
+                    label2pin[source_index][source_label],
+                    label2pin[target_index][target_label],
+                    color,
+                )
+                for source_index, source_label, target_index, target_label, color in self._wires
+            )
+            pins: Dict[str, Union[Pin, UnitPin]] = {}
+            instance = TemplateInstance(elements, pins)
+            for name, (is_unit_pin, labels) in self._pins.items():
+                a_pins = [label2pin[index][label] for index, label in labels]
+                pins[name] = UnitPin(instance, *a_pins) if is_unit_pin else a_pins[0]
+            res.append(instance)
+        _expe._link_wires(wires)
+
+        return res
+
+    def _fill_json_cache(self, elements: List[CircuitBase]) -> None:
+        """由预先编码的json生成元件写入存档的json, 省去保存时对元件的编码"""
+        count = len(self._prototypes)
+        for i, a_element in enumerate(elements):
+            fragment = self._fragments[i % count]
+            if fragment is None or a_element._data is not None:
+                continue
+            a_element._json_cache = fragment.replace(
+                _IDENTIFIER_PLACEHOLDER, a_element._compact_identifier, 1
+            ).replace(_POSITION_PLACEHOLDER, a_element._compact_position, 1)
+            a_element._json_cache_compact = False
+            properties: _Properties = a_element._compact_properties
+            properties._modified = False
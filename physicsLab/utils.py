@@ -1,8 +1,25 @@
 # -*- coding: utf-8 -*-
 from datetime import datetime
 
+from physicsLab import _tools
+from ._typing import Optional
+
 
 def id_to_time(id: str) -> datetime:
     """从 用户id/实验id 中获取其对应的时间"""
     seconds = int(id[0:8], 16)
     return datetime.fromtimestamp(seconds)
+
+
+def seed_identifiers(seed: Optional[int] = None) -> None:
+    """设置生成元件的Identifier的随机数种子, 使相同的代码生成相同的存档
+
+    Args:
+        seed: 随机数种子, 为None时恢复使用os.urandom
+    """
+    if not isinstance(seed, (int, type(None))):
+        raise TypeError(
+            f"Parameter seed must be of type `Optional[int]`, but got value {seed} of type `{type(seed).__name__}`"
+        )
+
+    _tools.seed_rand_strings(seed)
@@ -20,6 +20,11 @@ setuptools.setup(
     url="https://github.com/GoodenoughPhysicsLab/physicsLab",
     packages=setuptools.find_packages(include=["physicsLab", "physicsLab.*"]),
     install_requires=["typing-extensions", "requests"],
+    extras_require={
+        # 可选的json后端, 用于加速读写存档
+        "orjson": ["orjson"],
+        "ujson": ["ujson"],
+    },
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
@@ -981,3 +981,16 @@ class TestCircuitElement(unittest.TestCase):
             for cls in self.get_all_elements(CircuitBase):
                 test_method_name = f"test_{cls.__name__.lower()}"
                 self.assertIn(test_method_name, tested_elements, f"{cls.__name__} has not been tested")
+
+    def test_pin_names(self):
+        with Experiment(OpenMode.crt, "__test_pin_names__", ExperimentType.Circuit, force_crt=True) as expe:
+            for cls in self.get_all_elements(CircuitBase):
+                kwargs = {"pitches": [60]} if cls is Simple_Instrument else {}
+                a, b = cls(0, 0, 0, **kwargs), cls(1, 0, 0, **kwargs)
+                # 同类元件共享同一个引脚名的表
+                self.assertIs(a.pin_names(), b.pin_names())
+                self.assertEqual(len(a.pin_names()), a.count_all_pins())
+                for name, pin in b.all_pins():
+                    self.assertEqual(pin.get_pin_name(), name[1:-4])
+                    self.assertIs(getattr(b, name), pin)
+            expe.close(delete=True)
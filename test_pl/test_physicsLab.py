@@ -2,7 +2,9 @@
 import os
 import sys
 import pathlib
+import tempfile
 import warnings
+import asyncio
 import threading
 from .base import *
 from physicsLab.lib import *
@@ -20,6 +22,10 @@ def my_test_dec(method: Callable):
             raise TestFail
     return result
 
+def _batch_task(expe: Experiment) -> int:
+    # 供test_map_saves在子进程中调用, 需要定义在模块顶层才能被pickle
+    return expe.get_elements_count()
+
 class BasicTest(TestCase, ViztracerTool):
     @my_test_dec
     def test_experiment_stack(self):
@@ -153,6 +159,531 @@ class BasicTest(TestCase, ViztracerTool):
             self.assertEqual(exp2.get_elements_count(), 1)
             exp2.close(delete=True)
 
+    @my_test_dec
+    def test_search_experiment_index(self):
+        from physicsLab.element import _load_sav_index
+
+        with Experiment(OpenMode.crt, "__test___sav_index__", ExperimentType.Circuit, force_crt=True) as expe:
+            expe.save(no_print_info=True)
+            filename, _ = search_experiment("__test___sav_index__")
+            self.assertEqual(filename, os.path.basename(expe.SAV_PATH))
+            self.assertEqual(_load_sav_index()[filename]["InternalName"], "__test___sav_index__")
+
+            expe.entitle("__test___sav_index_2__")
+            expe.save(no_print_info=True)
+            self.assertEqual(search_experiment("__test___sav_index__"), (None, None))
+            filename, sav = search_experiment("__test___sav_index_2__")
+            self.assertEqual(filename, os.path.basename(expe.SAV_PATH))
+            self.assertEqual(sav["InternalName"], "__test___sav_index_2__")
+            expe.close(delete=True)
+
+        search_experiment("__test___sav_index_2__")
+        self.assertNotIn(filename, _load_sav_index())
+
+    @my_test_dec
+    def test_read_sav_header(self):
+        from physicsLab import _sav_reader
+        from physicsLab.element import _open_sav
+
+        chunk_size = _sav_reader._CHUNK_SIZE
+        try:
+            for _sav_reader._CHUNK_SIZE in (7, chunk_size):
+                for filename in os.listdir(TEST_DATA_DIR):
+                    if not filename.endswith(".sav") or filename == "invalid.sav":
+                        continue
+                    sav_path = os.path.join(TEST_DATA_DIR, filename)
+                    sav = _open_sav(sav_path)
+                    experiment = sav.get("Experiment", sav)
+                    self.assertEqual(_sav_reader.read_sav_header(sav_path), {
+                        "InternalName": sav.get("InternalName"),
+                        "Summary": sav.get("Summary"),
+                        "Type": experiment["Type"],
+                    })
+        finally:
+            _sav_reader._CHUNK_SIZE = chunk_size
+
+        try:
+            _sav_reader.read_sav_header(os.path.join(TEST_DATA_DIR, "invalid.sav"))
+        except InvalidSavError:
+            pass
+        else:
+            raise TestFail
+
+    @my_test_dec
+    def test_save_compact(self):
+        with Experiment(OpenMode.load_by_filepath, os.path.join(TEST_DATA_DIR, "All-Circuit-Elements.sav")) as expe:
+            expe.save(target_path=os.devnull, compact=True)
+            compact_path = os.path.join(TEST_DIR, "__test___save_compact__.sav")
+            expe.save(target_path=compact_path, no_print_info=True, compact=True)
+            elements_count, wires_count = expe.get_elements_count(), expe.get_wires_count()
+            expe.close()
+
+        self.assertFalse(os.path.exists(f"{compact_path}.tmp"))
+        with open(compact_path, encoding="utf-8") as f:
+            self.assertNotIn("\n", f.read())
+        with Experiment(OpenMode.load_by_filepath, compact_path) as expe:
+            self.assertEqual(expe.get_elements_count(), elements_count)
+            self.assertEqual(expe.get_wires_count(), wires_count)
+            expe.close(delete=True)
+
+    def test_json_codec(self):
+        import io
+        import json
+        from physicsLab import _json_codec, _sav_writer
+        from physicsLab.element import _open_sav
+
+        values = [
+            1.0, -0.0, 0.1, 1e-05, 1e-07, 0.0001, 1e15, 1e16, 1e22, 5e-324, 2**64 - 1, 2**64,
+            -2**63 - 1, 12345678901234567890123, [0.5, -98765432109876543210],
+            "量程", "a\x1fb\n\x7f \U0001f600\"\\/", {"k": [None, True, 3.000000106112566e-06]},
+        ]
+        savs = []
+        for filename in sorted(os.listdir(TEST_DATA_DIR)):
+            if filename.endswith(".sav") and filename != "invalid.sav":
+                with open(os.path.join(TEST_DATA_DIR, filename), encoding="utf-8") as f:
+                    savs.append(f.read().replace("\n", ""))
+
+        def dump_savs():
+            res = []
+            for sav in savs:
+                pl_sav = _json_codec.loads(sav)
+                experiment = pl_sav.get("Experiment", pl_sav)
+                status_save = _json_codec.loads(experiment["StatusSave"])
+                self.assertEqual(pl_sav, json.loads(sav))
+                self.assertEqual(status_save, json.loads(experiment["StatusSave"]))
+                f = io.StringIO()
+                _sav_writer.dump_sav(f, pl_sav, status_save)
+                res.append(f.getvalue())
+            return res
+
+        try:
+            _json_codec.set_backend("json")
+            expected = dump_savs()
+            for backend in (*_json_codec.BACKENDS, None):
+                try:
+                    _json_codec.set_backend(backend)
+                except ImportError:
+                    continue
+                for value in values:
+                    for ensure_ascii in (True, False):
+                        self.assertEqual(
+                            _json_codec.dumps(value, ensure_ascii),
+                            json.dumps(value, ensure_ascii=ensure_ascii, separators=(",", ":")),
+                        )
+                    for res in (
+                        _json_codec.loads(json.dumps(value)),
+                        _json_codec.loads_buffer(json.dumps(value).encode("utf-8")),
+                    ):
+                        self.assertEqual(res, value)
+                        self.assertIs(type(res), type(value))
+                        if isinstance(value, list):
+                            self.assertEqual([type(i) for i in res], [type(i) for i in value])
+                # 超出64位的整数跨过_json_codec检查时分块的边界
+                value = ["a" * (_json_codec._SCAN_CHUNK_SIZE - 12), 12345678901234567890123]
+                self.assertEqual(_json_codec.loads(json.dumps(value)), value)
+                self.assertEqual(_json_codec.loads_buffer(json.dumps(value).encode("utf-8")), value)
+                self.assertEqual(dump_savs(), expected)
+        finally:
+            _json_codec.set_backend()
+
+        self.assertRaises(ValueError, _json_codec.set_backend, "simplejson")
+        self.assertRaises(json.JSONDecodeError, _json_codec.loads, "{")
+
+    @my_test_dec
+    def test_crt_elements_bulk(self):
+        positions = [(0, 0, 0), (1, 0.5, 0), (-1.25, 3, 0.1), (1, 0.5, 0)]
+        with Experiment(OpenMode.crt, "__test___crt_elements_bulk__", ExperimentType.Circuit, force_crt=True) as expe:
+            for cls, kwargs in ((Logic_Input, {"output_status": True}), (Full_Adder, {})):
+                for elementXYZ in (True, False):
+                    a = [cls(*position, elementXYZ=elementXYZ, **kwargs) for position in positions]
+                    b = expe.crt_elements_bulk(cls, positions, elementXYZ=elementXYZ, **kwargs)
+                    for element_a, element_b in zip(a, b):
+                        self.assertNotEqual(element_a.data["Identifier"], element_b.data["Identifier"])
+                        self.assertEqual(
+                            {**element_a.data, "Identifier": None}, {**element_b.data, "Identifier": None}
+                        )
+                        self.assertEqual(element_a.get_position(), element_b.get_position())
+                        self.assertEqual(element_a.is_elementXYZ, element_b.is_elementXYZ)
+                        self.assertEqual(element_b.get_index(), element_a.get_index() + len(positions))
+                        self.assertIs(expe.get_element_from_identifier(element_b.data["Identifier"]), element_b)
+            self.assertEqual(len(expe.get_element_from_position(1, 0.5, 0)), 16)
+            self.assertEqual(len(expe.crt_elements_bulk("Logic Output", [])), 0)
+            self.assertRaises(TypeError, expe.crt_elements_bulk, Logic_Input, [(0, 0)])
+            self.assertRaises(TypeError, expe.crt_elements_bulk, Logic_Input, [(0, 0, 0)], identifier="a")
+            self.assertRaises(TypeError, expe.crt_elements_bulk, Earth, [(0, 0, 0)])
+            expe.close(delete=True)
+
+    @my_test_dec
+    def test_crt_wires_bulk(self):
+        with Experiment(OpenMode.crt, "__test___crt_wires_bulk__", ExperimentType.Circuit, force_crt=True) as expe:
+            a, b, c = Or_Gate(0, 0, 0), Or_Gate(1, 0, 0), Or_Gate(2, 0, 0)
+            wires = crt_wires_bulk([(a.o, b.i_up), (b.i_up, a.o), (b.o, c.i_up)], WireColor.red)
+            self.assertEqual(len(wires), 2)
+            self.assertEqual(expe.get_wires_count(), 2)
+            self.assertEqual(wires[0].color, WireColor.red)
+            self.assertEqual(b.i_up.get_wires(), [wires[0]])
+
+            wires = crt_wires_bulk([
+                (a.get_index(), a.o._pin_label, c.get_index(), c.i_low._pin_label),
+                (b.get_index(), b.o._pin_label, c.get_index(), c.i_up._pin_label),
+            ])
+            self.assertEqual(len(wires), 1)
+            self.assertEqual(wires[0].Target, c.i_low)
+            self.assertEqual(len(c.get_wires()), 2)
+            self.assertEqual(crt_wires_bulk([]), [])
+
+            self.assertRaises(InvalidWireError, crt_wires_bulk, [(a.o, a.o)])
+            self.assertRaises(InvalidWireError, crt_wires_bulk, [(1, 100, 2, 0)])
+            self.assertRaises(ElementNotFound, crt_wires_bulk, [(1, 0, 4, 0)])
+            self.assertRaises(TypeError, crt_wires_bulk, [(a.o,)])
+            self.assertEqual(expe.get_wires_count(), 3)
+            expe.close(delete=True)
+
+    @my_test_dec
+    def test_compact_element_data(self):
+        with Experiment(OpenMode.crt, "__test___compact_element_data__", ExperimentType.Circuit, force_crt=True) as expe:
+            a, b = Nand_Gate(0, 0, 0), Nand_Gate(1, 0, 0)
+            crt_wire(a.o, b.i_up)
+            self.assertIsNone(a._data)
+            self.assertIsNone(b._data)
+            b.set_rotation(0, 0, 90)
+            b.properties["锁定"] = 0.0
+            self.assertIsNone(b._data)
+            self.assertIs(expe.get_element_from_identifier(a._identifier), a)
+
+            data = b.data
+            self.assertIs(b.data, data)
+            self.assertEqual(data["Identifier"], b._identifier)
+            self.assertEqual(data["Rotation"], "0,90,0")
+            self.assertEqual(data["Properties"]["锁定"], 0.0)
+            self.assertIs(data["Properties"], b.properties)
+            # 修改已生成的data不会影响同类的其他元件
+            data["Statistics"]["电流"] = 1
+            self.assertEqual(Nand_Gate(2, 0, 0).data["Statistics"], {})
+
+            expe.save(target_path=os.devnull, no_print_info=True)
+            # 保存时不会生成并保留data
+            self.assertIsNone(a._data)
+            status_save = json.loads(expe.PlSav["Experiment"]["StatusSave"])
+            self.assertEqual(status_save["Elements"][1], b.data)
+            self.assertEqual(status_save["Elements"][0], a.data)
+            self.assertEqual(a.data["Statistics"], {})
+
+            # |= 与dict一致 (python3.8的dict没有__ior__), 并记录修改
+            c = Nand_Gate(3, 0, 0)
+            properties = c.properties
+            properties._modified = False
+            properties |= {"锁定": 0.0}
+            self.assertIs(c.properties, properties)
+            self.assertTrue(properties._modified)
+            self.assertEqual(properties["锁定"], 0.0)
+            with self.assertRaises(TypeError):
+                properties |= 1
+            expe.close(delete=True)
+
+    @my_test_dec
+    def test_translate_elements(self):
+        with Experiment(OpenMode.crt, "__test___translate_elements__", ExperimentType.Circuit, force_crt=True) as expe:
+            a = Nand_Gate(0, 0, 0, elementXYZ=True)
+            b = Full_Adder(1, 0, 0, elementXYZ=True)
+            c = Resistor(0.5, 0, 0)
+
+            expe.translate_elements(1, 2, 0, elements=[a, b], elementXYZ=True)
+            self.assertEqual(a.get_position(), (1, 2, 0))
+            self.assertEqual(b.get_position(), (2, 2, 0))
+            self.assertEqual(b.data["Position"], Full_Adder(2, 2, 0, elementXYZ=True).data["Position"])
+            self.assertEqual(expe.get_element_from_position(1, 2, 0), [a])
+            self.assertEqual(c.get_position(), (0.5, 0, 0))
+
+            expe.translate_elements(0, 0, 0)
+            self.assertFalse(a.is_elementXYZ)
+            # 紧凑存储的元件的Position在被读取时才生成
+            self.assertIsNotNone(a._pending_position)
+            self.assertEqual(a.data["Position"], Nand_Gate(*a.get_position()).data["Position"])
+            self.assertEqual(expe.get_element_from_position(0.5, 0, 0), [c])
+
+            with Experiment(OpenMode.crt, "__test___translate_elements_2__", ExperimentType.Circuit, force_crt=True) as other:
+                d = Or_Gate(0, 0, 0)
+                self.assertRaises(ExperimentError, expe.translate_elements, 1, 0, 0, [d])
+                other.close(delete=True)
+            self.assertRaises(TypeError, expe.translate_elements, "1", 0, 0)
+            expe.close(delete=True)
+
+    @my_test_dec
+    def test_set_elements_rotation(self):
+        with Experiment(OpenMode.crt, "__test___set_elements_rotation__", ExperimentType.Circuit, force_crt=True) as expe:
+            a, b, c = Nand_Gate(0, 0, 0), Full_Adder(1, 0, 0), Resistor(2, 0, 0)
+            expected = Full_Adder(3, 0, 0).set_rotation(90, 0, 45.0000001)
+            expe.set_elements_rotation(90, 0, 45.0000001, elements=[a, b])
+            self.assertEqual(a.data["Rotation"], expected.data["Rotation"])
+            self.assertEqual(b.data["Rotation"], expected.data["Rotation"])
+            self.assertEqual(c.data["Rotation"], Resistor(0, 0, 0).data["Rotation"])
+            self.assertEqual(expe.get_element_from_position(1, 0, 0), [b])
+
+            expe.set_elements_rotation(0, 0, 0)
+            self.assertTrue(all(e.data["Rotation"] == "0,0,0" for e in expe.Elements))
+
+            with Experiment(OpenMode.crt, "__test___set_elements_rotation_2__", ExperimentType.Circuit, force_crt=True) as other:
+                d = Or_Gate(0, 0, 0)
+                self.assertRaises(ExperimentError, expe.set_elements_rotation, 0, 0, 0, [d])
+                other.close(delete=True)
+            self.assertRaises(TypeError, expe.set_elements_rotation, "1", 0, 0)
+            expe.close(delete=True)
+
+        with Experiment(OpenMode.crt, "__test___set_elements_rotation_3__", ExperimentType.Electromagnetism, force_crt=True) as expe:
+            a = Bar_Magnet(0, 0, 0)
+            expe.set_elements_rotation(0, 0, 90)
+            self.assertEqual(a.data["Rotation"], Bar_Magnet(1, 0, 0).set_rotation(0, 0, 90).data["Rotation"])
+            expe.close(delete=True)
+
+    @my_test_dec
+    def test_experiment_closed_state(self):
+        expe1 = Experiment(OpenMode.crt, "__test___closed_state_1__", ExperimentType.Circuit, force_crt=True)
+        expe2 = Experiment(OpenMode.crt, "__test___closed_state_2__", ExperimentType.Circuit, force_crt=True)
+        self.assertTrue(_ExperimentStack.inside(expe1))
+        expe1.close(delete=True)
+        self.assertFalse(_ExperimentStack.inside(expe1))
+        self.assertRaises(ExperimentClosedError, expe1.get_elements_count)
+        self.assertRaises(ExperimentClosedError, lambda: expe1.is_elementXYZ)
+        self.assertEqual(expe2.get_elements_count(), 0)
+        expe1.ensure_close()
+
+        expe2.close(delete=True)
+        self.assertRaises(ExperimentClosedError, expe2.close)
+        expe2.ensure_close()
+
+    @my_test_dec
+    def test_seed_identifiers(self):
+        try:
+            seed_identifiers(1)
+            with Experiment(OpenMode.crt, "__test___seed_identifiers__", ExperimentType.Circuit, force_crt=True) as expe:
+                identifiers = [Logic_Input(0, 0, 0)._identifier] + [
+                    a_element._identifier for a_element in expe.crt_elements_bulk(Logic_Output, [(1, 0, 0), (2, 0, 0)])
+                ]
+                self.assertEqual(len(identifiers[0]), 33)
+                # 与已有元件重复的Identifier会被重新生成
+                seed_identifiers(1)
+                self.assertNotEqual(Logic_Input(3, 0, 0)._identifier, identifiers[0])
+                seed_identifiers(1)
+                self.assertNotIn(expe.crt_elements_bulk(Logic_Input, [(4, 0, 0)])[0]._identifier, identifiers)
+                expe.close(delete=True)
+
+            seed_identifiers(1)
+            with Experiment(OpenMode.crt, "__test___seed_identifiers__", ExperimentType.Circuit, force_crt=True) as expe:
+                self.assertEqual(Logic_Input(0, 0, 0)._identifier, identifiers[0])
+                self.assertEqual(
+                    [a_element._identifier for a_element in expe.crt_elements_bulk(Logic_Output, [(1, 0, 0), (2, 0, 0)])],
+                    identifiers[1:],
+                )
+                expe.close(delete=True)
+        finally:
+            seed_identifiers()
+        self.assertRaises(TypeError, seed_identifiers, "1")
+
+    @my_test_dec
+    def test_spatial_query(self):
+        with Experiment(OpenMode.crt, "__test___spatial_query__", ExperimentType.Circuit, force_crt=True) as expe:
+            a, b, c = Logic_Input(0, 0, 0), Logic_Input(1, 0, 0), Logic_Input(3, 4, 0)
+            self.assertEqual(expe.query_box(0, 0, 0, 1, 1, 0), [a, b])
+            self.assertEqual(expe.query_box(3, 4, 0, -1, -1, 0), [a, b, c])
+            self.assertEqual(expe.query_radius(0, 0, 0, 5), [a, b, c])
+            self.assertEqual(expe.query_radius(0, 0, 0, 4.9), [a, b])
+            self.assertEqual(expe.nearest(2, 0, 0), [b])
+            self.assertEqual(expe.nearest(0.5, 0, 0, 2), [a, b])
+            self.assertEqual(expe.nearest(0, 0, 0, 10), [a, b, c])
+            self.assertEqual(expe.find_overlaps(), [])
+
+            # 索引随元件的移动, 删除与创建更新
+            c.set_position(1, 0, 0)
+            d = Logic_Output(0, 0, 0)
+            self.assertEqual(expe.find_overlaps(), [[a, d], [b, c]])
+            self.assertEqual(expe.find_overlaps(tolerance=1), [[a, b, c, d]])
+            expe.del_element(a)
+            self.assertEqual(expe.query_box(0, 0, 0, 0, 0, 0), [d])
+            self.assertEqual(expe.nearest(3, 4, 0), [b])
+
+            self.assertRaises(TypeError, expe.query_radius, 0, 0, 0, "1")
+            self.assertRaises(ValueError, expe.query_radius, 0, 0, 0, -1)
+            self.assertRaises(ValueError, expe.find_overlaps, -1)
+            expe.close(delete=True)
+
+    @my_test_dec
+    def test_find_overlaps_large_tolerance(self):
+        with Experiment(OpenMode.crt, "__test___find_overlaps_large_tolerance__", ExperimentType.Circuit, force_crt=True) as expe:
+            # 元件很密集时格子的边长远小于tolerance
+            elements = expe.crt_elements_bulk(Logic_Input, [(i * 0.01, 0, 0) for i in range(200)])
+            self.assertEqual(expe.find_overlaps(5), [elements])
+            self.assertLess(expe._get_spatial_grid().cell_size, 0.1)
+            far = Logic_Input(20, 0, 0)
+            self.assertEqual(expe.find_overlaps(18.01), [[*elements, far]])
+            self.assertEqual(expe.find_overlaps(0.005), [])
+            expe.close(delete=True)
+
+    @my_test_dec
+    def test_incremental_save(self):
+        with Experiment(OpenMode.crt, "__test___incremental_save__", ExperimentType.Circuit, force_crt=True) as expe:
+            a, b, c = Simple_Switch(0, 0, 0), Resistor(1, 0, 0), Logic_Input(2, 0, 0)
+            expe.save(target_path=os.devnull, no_print_info=True)
+            self.assertIsNotNone(a._json_cache)
+
+            a.turn_on_switch()
+            b.properties.update({"电阻": 5})
+            c.set_position(3, 0, 0)
+            self.assertIsNone(c._json_cache)
+            expe.save(target_path=os.devnull, no_print_info=True)
+            status_save = json.loads(expe.PlSav["Experiment"]["StatusSave"])
+            self.assertEqual(status_save["Elements"][0]["Properties"]["开关"], 1)
+            self.assertEqual(status_save["Elements"][1]["Properties"]["电阻"], 5)
+            self.assertEqual(status_save["Elements"][2]["Position"], c.data["Position"])
+
+            # 生成data后元件可能被任意修改, 不再使用缓存
+            c.data["Statistics"]["电流"] = 1
+            expe.save(target_path=os.devnull, no_print_info=True)
+            status_save = json.loads(expe.PlSav["Experiment"]["StatusSave"])
+            self.assertEqual(status_save["Elements"], [a.data, b.data, c.data])
+            expe.close(delete=True)
+
+    @my_test_dec
+    def test_load_lazily(self):
+        path = os.path.join(TEST_DATA_DIR, "All-Circuit-Elements.sav")
+        with Experiment(OpenMode.load_by_filepath, path) as expe:
+            expe.save(target_path=os.devnull, no_print_info=True)
+            status_save = json.loads(expe.PlSav["Experiment"]["StatusSave"])
+            expe.close()
+
+        with Experiment(OpenMode.load_by_filepath, path, lazy=True) as expe:
+            self.assertEqual(expe.get_elements_count(), 91)
+            identifier = status_save["Elements"][3]["Identifier"]
+            a = expe.get_element_from_identifier(identifier)
+            self.assertIs(expe.get_element_from_identifier(identifier), a)
+            self.assertNotIn("Elements", expe.__dict__)
+            with self.assertRaises(ElementNotFound):
+                expe.get_element_from_identifier("not exist")
+
+            # 访问元件时才导入全部元件, 访问导线时才导入全部导线
+            self.assertIs(expe.Elements[3], a)
+            self.assertNotIn("Wires", expe.__dict__)
+            self.assertEqual(expe.get_wires_count(), len(status_save["Wires"]))
+
+            expe.save(target_path=os.devnull, no_print_info=True)
+            lazy_status_save = json.loads(expe.PlSav["Experiment"]["StatusSave"])
+            self.assertEqual(lazy_status_save["Elements"], status_save["Elements"])
+            self.assertCountEqual(lazy_status_save["Wires"], status_save["Wires"])
+            expe.close()
+
+        with Experiment(OpenMode.load_by_filepath, path, lazy=True) as expe:
+            # 创建元件时会先导入存档中的元件
+            Logic_Input(0, 0, 0)
+            self.assertEqual(expe.get_elements_count(), 92)
+            self.assertEqual(expe.Elements[0]._identifier, status_save["Elements"][0]["Identifier"])
+            expe.close()
+
+    @my_test_dec
+    def test_inspector(self):
+        path = os.path.join(TEST_DATA_DIR, "All-Circuit-Elements.sav")
+        sav = inspector.read_sav(path)
+        self.assertEqual(len(_ExperimentStack.data), 0)
+        self.assertEqual(sav.experiment_type, ExperimentType.Circuit)
+        self.assertEqual(sav.elements_count, 91)
+
+        with Experiment(OpenMode.load_by_filepath, path) as expe:
+            self.assertEqual(
+                [a_element.identifier for a_element in sav.elements],
+                [a_element._identifier for a_element in expe.Elements],
+            )
+            self.assertEqual(sav.wires_count, expe.get_wires_count())
+            expe.close()
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            savs = list(inspector.iter_savs(TEST_DATA_DIR))
+        self.assertNotIn(os.path.join(TEST_DATA_DIR, "invalid.sav"), [a_sav.path for a_sav in savs])
+        with self.assertRaises(InvalidSavError):
+            list(inspector.iter_savs(TEST_DATA_DIR, skip_invalid=False))
+
+        counts = inspector.count_model_ids(savs)
+        self.assertEqual(counts["Resistor"], sum(a_sav.count_model_ids().get("Resistor", 0) for a_sav in savs))
+        self.assertEqual(
+            sum(inspector.property_histogram([sav], "电阻", model_id="Resistor").values()),
+            sav.count_model_ids()["Resistor"],
+        )
+
+    @my_test_dec
+    def test_map_saves(self):
+        paths = [
+            os.path.join(TEST_DATA_DIR, "All-Circuit-Elements.sav"),
+            os.path.join(TEST_DATA_DIR, "All-Celestial-Elements.sav"),
+            os.path.join(TEST_DATA_DIR, "invalid.sav"),
+        ]
+        with Experiment(OpenMode.load_by_filepath, paths[0]) as expe:
+            # 子进程中不会继承父进程已经打开的实验
+            results = {result.path: result for result in batch.map_saves(_batch_task, paths, workers=2)}
+            expe.close()
+
+        self.assertEqual(results[paths[0]].value, 91)
+        self.assertEqual(results[paths[1]].value, 27)
+        self.assertFalse(results[paths[2]].ok)
+        self.assertIn("InvalidSavError", results[paths[2]].error)
+        self.assertTrue(all(result.seconds >= 0 for result in results.values()))
+        with self.assertRaises(ValueError):
+            batch.map_saves(_batch_task, paths, workers=0)
+
+    @my_test_dec
+    def test_concurrent_experiments(self):
+        thread_count = 4
+        barrier = threading.Barrier(thread_count)
+        results = {}
+
+        def task(i: int):
+            try:
+                with Experiment(OpenMode.crt, f"__test__concurrent_{i}__", ExperimentType.Circuit, force_crt=True) as expe:
+                    # 等待所有线程都打开了各自的实验后再创建元件
+                    barrier.wait()
+                    for j in range(50):
+                        a = Logic_Input(j, i, 0)
+                        b = Logic_Output(j, i, 1)
+                        crt_wire(a.o, b.i)
+                    results[i] = (
+                        get_current_experiment() is expe,
+                        expe.get_elements_count(),
+                        len(expe.Wires),
+                        all(element.experiment is expe for element in expe.Elements),
+                    )
+                    expe.close(delete=True)
+            except Exception as e:
+                results[i] = e
+
+        threads = [threading.Thread(target=task, args=(i,)) for i in range(thread_count)]
+        with Experiment(OpenMode.crt, "__test__", ExperimentType.Circuit, force_crt=True) as expe:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            # 其他线程打开的实验不影响当前线程的实验
+            self.assertIs(get_current_experiment(), expe)
+            self.assertEqual(expe.get_elements_count(), 0)
+            expe.close(delete=True)
+
+        for i in range(thread_count):
+            self.assertEqual(results[i], (True, 100, 50, True))
+
+        async def a_task(i: int):
+            with Experiment(OpenMode.crt, f"__test__concurrent_{i}__", ExperimentType.Circuit, force_crt=True) as expe:
+                for j in range(10):
+                    Logic_Input(j, i, 0)
+                    await asyncio.sleep(0)
+                self.assertIs(get_current_experiment(), expe)
+                count = expe.get_elements_count()
+                expe.close(delete=True)
+            return count
+
+        async def main():
+            return await asyncio.gather(*(a_task(i) for i in range(thread_count)))
+
+        self.assertEqual(asyncio.run(main()), [10] * thread_count)
+        with self.assertRaises(ExperimentError):
+            get_current_experiment()
+
     @my_test_dec
     def test_crt_experiment(self):
         expe: Experiment = Experiment(OpenMode.crt, "__test___crt_experiment__", ExperimentType.Circuit, force_crt=True)
@@ -177,6 +708,28 @@ class BasicTest(TestCase, ViztracerTool):
             self.assertEqual(expe.get_wires_count(), 1)
             expe.close(delete=True)
 
+    @my_test_dec
+    def test_wires_of(self):
+        with Experiment(OpenMode.crt, "__test___wires_of__", ExperimentType.Circuit, force_crt=True) as expe:
+            a = Or_Gate(0, 0, 0)
+            b = Logic_Output(0, 0, 0)
+            crt_wire(a.o, a.i_up, a.i_low)
+            crt_wire(a.o, b.i)
+            self.assertEqual(len(a.o.get_wires()), 2)
+            self.assertEqual(len(a.get_wires()), 3)
+            self.assertEqual(len(expe.wires_of(b)), 1)
+
+            del_wire(a.o, a.i_up)
+            self.assertEqual(len(a.o.get_wires()), 1)
+            self.assertEqual(len(a.i_up.get_wires()), 1)
+
+            expe.del_element(b)
+            self.assertEqual(len(a.o.get_wires()), 0)
+            self.assertEqual(expe.get_wires_count(), 1)
+            expe.clear_wires()
+            self.assertEqual(len(a.get_wires()), 0)
+            expe.close(delete=True)
+
     def test_same_crt_wire(self):
         with Experiment(OpenMode.crt, "__test___same_crt_wire__", ExperimentType.Circuit, force_crt=True) as expe:
             a = Or_Gate(0, 0, 0)
@@ -309,6 +862,40 @@ class BasicTest(TestCase, ViztracerTool):
             self.assertEqual(expe.get_elements_count(), 6)
             expe.close()
 
+    @my_test_dec
+    def test_set_position(self):
+        with Experiment(OpenMode.crt, "__test___set_position__", ExperimentType.Circuit, force_crt=True) as expe:
+            a = Logic_Input(0, 0, 0)
+            b = Logic_Output(0, 0, 0)
+            a.set_position(1, 0, 0)
+            self.assertEqual(expe.get_element_from_position(0, 0, 0), [b])
+            self.assertEqual(expe.get_element_from_position(1, 0, 0), [a])
+            b.set_position(1, 0, 0)
+            self.assertEqual(len(expe.get_element_from_position(1, 0, 0)), 2)
+            try:
+                expe.get_element_from_position(0, 0, 0)
+            except ElementNotFound:
+                pass
+            else:
+                raise TestFail
+            expe.del_element(a)
+            self.assertEqual(expe.get_element_from_position(1, 0, 0), [b])
+            expe.close(delete=True)
+
+    @my_test_dec
+    def test_get_index(self):
+        with Experiment(OpenMode.crt, "__test___get_index__", ExperimentType.Circuit, force_crt=True) as expe:
+            elements = [Logic_Input(i, 0, 0) for i in range(10)]
+            expe.del_element(elements[2])
+            expe.del_element(elements[5])
+            self.assertEqual(elements[9].get_index(), 8)
+            self.assertEqual(elements[3].get_index(), 3)
+            self.assertEqual(elements[1].get_index(), 2)
+            for i in range(1, expe.get_elements_count() + 1):
+                self.assertEqual(expe.get_element_from_index(i).get_index(), i)
+            self.assertFalse(elements[2] in expe.Elements)
+            expe.close(delete=True)
+
     # 测试模块化电路连接导线
     @my_test_dec
     def test_wires(self):
@@ -324,6 +911,20 @@ class BasicTest(TestCase, ViztracerTool):
             self.assertEqual(15, expe.get_wires_count())
             expe.close(delete=True)
 
+    @my_test_dec
+    def test_wires_other_experiment(self):
+        # crt_wires与逐个调用crt_wire一致: 引脚可以属于另一个打开的实验, 导线加入当前实验
+        with Experiment(OpenMode.crt, "__test___wires_other_1__", ExperimentType.Circuit, force_crt=True) as expe1:
+            a = lib.Inputs(0, 0, 0, bitnum=4)
+            b = lib.Outputs(1, 0, 0, bitnum=4)
+            with Experiment(OpenMode.crt, "__test___wires_other_2__", ExperimentType.Circuit, force_crt=True) as expe2:
+                crt_wires(a.outputs, b.inputs)
+                self.assertEqual(expe2.get_wires_count(), 4)
+                self.assertEqual(expe1.get_wires_count(), 0)
+                self.assertRaises(InvalidWireError, crt_wires_bulk, [(a.outputs[0], b.inputs[0])])
+                expe2.close(delete=True)
+            expe1.close(delete=True)
+
     # 测试模块化加法电路
     @my_test_dec
     def test_union_Sum2(self):
@@ -422,6 +1023,43 @@ class BasicTest(TestCase, ViztracerTool):
                 lib.Sub(-5, 0, 0, bitnum=4)
             expe.close(delete=True)
 
+    @my_test_dec
+    def test_circuit_template(self):
+        with Experiment(OpenMode.crt, "__test___circuit_template__", ExperimentType.Circuit, force_crt=True) as expe:
+            with lib.CircuitTemplate() as template:
+                register = lib.Register(0, 0, 0, bitnum=4, elementXYZ=True)
+                template.expose("clk", register.clk)
+                template.expose("inputs", register.inputs)
+            self.assertEqual(template.get_elements_count(), 4)
+            self.assertEqual(template.get_wires_count(), 3)
+            # 录制之后修改元件不影响模板
+            register[0].properties["高电平"] = 5
+
+            instances = template.place_many([(2 * i, 0, 0) for i in range(1, 4)], elementXYZ=True)
+            self.assertEqual(expe.get_elements_count(), 16)
+            self.assertEqual(expe.get_wires_count(), 12)
+            self.assertEqual(len({element._identifier for element in expe.Elements}), 16)
+            self.assertEqual(instances[1].elements[0].get_position(), (4, 0, 0))
+            self.assertEqual(instances[1].elements[0].properties["高电平"], 3)
+            self.assertIs(instances[1]["clk"].element_self, instances[1].elements[0])
+            self.assertEqual(len(instances[1]["inputs"].pins), 4)
+            self.assertEqual(len(instances[1]["clk"].get_wires()), 1)
+            crt_wires(lib.Inputs(-2, 0, 0, bitnum=4, elementXYZ=True).outputs, instances[0]["inputs"])
+            self.assertRaises(KeyError, instances[0].__getitem__, "outputs")
+
+            a = Logic_Input(0, 10, 0)
+            b = Logic_Output(1, 10, 0)
+            crt_wire(a.o, b.i)
+            crt_wire(a.o, instances[2]["clk"])
+            template2 = lib.CircuitTemplate.from_elements([a, b], pins={"o": a.o})
+            # 只录制两端都在模板中的导线
+            self.assertEqual(template2.get_wires_count(), 1)
+            instance = template2.place(0, 0, 1)
+            self.assertEqual(instance.elements[1].get_position(), (1, 10, 1))
+            self.assertIsInstance(instance["o"], Pin)
+            self.assertEqual(expe.get_wires_count(), 19)
+            expe.close(delete=True)
+
     @my_test_dec
     def test_Simple_Instrument(self):
         with Experiment(OpenMode.crt, "__test__", ExperimentType.Circuit, force_crt=True) as expe:
@@ -544,6 +1182,37 @@ class BasicTest(TestCase, ViztracerTool):
                 exp2.close(delete=True)
             expe.close(delete=True)
 
+    @my_test_dec
+    def test_merge_experiment_repeat(self):
+        with Experiment(OpenMode.crt, "__test___merge_experiment_repeat__", ExperimentType.Circuit, force_crt=True) as expe:
+            a, b = Logic_Input(0, 0, 0), Yes_Gate(1, 0, 0)
+            crt_wire(a.o, b.i)
+            b.properties["高电平"] = 5
+
+            with Experiment(OpenMode.crt, "__test___merge_experiment_repeat_sub__", ExperimentType.Circuit, force_crt=True) as exp2:
+                exp2.merge(expe, 0, 0, 0, repeat=3, spacing=(0, 2, 0))
+                exp2.merge(expe, 0, 0, 1)
+
+                self.assertEqual(exp2.get_elements_count(), 8)
+                self.assertEqual(exp2.get_wires_count(), 4)
+                # 每一份都使用新的Identifier
+                self.assertEqual(len({element._identifier for element in exp2.Elements}), 8)
+                for element in exp2.Elements:
+                    self.assertIs(exp2.get_element_from_identifier(element._identifier), element)
+                    self.assertIs(element.experiment, exp2)
+                gate = exp2.get_element_from_position(1, 4, 0)[0]
+                self.assertIsInstance(gate, Yes_Gate)
+                self.assertEqual(gate.properties["高电平"], 5)
+                self.assertEqual(gate.i.get_wires()[0].Source.element_self.get_position(), (0, 4, 0))
+                # 合并得到的元件与原实验的元件互不影响
+                gate.properties["高电平"] = 3
+                self.assertEqual(b.properties["高电平"], 5)
+                self.assertEqual(expe.get_wires_count(), 1)
+                self.assertRaises(ExperimentError, exp2.merge, exp2)
+                self.assertRaises(ValueError, exp2.merge, expe, repeat=-1)
+                exp2.close(delete=True)
+            expe.close(delete=True)
+
     @my_test_dec
     def test_crt_self_wire(self):
         with Experiment(OpenMode.crt, "__test___crt_self_wire__", ExperimentType.Circuit, force_crt=True) as expe:
@@ -580,6 +1249,24 @@ class BasicTest(TestCase, ViztracerTool):
             self.assertTrue(expe.get_elements_count() == 91)
             expe.close(delete=True)
 
+    @my_test_dec
+    def test_export_lines(self):
+        with Experiment(OpenMode.crt, "__test___export_lines__", ExperimentType.Circuit, force_crt=True) as expe:
+            a, b, c = Logic_Input(0, 0, 0), Full_Adder(1, 0, 0), Logic_Output(2, 0, 0)
+            crt_wire(a.o, b.i_up, b.i_low, color=WireColor.red)
+            crt_wire(b.o_low, c.i)
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                output_path = os.path.join(tmp_dir, "temp.pl.py")
+                expe.export(output_path, "__test___export_lines__")
+                with open(output_path, encoding="utf-8") as f:
+                    lines = f.read().splitlines()
+            for index, element in enumerate(expe.Elements, 1):
+                self.assertIn(f"e{index} = {element}", lines)
+            for wire in expe.Wires:
+                self.assertIn(str(wire), lines)
+            self.assertEqual(len(lines), 3 + 3 + 3 + 2)
+            expe.close(delete=True)
+
     @my_test_dec
     def test_type_error(self):
         with Experiment(OpenMode.crt, "__test___type_error__", ExperimentType.Circuit, force_crt=True) as expe: